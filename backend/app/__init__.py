@@ -37,12 +37,19 @@ limiter = Limiter(
 
 
 def create_app():
+    from app.utils.upload_stream import UploadRequest, uploadRequestLimit
+    from app.services.storage_utils import MAX_FILE_SIZE, MAX_IMAGE_SIZE
+
     app = Flask(__name__)
+    # Uploaded files are hashed and sniffed while the form is parsed
+    app.request_class = UploadRequest
 
     # Configuration
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # Bodies larger than the biggest allowed upload are refused (413) before being read
+    app.config['MAX_CONTENT_LENGTH'] = uploadRequestLimit(max(MAX_FILE_SIZE, MAX_IMAGE_SIZE))
 
     # Database connection pooling for better performance
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
@@ -76,8 +83,10 @@ def create_app():
     CORS(app,
          origins=corsOrigins,
          supports_credentials=True,  # CRITICAL for cookies
-         allow_headers=['Content-Type', 'Authorization', 'X-CSRF-Token'],
-         expose_headers=['Content-Type', 'Content-Disposition'])  # Content-Disposition for file downloads
+         allow_headers=['Content-Type', 'Authorization', 'X-CSRF-Token', 'Range'],
+         # Content-Disposition for file downloads; range headers for PDF.js partial loading
+         expose_headers=['Content-Type', 'Content-Disposition', 'Content-Length',
+                         'Accept-Ranges', 'Content-Range', 'ETag'])
 
     # Security headers middleware (production-ready)
     @app.after_request
@@ -127,6 +136,10 @@ def create_app():
     app.register_blueprint(about_bp, url_prefix='/api')
     app.register_blueprint(docs_bp, url_prefix='/api')
 
+    @app.errorhandler(413)
+    def requestTooLarge(error):
+        return jsonify({'success': False, 'error': 'Request body too large'}), 413
+
     # JWT error handlers
     @jwt.unauthorized_loader
     def unauthorizedCallback(callback):
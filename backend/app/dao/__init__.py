@@ -4,5 +4,8 @@ from app.dao.user_dao import UserDAO
 from app.dao.resume_pdf_dao import ResumePdfDAO
 from app.dao.contact_submission_dao import ContactSubmissionDAO
 from app.dao.about_dao import AboutDAO
+from app.dao.email_outbox_dao import EmailOutboxDAO
+from app.dao.storage_blob_dao import StorageBlobDAO
+from app.dao.storage_deletion_dao import StorageDeletionDAO
 
-__all__ = ['ProjectDAO', 'ResumeDAO', 'UserDAO', 'ResumePdfDAO', 'ContactSubmissionDAO', 'AboutDAO']
+__all__ = ['ProjectDAO', 'ResumeDAO', 'UserDAO', 'ResumePdfDAO', 'ContactSubmissionDAO', 'AboutDAO', 'EmailOutboxDAO', 'StorageBlobDAO', 'StorageDeletionDAO']
@@ -2,6 +2,7 @@
 Data Access Object for About model
 """
 from app.models import About
+from app.dao.storage_blob_dao import StorageBlobDAO
 
 
 class AboutDAO:
@@ -25,18 +26,26 @@ class AboutDAO:
             raise Exception(f"Failed to fetch about: {str(e)}")
 
     @staticmethod
-    def updateAbout(content=None, profilePhotoUrl=None):
+    def updateAbout(content=None, profilePhotoUrl=None, profilePhotoWidth=None, profilePhotoHeight=None,
+                    profilePhotoPlaceholder=None):
         """
         Update or create the about content
+        A new profile photo moves the storage reference in the same commit,
+        queueing the old photo for deletion if nothing else uses it
 
         Args:
             content (str, optional): About text content (plain text)
-            profilePhotoUrl (str, optional): URL/path to profile photo
+            profilePhotoUrl (str, optional): URL/path to profile photo (None keeps the current one)
+            profilePhotoWidth (int, optional): Intrinsic photo width in px
+            profilePhotoHeight (int, optional): Intrinsic photo height in px
+            profilePhotoPlaceholder (str, optional): Base64 data URI blur placeholder
+                (kept when the same URL is re-sent without metadata)
 
         Returns:
             About: Updated or created about object
 
         Raises:
+            ValueError: If the uploaded photo is no longer stored
             Exception: If update fails
         """
         from app import db
@@ -46,17 +55,30 @@ class AboutDAO:
             if not about:
                 about = About(
                     content=content or '',
-                    profilePhotoUrl=profilePhotoUrl
+                    profilePhotoUrl=profilePhotoUrl,
+                    profilePhotoWidth=profilePhotoWidth,
+                    profilePhotoHeight=profilePhotoHeight,
+                    profilePhotoPlaceholder=profilePhotoPlaceholder
                 )
                 db.session.add(about)
+                StorageBlobDAO.swapUrlReference(None, profilePhotoUrl)
             else:
                 if content is not None:
                     about.content = content
+                photoChanged = profilePhotoUrl is not None and profilePhotoUrl != about.profilePhotoUrl
+                if photoChanged or profilePhotoWidth is not None:
+                    about.profilePhotoWidth = profilePhotoWidth
+                    about.profilePhotoHeight = profilePhotoHeight
+                    about.profilePhotoPlaceholder = profilePhotoPlaceholder
                 if profilePhotoUrl is not None:
+                    StorageBlobDAO.swapUrlReference(about.profilePhotoUrl, profilePhotoUrl)
                     about.profilePhotoUrl = profilePhotoUrl
 
             db.session.commit()
             return about
+        except ValueError:
+            db.session.rollback()
+            raise
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to update about: {str(e)}")
@@ -74,3 +96,22 @@ class AboutDAO:
             return about.profilePhotoUrl if about else None
         except Exception:
             return None
+
+    @staticmethod
+    def getProfilePhotoUrls():
+        """
+        Profile photo URLs of every about row, for storage GC.
+        Unlike getProfilePhotoUrl() this raises on failure, so a database
+        error is never mistaken for "no photo".
+
+        Returns:
+            list[str]: Non-empty profile photo URLs
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            rows = About.query.with_entities(About.profilePhotoUrl).filter(About.profilePhotoUrl.isnot(None)).all()
+            return [row.profilePhotoUrl for row in rows if row.profilePhotoUrl]
+        except Exception as e:
+            raise Exception(f"Failed to fetch profile photo URLs: {str(e)}")
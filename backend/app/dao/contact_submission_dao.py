@@ -1,15 +1,23 @@
 """
 Data Access Object for ContactSubmission model
 """
-from app.models import ContactSubmission
+from app.models import ContactSubmission, EmailOutboxMessage
+from app.utils.response_cache import bumpCacheVersion, getCacheVersion, getCachedResponse, setCachedResponse
 from datetime import datetime
+from sqlalchemy import tuple_
+import base64
 
 
 class ContactSubmissionDAO:
     """DAO class for ContactSubmission database operations"""
 
+    # Response cache namespace for inbox counters, invalidated by every write below
+    CACHE_NAMESPACE = 'contact_submissions'
+
+    BULK_ACTIONS = ('markRead', 'markUnread', 'archive', 'unarchive')
+
     @staticmethod
-    def createSubmission(name, email, message, ipAddress=None):
+    def createSubmission(name, email, message, ipAddress=None, enqueueEmail=True):
         """
         Create a new contact submission
 
@@ -18,6 +26,8 @@ class ContactSubmissionDAO:
             email (str): Submitter email
             message (str): Message content
             ipAddress (str, optional): Client IP address
+            enqueueEmail (bool): Also queue the notification email in the
+                outbox, in the same transaction (default True)
 
         Returns:
             ContactSubmission: Created submission object
@@ -35,54 +45,172 @@ class ContactSubmissionDAO:
                 read=False
             )
             db.session.add(submission)
+            if enqueueEmail:
+                db.session.add(EmailOutboxMessage(submission=submission))
             db.session.commit()
+            bumpCacheVersion(ContactSubmissionDAO.CACHE_NAMESPACE)
             return submission
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to create contact submission: {str(e)}")
 
     @staticmethod
-    def getAllSubmissions(limit=50, offset=0, readFilter='all', includeArchived=False):
+    def getAllSubmissions(limit=50, offset=0, readFilter='all', includeArchived=False, cursor=None):
         """
-        Get submissions with pagination and filters
+        Get submissions with pagination and filters (newest first)
+
+        Pass the nextCursor of the previous page as cursor for keyset
+        pagination on (submittedAt, id); offset is only used without a cursor.
 
         Args:
             limit (int): Max results per page (default 50)
             offset (int): Pagination offset (default 0)
             readFilter (str): Filter by read status - 'all'|'read'|'unread' (default 'all')
             includeArchived (bool): Include archived submissions (default False)
+            cursor (str, optional): Opaque cursor from a previous page
 
         Returns:
-            tuple: (submissions list, total_count)
+            tuple: (submissions list, total_count, next_cursor or None)
 
         Raises:
+            ValueError: If the cursor is malformed
             Exception: If query fails
         """
+        position = ContactSubmissionDAO.decodeCursor(cursor) if cursor else None
+
         try:
-            query = ContactSubmission.query
+            query = ContactSubmissionDAO._filteredQuery(readFilter, includeArchived)
+            total = ContactSubmissionDAO._countSubmissions(query, readFilter, includeArchived)
+
+            if position:
+                query = query.filter(
+                    tuple_(ContactSubmission.submittedAt, ContactSubmission.id) < position
+                )
+
+            # Fetch one extra row to know whether another page exists
+            query = query.order_by(ContactSubmission.submittedAt.desc(), ContactSubmission.id.desc())\
+                         .limit(limit + 1)
+            if not position and offset:
+                query = query.offset(offset)
+            submissions = query.all()
+
+            nextCursor = None
+            if len(submissions) > limit:
+                submissions = submissions[:limit]
+                nextCursor = ContactSubmissionDAO.encodeCursor(submissions[-1])
+
+            return (submissions, total, nextCursor)
+        except Exception as e:
+            raise Exception(f"Failed to fetch contact submissions: {str(e)}")
 
-            # Filter by archived status
-            if not includeArchived:
-                query = query.filter(ContactSubmission.archivedAt == None)
+    @staticmethod
+    def bulkUpdate(action, submissionIds=None, readFilter='all', includeArchived=False):
+        """
+        Apply an inbox action to many submissions with a single UPDATE
 
-            # Filter by read status
-            if readFilter == 'read':
-                query = query.filter_by(read=True)
-            elif readFilter == 'unread':
-                query = query.filter_by(read=False)
+        Rows are selected either by submissionIds or, when no IDs are given,
+        by the same read/archived filters as getAllSubmissions. Rows already
+        in the target state are not touched (archived timestamps are kept).
 
-            # Get total count for pagination
-            total = query.count()
+        Args:
+            action (str): 'markRead'|'markUnread'|'archive'|'unarchive'
+            submissionIds (list, optional): Submission IDs to update
+            readFilter (str): Filter by read status when selecting by filter
+            includeArchived (bool): Include archived rows when selecting by filter
 
-            # Paginate and order (newest first)
-            submissions = query.order_by(ContactSubmission.submittedAt.desc())\
-                               .limit(limit)\
-                               .offset(offset)\
-                               .all()
+        Returns:
+            int: Number of submissions changed
 
-            return (submissions, total)
+        Raises:
+            ValueError: If the action is unknown
+            Exception: If the update fails
+        """
+        from app import db
+
+        if action not in ContactSubmissionDAO.BULK_ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+
+        try:
+            if submissionIds is not None:
+                query = ContactSubmission.query.filter(ContactSubmission.id.in_(submissionIds))
+            else:
+                query = ContactSubmissionDAO._filteredQuery(readFilter, includeArchived)
+
+            if action == 'markRead':
+                query = query.filter(ContactSubmission.read == False)
+                values = {ContactSubmission.read: True}
+            elif action == 'markUnread':
+                query = query.filter(ContactSubmission.read == True)
+                values = {ContactSubmission.read: False}
+            elif action == 'archive':
+                query = query.filter(ContactSubmission.archivedAt == None)
+                values = {ContactSubmission.archivedAt: datetime.utcnow()}
+            else:
+                query = query.filter(ContactSubmission.archivedAt != None)
+                values = {ContactSubmission.archivedAt: None}
+
+            affected = query.update(values, synchronize_session=False)
+            db.session.commit()
+            bumpCacheVersion(ContactSubmissionDAO.CACHE_NAMESPACE)
+            return affected
         except Exception as e:
-            raise Exception(f"Failed to fetch contact submissions: {str(e)}")
+            db.session.rollback()
+            raise Exception(f"Failed to apply bulk {action}: {str(e)}")
+
+    @staticmethod
+    def _filteredQuery(readFilter, includeArchived):
+        """Build the base inbox query for the archive and read filters"""
+        query = ContactSubmission.query
+
+        # Filter by archived status
+        if not includeArchived:
+            query = query.filter(ContactSubmission.archivedAt == None)
+
+        # Filter by read status
+        if readFilter == 'read':
+            query = query.filter_by(read=True)
+        elif readFilter == 'unread':
+            query = query.filter_by(read=False)
+
+        return query
+
+    @staticmethod
+    def _countSubmissions(query, readFilter, includeArchived):
+        """
+        Total for a filter combination, cached until the next inbox write
+        (bounded by RESPONSE_CACHE_TTL on other workers)
+        """
+        cacheKey = ('total', readFilter, includeArchived)
+        cacheVersion = getCacheVersion(ContactSubmissionDAO.CACHE_NAMESPACE)
+        total = getCachedResponse(ContactSubmissionDAO.CACHE_NAMESPACE, cacheKey)
+        if total is None:
+            total = query.order_by(None).count()
+            setCachedResponse(ContactSubmissionDAO.CACHE_NAMESPACE, cacheKey, total, cacheVersion)
+        return total
+
+    @staticmethod
+    def encodeCursor(submission):
+        """Encode a submission's (submittedAt, id) sort key as an opaque cursor"""
+        raw = f"{submission.submittedAt.isoformat()}|{submission.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decodeCursor(cursor):
+        """
+        Decode a cursor produced by encodeCursor
+
+        Returns:
+            tuple: (submittedAt datetime, id int)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            submittedAt, submissionId = raw.rsplit('|', 1)
+            return (datetime.fromisoformat(submittedAt), int(submissionId))
+        except Exception:
+            raise ValueError('Invalid pagination cursor')
 
     @staticmethod
     def getSubmissionById(submissionId):
@@ -126,6 +254,7 @@ class ContactSubmissionDAO:
 
             submission.read = not submission.read
             db.session.commit()
+            bumpCacheVersion(ContactSubmissionDAO.CACHE_NAMESPACE)
             return submission
         except Exception as e:
             db.session.rollback()
@@ -153,6 +282,7 @@ class ContactSubmissionDAO:
 
             submission.read = True
             db.session.commit()
+            bumpCacheVersion(ContactSubmissionDAO.CACHE_NAMESPACE)
             return submission
         except Exception as e:
             db.session.rollback()
@@ -180,6 +310,7 @@ class ContactSubmissionDAO:
 
             submission.archivedAt = datetime.utcnow()
             db.session.commit()
+            bumpCacheVersion(ContactSubmissionDAO.CACHE_NAMESPACE)
             return True
         except Exception as e:
             db.session.rollback()
@@ -207,6 +338,7 @@ class ContactSubmissionDAO:
 
             submission.archivedAt = None
             db.session.commit()
+            bumpCacheVersion(ContactSubmissionDAO.CACHE_NAMESPACE)
             return True
         except Exception as e:
             db.session.rollback()
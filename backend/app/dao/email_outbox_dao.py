@@ -0,0 +1,118 @@
+"""
+Data Access Object for EmailOutboxMessage model
+"""
+from app.models import EmailOutboxMessage
+from datetime import datetime, timedelta
+
+
+class EmailOutboxDAO:
+    """DAO class for email outbox database operations"""
+
+    MAX_ATTEMPTS = 8
+    BACKOFF_BASE_SECONDS = 30
+    BACKOFF_MAX_SECONDS = 3600
+    # How long a claimed message stays with its worker before another may retry it
+    LEASE_SECONDS = 300
+
+    @staticmethod
+    def claimDueMessages(limit=20):
+        """
+        Claim a batch of pending messages whose next attempt is due, and
+        commit the claim so no row lock is held while the emails are sent.
+        A claim counts as an attempt and leases the message for
+        LEASE_SECONDS by moving its next attempt forward; if the worker
+        dies mid-send the lease runs out and the message is retried, until
+        it has used up MAX_ATTEMPTS.
+
+        FOR UPDATE SKIP LOCKED keeps concurrent workers from claiming the
+        same row, and is only held for this short transaction. The
+        submission is joined into the same query (lazy='joined').
+
+        Args:
+            limit (int): Max messages to claim (default 20)
+
+        Returns:
+            list[dict]: id, attempt, name, email and message of each
+            claimed message (oldest first)
+
+        Raises:
+            Exception: If database update fails
+        """
+        from app import db
+        try:
+            now = datetime.utcnow()
+            messages = EmailOutboxMessage.query\
+                .filter(EmailOutboxMessage.status == EmailOutboxMessage.STATUS_PENDING)\
+                .filter(EmailOutboxMessage.nextAttemptAt <= now)\
+                .order_by(EmailOutboxMessage.id.asc())\
+                .limit(limit)\
+                .with_for_update(skip_locked=True, of=EmailOutboxMessage)\
+                .all()
+
+            claimed = []
+            for message in messages:
+                if message.attempts >= EmailOutboxDAO.MAX_ATTEMPTS:
+                    # Every attempt was claimed but never recorded (worker crashed)
+                    message.status = EmailOutboxMessage.STATUS_FAILED
+                    continue
+                message.attempts += 1
+                message.nextAttemptAt = now + timedelta(seconds=EmailOutboxDAO.LEASE_SECONDS)
+                claimed.append({
+                    'id': message.id,
+                    'attempt': message.attempts,
+                    'name': message.submission.name,
+                    'email': message.submission.email,
+                    'message': message.submission.message
+                })
+
+            db.session.commit()
+            return claimed
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to claim due outbox messages: {str(e)}")
+
+    @staticmethod
+    def recordResults(results):
+        """
+        Record delivery outcomes for a claimed batch in one short commit.
+        Failures are retried with exponential backoff until MAX_ATTEMPTS.
+
+        Args:
+            results (list): List of (message id, error str or None) tuples
+
+        Raises:
+            Exception: If database update fails
+        """
+        from app import db
+        try:
+            now = datetime.utcnow()
+            messages = {
+                message.id: message
+                for message in EmailOutboxMessage.query.filter(
+                    EmailOutboxMessage.id.in_([messageId for messageId, _ in results])
+                ).all()
+            }
+            for messageId, error in results:
+                message = messages.get(messageId)
+                if message is None or message.status != EmailOutboxMessage.STATUS_PENDING:
+                    continue
+                if error is None:
+                    message.status = EmailOutboxMessage.STATUS_SENT
+                    message.sentAt = now
+                    message.lastError = None
+                    continue
+
+                message.lastError = error
+                if message.attempts >= EmailOutboxDAO.MAX_ATTEMPTS:
+                    message.status = EmailOutboxMessage.STATUS_FAILED
+                else:
+                    delay = min(
+                        EmailOutboxDAO.BACKOFF_BASE_SECONDS * (2 ** (message.attempts - 1)),
+                        EmailOutboxDAO.BACKOFF_MAX_SECONDS
+                    )
+                    message.nextAttemptAt = now + timedelta(seconds=delay)
+
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to record outbox results: {str(e)}")
@@ -2,18 +2,32 @@
 Data Access Object for Project model
 """
 from app.models import Project
+from app.dao.storage_blob_dao import StorageBlobDAO
+from sqlalchemy import case, cast, func, true, update as sa_update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import defer
+from app.utils.response_cache import bumpCacheVersion
+
+SEARCH_HEADLINE_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2'
 
 
 class ProjectDAO:
     """DAO class for Project database operations"""
 
+    # Response cache namespace invalidated by every write below
+    CACHE_NAMESPACE = 'projects'
+
     @staticmethod
-    def getAllProjects(includeHidden=False):
+    def getAllProjects(includeHidden=False, includeContent=True, technologies=None):
         """
         Fetch all projects from database ordered by displayOrder
 
         Args:
             includeHidden (bool): If True, include hidden projects
+            includeContent (bool): If False, defer the Markdown content column
+                so it is never read from the database
+            technologies (list, optional): Only projects using all of these
+                technologies (JSONB containment, GIN-indexed)
 
         Returns:
             list: List of Project objects
@@ -23,20 +37,42 @@ class ProjectDAO:
         """
         try:
             query = Project.query
+            if not includeContent:
+                query = query.options(defer(Project.content))
             if not includeHidden:
                 query = query.filter_by(isVisible=True)
+            if technologies:
+                query = query.filter(cast(Project.technologies, JSONB).contains(list(technologies)))
             projects = query.order_by(Project.displayOrder.asc()).all()
             return projects
         except Exception as e:
             raise Exception(f"Failed to fetch projects: {str(e)}")
 
     @staticmethod
-    def getProjectById(projectId):
+    def getImageUrls():
+        """
+        Image URLs of every project (hidden ones included), for storage GC
+
+        Returns:
+            list[str]: Non-empty image URLs (one per referencing project)
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            rows = Project.query.with_entities(Project.imageUrl).filter(Project.imageUrl.isnot(None)).all()
+            return [row.imageUrl for row in rows if row.imageUrl]
+        except Exception as e:
+            raise Exception(f"Failed to fetch project image URLs: {str(e)}")
+
+    @staticmethod
+    def getProjectById(projectId, includeContent=True):
         """
         Fetch a single project by ID
 
         Args:
             projectId (int): Project ID
+            includeContent (bool): If False, defer the Markdown content column
 
         Returns:
             Project: Project object or None if not found
@@ -45,15 +81,20 @@ class ProjectDAO:
             Exception: If database query fails
         """
         try:
-            project = Project.query.get(projectId)
+            query = Project.query
+            if not includeContent:
+                query = query.options(defer(Project.content))
+            project = query.get(projectId)
             return project
         except Exception as e:
             raise Exception(f"Failed to fetch project: {str(e)}")
 
     @staticmethod
-    def createProject(title, description, technologies, githubUrl=None, liveUrl=None, imageUrl=None, content=None, docsSlug=None):
+    def createProject(title, description, technologies, githubUrl=None, liveUrl=None, imageUrl=None, content=None, docsSlug=None,
+                      imageWidth=None, imageHeight=None, imagePlaceholder=None):
         """
         Create a new project with auto-assigned displayOrder
+        The image's storage reference is taken in the same commit
 
         Args:
             title (str): Project title
@@ -63,11 +104,15 @@ class ProjectDAO:
             liveUrl (str, optional): Live demo URL
             imageUrl (str, optional): Image URL
             content (str, optional): Markdown article content
+            imageWidth (int, optional): Intrinsic image width in px
+            imageHeight (int, optional): Intrinsic image height in px
+            imagePlaceholder (str, optional): Base64 data URI blur placeholder
 
         Returns:
             Project: Created project object
 
         Raises:
+            ValueError: If the uploaded image is no longer stored
             Exception: If project creation fails
         """
         from app import db
@@ -82,14 +127,22 @@ class ProjectDAO:
                 githubUrl=githubUrl,
                 liveUrl=liveUrl,
                 imageUrl=imageUrl,
+                imageWidth=imageWidth,
+                imageHeight=imageHeight,
+                imagePlaceholder=imagePlaceholder,
                 content=content,
                 docsSlug=docsSlug,
                 displayOrder=maxOrder + 1,
                 isVisible=True  # New projects visible by default
             )
             db.session.add(project)
+            StorageBlobDAO.swapUrlReference(None, imageUrl)
             db.session.commit()
+            bumpCacheVersion(ProjectDAO.CACHE_NAMESPACE)
             return project
+        except ValueError:
+            db.session.rollback()
+            raise
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to create project: {str(e)}")
@@ -98,6 +151,8 @@ class ProjectDAO:
     def updateProject(projectId, **kwargs):
         """
         Update an existing project
+        A changed imageUrl moves the storage reference in the same commit,
+        queueing the old image for deletion if nothing else uses it
 
         Args:
             projectId (int): Project ID
@@ -107,6 +162,7 @@ class ProjectDAO:
             Project: Updated project object or None if not found
 
         Raises:
+            ValueError: If the new uploaded image is no longer stored
             Exception: If update fails
         """
         from app import db
@@ -115,12 +171,19 @@ class ProjectDAO:
             if not project:
                 return None
 
+            if 'imageUrl' in kwargs:
+                StorageBlobDAO.swapUrlReference(project.imageUrl, kwargs['imageUrl'])
+
             for key, value in kwargs.items():
                 if hasattr(project, key):
                     setattr(project, key, value)
 
             db.session.commit()
+            bumpCacheVersion(ProjectDAO.CACHE_NAMESPACE)
             return project
+        except ValueError:
+            db.session.rollback()
+            raise
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to update project: {str(e)}")
@@ -129,6 +192,7 @@ class ProjectDAO:
     def deleteProject(projectId):
         """
         Delete a project
+        Its image is queued for deletion in the same commit if nothing else uses it
 
         Args:
             projectId (int): Project ID
@@ -145,25 +209,117 @@ class ProjectDAO:
             if not project:
                 return False
 
+            StorageBlobDAO.swapUrlReference(project.imageUrl, None)
             db.session.delete(project)
             db.session.commit()
+            bumpCacheVersion(ProjectDAO.CACHE_NAMESPACE)
             return True
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to delete project: {str(e)}")
 
     @staticmethod
-    def getVisibleProjects():
+    def getVisibleProjects(includeContent=True, technologies=None):
         """
         Fetch only visible projects ordered by displayOrder
 
+        Args:
+            includeContent (bool): If False, defer the Markdown content column
+            technologies (list, optional): Only projects using all of these technologies
+
         Returns:
             list: List of visible Project objects
 
         Raises:
             Exception: If database query fails
         """
-        return ProjectDAO.getAllProjects(includeHidden=False)
+        return ProjectDAO.getAllProjects(
+            includeHidden=False,
+            includeContent=includeContent,
+            technologies=technologies
+        )
+
+    @staticmethod
+    def getTechnologyFacets(includeHidden=False, technologies=None):
+        """
+        Count projects per technology, computed in the database by unnesting
+        the technologies JSON array
+
+        Args:
+            includeHidden (bool): If True, count hidden projects too
+            technologies (list, optional): Only count projects that already use
+                all of these technologies (drill-down)
+
+        Returns:
+            list: List of (technology, count) tuples, most used first
+
+        Raises:
+            Exception: If database query fails
+        """
+        from app import db
+        try:
+            technology = func.jsonb_array_elements_text(cast(Project.technologies, JSONB))\
+                             .table_valued('value')\
+                             .alias('technology')
+
+            query = db.session.query(technology.c.value, func.count(Project.id))\
+                              .select_from(Project)\
+                              .join(technology, true())
+            if not includeHidden:
+                query = query.filter(Project.isVisible.is_(True))
+            if technologies:
+                query = query.filter(cast(Project.technologies, JSONB).contains(list(technologies)))
+
+            return query.group_by(technology.c.value)\
+                        .order_by(func.count(Project.id).desc(), technology.c.value.asc())\
+                        .all()
+        except Exception as e:
+            raise Exception(f"Failed to fetch technology facets: {str(e)}")
+
+    @staticmethod
+    def searchProjects(queryText, limit=20):
+        """
+        Full-text search over visible projects using the GIN-indexed
+        search_vector column. Ranking runs on the index match; highlighted
+        snippets are only built for the returned page of results.
+
+        Args:
+            queryText (str): Web-search style query ("flask -django", "\"exact phrase\"")
+            limit (int): Max results (default 20)
+
+        Returns:
+            list: List of (Project, rank, snippet) tuples, best match first.
+                  Projects are loaded without the Markdown content column.
+
+        Raises:
+            Exception: If database query fails
+        """
+        from app import db
+        try:
+            tsQuery = func.websearch_to_tsquery('english', queryText)
+            rank = func.ts_rank_cd(Project.searchVector, tsQuery)
+
+            ranked = db.session.query(Project.id.label('id'), rank.label('rank'))\
+                               .filter(Project.isVisible.is_(True))\
+                               .filter(Project.searchVector.op('@@')(tsQuery))\
+                               .order_by(rank.desc(), Project.displayOrder.asc())\
+                               .limit(limit)\
+                               .subquery()
+
+            snippet = func.ts_headline(
+                'english',
+                func.concat_ws(' ', Project.description, Project.content),
+                tsQuery,
+                SEARCH_HEADLINE_OPTIONS
+            )
+
+            return db.session.query(Project, ranked.c.rank, snippet)\
+                             .join(ranked, ranked.c.id == Project.id)\
+                             .options(defer(Project.content))\
+                             .order_by(ranked.c.rank.desc(), Project.displayOrder.asc())\
+                             .all()
+        except Exception as e:
+            raise Exception(f"Failed to search projects: {str(e)}")
 
     @staticmethod
     def toggleVisibility(projectId):
@@ -187,6 +343,7 @@ class ProjectDAO:
 
             project.isVisible = not project.isVisible
             db.session.commit()
+            bumpCacheVersion(ProjectDAO.CACHE_NAMESPACE)
             return project
         except Exception as e:
             db.session.rollback()
@@ -195,26 +352,44 @@ class ProjectDAO:
     @staticmethod
     def updateDisplayOrder(orderUpdates):
         """
-        Update display order for multiple projects
+        Update display order for multiple projects in a single statement
+        (UPDATE ... SET display_order = CASE id ... END WHERE id IN (...) RETURNING).
+        IDs are validated by the same statement: if any ID does not exist the
+        transaction is rolled back and nothing changes.
 
         Args:
             orderUpdates (list): List of dicts [{'id': 1, 'displayOrder': 0}, ...]
 
         Returns:
-            bool: True if successful
+            list: New ordering [{'id': 1, 'displayOrder': 0}, ...] sorted by
+                  displayOrder, or None if any project ID was not found
 
         Raises:
             Exception: If update fails
         """
         from app import db
         try:
-            for update in orderUpdates:
-                project = Project.query.get(update['id'])
-                if project:
-                    project.displayOrder = update['displayOrder']
+            newOrder = {update['id']: update['displayOrder'] for update in orderUpdates}
+
+            result = db.session.execute(
+                sa_update(Project)
+                .where(Project.id.in_(list(newOrder)))
+                .values(displayOrder=case(newOrder, value=Project.id))
+                .returning(Project.id, Project.displayOrder),
+                execution_options={'synchronize_session': False}
+            )
+            updatedRows = result.all()
+
+            if len(updatedRows) != len(newOrder):
+                db.session.rollback()
+                return None
 
             db.session.commit()
-            return True
+            bumpCacheVersion(ProjectDAO.CACHE_NAMESPACE)
+            return [
+                {'id': projectId, 'displayOrder': displayOrder}
+                for projectId, displayOrder in sorted(updatedRows, key=lambda row: (row[1], row[0]))
+            ]
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to update order: {str(e)}")
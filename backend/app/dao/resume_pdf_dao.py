@@ -1,18 +1,38 @@
 """
 Resume PDF DAO - Database access object for resume PDF operations
 """
+from sqlalchemy import tuple_
+from sqlalchemy.orm import joinedload
 from app.models.resume_pdf import ResumePdfVersion
+from app.dao.storage_blob_dao import StorageBlobDAO
 from app import db
-from datetime import datetime
+from app.utils.response_cache import bumpCacheVersion
+from datetime import datetime, timedelta
+import base64
 
 
 class ResumePdfDAO:
     """DAO class for ResumePdfVersion database operations"""
 
+    # Response cache namespace for the active version, invalidated by every write below
+    CACHE_NAMESPACE = 'resume-pdf'
+
+    # Preview generation attempts before a version is marked failed, retried
+    # with exponential backoff like the outbox and storage deletion queues
+    MAX_PREVIEW_ATTEMPTS = 8
+    PREVIEW_BACKOFF_BASE_SECONDS = 30
+    PREVIEW_BACKOFF_MAX_SECONDS = 3600
+    # How long a claimed preview stays with its worker before another may retry it
+    PREVIEW_LEASE_SECONDS = 600
+
+    # Preview fields shared by every version row that references the same file
+    PREVIEW_FIELDS = ('previewStatus', 'pageCount', 'hasTextLayer', 'textExcerpt', 'thumbnailWidth', 'thumbnailHeight')
+
     @staticmethod
     def getActivePdf():
         """
-        Get the currently active PDF version
+        Get the currently active PDF version, with its uploader in the same query
+        (a probe of the partial unique index on is_active)
 
         Returns:
             ResumePdfVersion: Active PDF or None if no active PDF exists
@@ -21,7 +41,9 @@ class ResumePdfDAO:
             Exception: If database query fails
         """
         try:
-            return ResumePdfVersion.query.filter_by(
+            return ResumePdfVersion.query.options(
+                joinedload(ResumePdfVersion.uploadedBy)
+            ).filter_by(
                 isActive=True,
                 deletedAt=None
             ).first()
@@ -29,34 +51,97 @@ class ResumePdfDAO:
             raise Exception(f"Failed to fetch active PDF: {str(e)}")
 
     @staticmethod
-    def getAllVersions(includeDeleted=False):
+    def getAllVersions(includeDeleted=False, limit=20, cursor=None):
         """
-        Get all PDF versions ordered by creation date (newest first)
+        Get one page of PDF versions ordered by creation date (newest first)
+
+        Uploaders are joined into the same query, so toDict() on the page
+        issues no further queries. Pass the nextCursor of the previous page
+        as cursor for keyset pagination on (createdAt, id).
 
         Args:
             includeDeleted (bool): Include soft-deleted versions (default: False)
+            limit (int): Max versions per page (default 20)
+            cursor (str, optional): Opaque cursor from a previous page
 
         Returns:
-            list[ResumePdfVersion]: List of all versions
+            tuple: (versions list, next_cursor or None)
 
         Raises:
+            ValueError: If the cursor is malformed
             Exception: If database query fails
         """
+        position = ResumePdfDAO.decodeCursor(cursor) if cursor else None
+
         try:
-            query = ResumePdfVersion.query
+            query = ResumePdfVersion.query.options(joinedload(ResumePdfVersion.uploadedBy))
 
             if not includeDeleted:
                 query = query.filter_by(deletedAt=None)
+            if position:
+                query = query.filter(tuple_(ResumePdfVersion.createdAt, ResumePdfVersion.id) < position)
+
+            # Fetch one extra row to know whether another page exists
+            versions = query.order_by(ResumePdfVersion.createdAt.desc(), ResumePdfVersion.id.desc())\
+                            .limit(limit + 1).all()
 
-            return query.order_by(ResumePdfVersion.createdAt.desc()).all()
+            nextCursor = None
+            if len(versions) > limit:
+                versions = versions[:limit]
+                nextCursor = ResumePdfDAO.encodeCursor(versions[-1])
+
+            return (versions, nextCursor)
         except Exception as e:
             raise Exception(f"Failed to fetch PDF versions: {str(e)}")
 
+    @staticmethod
+    def encodeCursor(version):
+        """Encode a version's (createdAt, id) sort key as an opaque cursor"""
+        raw = f"{version.createdAt.isoformat()}|{version.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decodeCursor(cursor):
+        """
+        Decode a cursor produced by encodeCursor
+
+        Returns:
+            tuple: (createdAt datetime, id int)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            createdAt, versionId = raw.rsplit('|', 1)
+            return (datetime.fromisoformat(createdAt), int(versionId))
+        except Exception:
+            raise ValueError('Invalid pagination cursor')
+
+    @staticmethod
+    def getAllFilePaths():
+        """
+        Stored file paths of every version (soft-deleted ones included, since
+        they can be restored), for storage GC
+
+        Returns:
+            list[str]: One path per version (restored versions share a path)
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            rows = ResumePdfVersion.query.with_entities(ResumePdfVersion.filePath).all()
+            return [row.filePath for row in rows]
+        except Exception as e:
+            raise Exception(f"Failed to fetch PDF file paths: {str(e)}")
+
     @staticmethod
     def createVersion(fileName, filePath, fileSize, userId):
         """
         Create a new PDF version and set it as active
-        Automatically deactivates all other versions
+        Automatically deactivates all other versions and takes the file's
+        storage reference in the same commit
 
         Args:
             fileName (str): Original filename
@@ -84,7 +169,9 @@ class ResumePdfDAO:
             )
 
             db.session.add(newVersion)
+            StorageBlobDAO.acquire(filePath)
             db.session.commit()
+            bumpCacheVersion(ResumePdfDAO.CACHE_NAMESPACE)
 
             return newVersion
         except Exception as e:
@@ -125,11 +212,18 @@ class ResumePdfDAO:
                 mimeType=sourceVersion.mimeType,
                 isActive=True,
                 uploadedByUserId=sourceVersion.uploadedByUserId,
-                createdAt=datetime.utcnow()  # New timestamp for reactivation
+                createdAt=datetime.utcnow(),  # New timestamp for reactivation
+                # Same file, same preview - no need to render it again
+                **{field: getattr(sourceVersion, field) for field in ResumePdfDAO.PREVIEW_FIELDS}
             )
+            if newVersion.previewStatus == ResumePdfVersion.PREVIEW_FAILED:
+                # Give a preview that ran out of attempts a fresh set of retries
+                newVersion.previewStatus = ResumePdfVersion.PREVIEW_PENDING
 
             db.session.add(newVersion)
+            StorageBlobDAO.acquire(newVersion.filePath)  # One reference per version row
             db.session.commit()
+            bumpCacheVersion(ResumePdfDAO.CACHE_NAMESPACE)
 
             return newVersion
         except Exception as e:
@@ -165,11 +259,110 @@ class ResumePdfDAO:
                 version.isActive = False
 
             db.session.commit()
+            bumpCacheVersion(ResumePdfDAO.CACHE_NAMESPACE)
             return True
         except Exception as e:
             db.session.rollback()
             raise Exception(f"Failed to delete PDF version: {str(e)}")
 
+    @staticmethod
+    def claimPendingPreviews(limit=10):
+        """
+        Claim a batch of versions whose preview is pending and due, and
+        commit the claim so no row lock is held while the PDFs render.
+        A claim counts as an attempt and leases the row for
+        PREVIEW_LEASE_SECONDS by moving its next attempt forward; if the
+        worker dies mid-render the lease runs out and the row is picked up
+        again, until it has used up MAX_PREVIEW_ATTEMPTS.
+
+        FOR UPDATE SKIP LOCKED keeps concurrent workers from claiming the
+        same row, and is only held for this short transaction.
+
+        Args:
+            limit (int): Max versions to claim (default 10)
+
+        Returns:
+            list[tuple]: (version id, file path, attempt number) per claimed
+            version, oldest first
+
+        Raises:
+            Exception: If database update fails
+        """
+        try:
+            now = datetime.utcnow()
+            versions = ResumePdfVersion.query\
+                .filter(ResumePdfVersion.previewStatus == ResumePdfVersion.PREVIEW_PENDING)\
+                .filter(ResumePdfVersion.previewNextAttemptAt <= now)\
+                .order_by(ResumePdfVersion.id.asc())\
+                .limit(limit)\
+                .with_for_update(skip_locked=True)\
+                .all()
+
+            claimed = []
+            for version in versions:
+                if version.previewAttempts >= ResumePdfDAO.MAX_PREVIEW_ATTEMPTS:
+                    # Every attempt was claimed but never recorded (worker crashed)
+                    version.previewStatus = ResumePdfVersion.PREVIEW_FAILED
+                    continue
+                version.previewAttempts += 1
+                version.previewNextAttemptAt = now + timedelta(seconds=ResumePdfDAO.PREVIEW_LEASE_SECONDS)
+                claimed.append((version.id, version.filePath, version.previewAttempts))
+
+            db.session.commit()
+            return claimed
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to claim pending PDF previews: {str(e)}")
+
+    @staticmethod
+    def recordPreviews(results):
+        """
+        Record preview outcomes for a claimed batch in one short commit.
+        Failures are retried with exponential backoff until MAX_PREVIEW_ATTEMPTS.
+
+        Runs in the worker process, so it does not bump the response cache:
+        the counter is per process and the web workers would never see it.
+        They pick up new previews when their cached active version expires
+        (RESPONSE_CACHE_TTL); history responses are not cached.
+
+        Args:
+            results (list): List of (version id, metadata dict or None,
+                error str or None) tuples; metadata holds pageCount,
+                hasTextLayer, textExcerpt, thumbnailWidth and thumbnailHeight
+
+        Raises:
+            Exception: If database update fails
+        """
+        try:
+            now = datetime.utcnow()
+            versions = {
+                version.id: version
+                for version in ResumePdfVersion.query.filter(
+                    ResumePdfVersion.id.in_([versionId for versionId, _, _ in results])
+                ).all()
+            }
+            for versionId, metadata, error in results:
+                version = versions.get(versionId)
+                if version is None or version.previewStatus != ResumePdfVersion.PREVIEW_PENDING:
+                    continue
+                if error is None:
+                    for field, value in metadata.items():
+                        setattr(version, field, value)
+                    version.previewStatus = ResumePdfVersion.PREVIEW_READY
+                elif version.previewAttempts >= ResumePdfDAO.MAX_PREVIEW_ATTEMPTS:
+                    version.previewStatus = ResumePdfVersion.PREVIEW_FAILED
+                else:
+                    delay = min(
+                        ResumePdfDAO.PREVIEW_BACKOFF_BASE_SECONDS * (2 ** (version.previewAttempts - 1)),
+                        ResumePdfDAO.PREVIEW_BACKOFF_MAX_SECONDS
+                    )
+                    version.previewNextAttemptAt = now + timedelta(seconds=delay)
+
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to record PDF previews: {str(e)}")
+
     @staticmethod
     def getVersionById(versionId):
         """
@@ -0,0 +1,241 @@
+"""
+Data Access Object for StorageBlob model
+"""
+from app.models import StorageBlob
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+
+class StorageBlobDAO:
+    """DAO class for content-addressed blob reference counting"""
+
+    @staticmethod
+    def register(key, sha256, size):
+        """
+        Register an upload's blob before its bytes are written.
+        Uploads hold no reference - only attaching the URL to a row does
+        (acquire()) - so a new blob starts at ref_count 0 and written false.
+        Cancels any queued deletion of the key first; if the worker is
+        deleting it right now this waits, and then sees written reset.
+
+        Args:
+            key (str): Storage key derived from the content hash
+            sha256 (str): Hex digest of the content
+            size (int): Size in bytes
+
+        Returns:
+            bool: True if the bytes are already stored (caller skips writing);
+            False if the caller must write them and then call markWritten()
+
+        Raises:
+            Exception: If database update fails
+        """
+        from app import db
+        from app.dao.storage_deletion_dao import StorageDeletionDAO
+        try:
+            StorageDeletionDAO.cancelPending(key)
+            now = datetime.utcnow()
+            # Touching updated_at restarts the GC grace period for this upload
+            statement = pg_insert(StorageBlob.__table__).values(
+                key=key, sha256=sha256, size=size, ref_count=0, written=False, created_at=now, updated_at=now
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=['key'],
+                set_={'updated_at': now}
+            ).returning(StorageBlob.__table__.c.written)
+            written = db.session.execute(statement).scalar_one()
+            db.session.commit()
+            return written
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to register storage blob: {str(e)}")
+
+    @staticmethod
+    def markWritten(key):
+        """
+        Record that a registered blob's bytes are stored. Until then, an
+        identical upload writes them again instead of trusting the row.
+
+        Args:
+            key (str): Storage key
+
+        Raises:
+            Exception: If database update fails
+        """
+        from app import db
+        try:
+            table = StorageBlob.__table__
+            db.session.execute(
+                table.update().where(table.c.key == key).values(written=True, updated_at=datetime.utcnow())
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to mark storage blob written: {str(e)}")
+
+    @staticmethod
+    def acquire(key):
+        """
+        Add a reference for a row that now points at the blob. Runs in the
+        caller's transaction (no commit), next to the write that attaches
+        the URL. Cancels a queued deletion of the key, waiting for the
+        worker if it has already claimed it.
+
+        Args:
+            key (str): Storage key; untracked keys (e.g. legacy uuid-named
+                uploads) are left alone
+
+        Raises:
+            ValueError: If the blob's bytes are no longer stored (deleted
+                since upload) - the file has to be uploaded again
+        """
+        from app import db
+        from app.dao.storage_deletion_dao import StorageDeletionDAO
+        StorageDeletionDAO.cancelPending(key)
+        table = StorageBlob.__table__
+        written = db.session.execute(
+            table.update()
+            .where(table.c.key == key)
+            .values(ref_count=table.c.ref_count + 1, updated_at=datetime.utcnow())
+            .returning(table.c.written)
+        ).scalar_one_or_none()
+        if written is False:
+            raise ValueError('Uploaded file is no longer stored - please upload it again')
+
+    @staticmethod
+    def release(key):
+        """
+        Drop one reference to a blob. Runs in the caller's transaction (no
+        commit). The row stays at ref_count 0 so a later acquire() can tell
+        whether the bytes still exist; storage GC drops it after the grace
+        period.
+
+        Args:
+            key (str): Storage key
+
+        Returns:
+            bool: True if the bytes may be deleted (last reference released,
+            or the key was never tracked, e.g. a legacy uuid-named upload)
+        """
+        from app import db
+        table = StorageBlob.__table__
+        remaining = db.session.execute(
+            table.update()
+            .where(table.c.key == key)
+            .values(ref_count=db.func.greatest(table.c.ref_count - 1, 0), updated_at=datetime.utcnow())
+            .returning(table.c.ref_count)
+        ).scalar_one_or_none()
+        return remaining is None or remaining == 0
+
+    @staticmethod
+    def markDeleted(key):
+        """
+        Record that a blob's bytes were deleted (caller's transaction, no
+        commit), so the next upload or acquire() of the key knows.
+
+        Args:
+            key (str): Storage key
+        """
+        from app import db
+        table = StorageBlob.__table__
+        db.session.execute(table.update().where(table.c.key == key).values(written=False))
+
+    @staticmethod
+    def swapUrlReference(oldUrl, newUrl, includeVariants=True):
+        """
+        Move one row's reference from the stored file at oldUrl to the one
+        at newUrl, in the caller's transaction: acquire the new blob,
+        release the old one and queue its deletion if that was the last
+        reference. External URLs (not ours) are ignored.
+
+        Args:
+            oldUrl (str or None): URL the row pointed at
+            newUrl (str or None): URL the row points at now
+            includeVariants (bool): Delete the old file's variants too
+
+        Raises:
+            ValueError: If the new file is no longer stored
+        """
+        from app.dao.storage_deletion_dao import StorageDeletionDAO
+        from app.services.storage_factory import storageKeyForUrl
+        if oldUrl == newUrl:
+            return
+        newKey = storageKeyForUrl(newUrl) if newUrl else None
+        if newKey:
+            StorageBlobDAO.acquire(newKey)
+        oldKey = storageKeyForUrl(oldUrl) if oldUrl else None
+        if oldKey:
+            StorageDeletionDAO.enqueue(oldKey, includeVariants=includeVariants)
+
+    @staticmethod
+    def getTrackedKeys(keys):
+        """
+        Which of the given keys currently have a blob row.
+
+        Args:
+            keys (list): Storage keys
+
+        Returns:
+            set: Keys that are reference-counted right now
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            if not keys:
+                return set()
+            rows = StorageBlob.query.with_entities(StorageBlob.key).filter(StorageBlob.key.in_(keys)).all()
+            return {row.key for row in rows}
+        except Exception as e:
+            raise Exception(f"Failed to fetch storage blobs: {str(e)}")
+
+    @staticmethod
+    def reconcileRefCounts(referenceCounts, cutoff, dryRun=False):
+        """
+        Correct reference counts from the references that actually exist.
+        Only blobs last touched before cutoff are lowered or dropped: a newer
+        one may be in the middle of an attach whose reference the scan
+        missed, so its count is only ever raised. Rows are locked while the
+        counts are written so a concurrent acquire() cannot be overwritten.
+
+        Args:
+            referenceCounts (dict): key -> number of database references
+            cutoff (datetime): Naive UTC; blobs updated since are never lowered
+            dryRun (bool): Only count what would change
+
+        Returns:
+            dict: {'updated': int, 'dropped': int, 'skipped': int} - skipped
+            counts recent blobs whose count looked too high but was kept
+
+        Raises:
+            Exception: If database update fails
+        """
+        from app import db
+        try:
+            updated = dropped = skipped = 0
+            query = StorageBlob.query if dryRun else StorageBlob.query.with_for_update()
+            for blob in query.all():
+                expected = referenceCounts.get(blob.key, 0)
+                if blob.updatedAt >= cutoff:
+                    if expected > blob.refCount:
+                        updated += 1
+                        if not dryRun:
+                            blob.refCount = expected
+                    elif expected < blob.refCount:
+                        skipped += 1
+                elif expected == 0:
+                    dropped += 1
+                    if not dryRun:
+                        db.session.delete(blob)
+                elif blob.refCount != expected:
+                    updated += 1
+                    if not dryRun:
+                        blob.refCount = expected
+            if dryRun:
+                db.session.rollback()
+            else:
+                db.session.commit()
+            return {'updated': updated, 'dropped': dropped, 'skipped': skipped}
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to reconcile storage blobs: {str(e)}")
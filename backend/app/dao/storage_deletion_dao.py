@@ -0,0 +1,144 @@
+"""
+Data Access Object for StorageDeletion model
+"""
+from app.models import StorageDeletion
+from datetime import datetime, timedelta
+
+
+class StorageDeletionDAO:
+    """DAO class for the storage deletion queue"""
+
+    MAX_ATTEMPTS = 8
+    BACKOFF_BASE_SECONDS = 30
+    BACKOFF_MAX_SECONDS = 3600
+
+    @staticmethod
+    def enqueue(key, includeVariants=False):
+        """
+        Release a reference to a stored object and, if it was the last one,
+        queue the object for deletion. Runs in the caller's transaction (no
+        commit), so the deletion is queued exactly when the row that
+        referenced the object is changed.
+
+        Args:
+            key (str): S3 key or local relative path
+            includeVariants (bool): Also delete the image's responsive variants
+
+        Returns:
+            bool: True if a deletion was queued, False if other rows still
+            reference the same content
+        """
+        from app import db
+        from app.dao.storage_blob_dao import StorageBlobDAO
+        if not StorageBlobDAO.release(key):
+            return False
+        db.session.add(StorageDeletion(key=key, includeVariants=includeVariants))
+        return True
+
+    @staticmethod
+    def cancelPending(key):
+        """
+        Cancel queued deletions of a key whose content was just uploaded or attached again.
+        Runs in the caller's transaction (no commit). If the worker has the row
+        claimed, this waits for it to finish, so the caller writes the bytes
+        only after the old copy is gone.
+
+        Args:
+            key (str): S3 key or local relative path
+        """
+        from app import db
+        table = StorageDeletion.__table__
+        db.session.execute(
+            table.update()
+            .where(table.c.key == key)
+            .where(table.c.status == StorageDeletion.STATUS_PENDING)
+            .values(status=StorageDeletion.STATUS_CANCELLED)
+        )
+
+    @staticmethod
+    def getPendingKeys():
+        """
+        Keys still waiting in the queue (pending, due or not).
+
+        Returns:
+            list: (key, includeVariants) tuples
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            rows = StorageDeletion.query\
+                .with_entities(StorageDeletion.key, StorageDeletion.includeVariants)\
+                .filter(StorageDeletion.status == StorageDeletion.STATUS_PENDING)\
+                .all()
+            return [(row.key, row.includeVariants) for row in rows]
+        except Exception as e:
+            raise Exception(f"Failed to fetch pending storage deletions: {str(e)}")
+
+    @staticmethod
+    def getDueDeletions(limit=100):
+        """
+        Lock a batch of pending deletions whose next attempt is due.
+        Uses FOR UPDATE SKIP LOCKED so several workers never claim the same row;
+        the locks are held until recordResults() commits.
+
+        Args:
+            limit (int): Max deletions to claim (default 100)
+
+        Returns:
+            list[StorageDeletion]: Claimed deletions (oldest first)
+
+        Raises:
+            Exception: If database query fails
+        """
+        try:
+            return StorageDeletion.query\
+                .filter(StorageDeletion.status == StorageDeletion.STATUS_PENDING)\
+                .filter(StorageDeletion.nextAttemptAt <= datetime.utcnow())\
+                .order_by(StorageDeletion.id.asc())\
+                .limit(limit)\
+                .with_for_update(skip_locked=True)\
+                .all()
+        except Exception as e:
+            raise Exception(f"Failed to fetch due storage deletions: {str(e)}")
+
+    @staticmethod
+    def recordResults(results):
+        """
+        Record deletion outcomes for a claimed batch in one commit.
+        Failures are retried with exponential backoff until MAX_ATTEMPTS.
+        Deleted keys have their blob marked unwritten in the same commit.
+
+        Args:
+            results (list): List of (StorageDeletion, error str or None) tuples
+
+        Raises:
+            Exception: If database update fails
+        """
+        from app import db
+        from app.dao.storage_blob_dao import StorageBlobDAO
+        try:
+            now = datetime.utcnow()
+            for deletion, error in results:
+                deletion.attempts += 1
+                if error is None:
+                    deletion.status = StorageDeletion.STATUS_DELETED
+                    deletion.deletedAt = now
+                    deletion.lastError = None
+                    StorageBlobDAO.markDeleted(deletion.key)
+                    continue
+
+                deletion.lastError = error
+                if deletion.attempts >= StorageDeletionDAO.MAX_ATTEMPTS:
+                    deletion.status = StorageDeletion.STATUS_FAILED
+                else:
+                    delay = min(
+                        StorageDeletionDAO.BACKOFF_BASE_SECONDS * (2 ** (deletion.attempts - 1)),
+                        StorageDeletionDAO.BACKOFF_MAX_SECONDS
+                    )
+                    deletion.nextAttemptAt = now + timedelta(seconds=delay)
+
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise Exception(f"Failed to record storage deletion results: {str(e)}")
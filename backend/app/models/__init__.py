@@ -4,5 +4,8 @@ from app.models.about import About
 from app.models.contact import ContactSubmission
 from app.models.user import User
 from app.models.resume_pdf import ResumePdfVersion
+from app.models.email_outbox import EmailOutboxMessage
+from app.models.storage_blob import StorageBlob
+from app.models.storage_deletion import StorageDeletion
 
-__all__ = ['Project', 'Resume', 'About', 'ContactSubmission', 'User', 'ResumePdfVersion']
+__all__ = ['Project', 'Resume', 'About', 'ContactSubmission', 'User', 'ResumePdfVersion', 'EmailOutboxMessage', 'StorageBlob', 'StorageDeletion']
@@ -8,6 +8,9 @@ class About(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.Text, nullable=False)
     profilePhotoUrl = db.Column('profile_photo_url', db.String(500), nullable=True)
+    profilePhotoWidth = db.Column('profile_photo_width', db.Integer, nullable=True)
+    profilePhotoHeight = db.Column('profile_photo_height', db.Integer, nullable=True)
+    profilePhotoPlaceholder = db.Column('profile_photo_placeholder', db.Text, nullable=True)  # Tiny base64 data URI
     updatedAt = db.Column('updated_at', db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def toDict(self):
@@ -15,6 +18,10 @@ class About(db.Model):
         return {
             'id': self.id,
             'content': self.content,
+            'profilePhotoUrl': self.profilePhotoUrl,
+            'profilePhotoWidth': self.profilePhotoWidth,
+            'profilePhotoHeight': self.profilePhotoHeight,
+            'profilePhotoPlaceholder': self.profilePhotoPlaceholder,
             'updatedAt': self.updatedAt.isoformat() if self.updatedAt else None
         }
 
@@ -0,0 +1,42 @@
+"""
+Email Outbox Model - Durable queue of notification emails for contact submissions
+"""
+from app import db
+from datetime import datetime
+
+
+class EmailOutboxMessage(db.Model):
+    """Notification email written in the same transaction as its contact submission"""
+    __tablename__ = 'email_outbox'
+
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+
+    id = db.Column(db.Integer, primary_key=True)
+    contactSubmissionId = db.Column('contact_submission_id', db.Integer, db.ForeignKey('contact_submissions.id'), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default=STATUS_PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    nextAttemptAt = db.Column('next_attempt_at', db.DateTime, nullable=False, default=datetime.utcnow)
+    lastError = db.Column('last_error', db.Text, nullable=True)
+    createdAt = db.Column('created_at', db.DateTime, nullable=False, default=datetime.utcnow)
+    sentAt = db.Column('sent_at', db.DateTime, nullable=True)
+
+    # Loaded together with the message so a batch renders without extra queries
+    submission = db.relationship('ContactSubmission', lazy='joined', innerjoin=True)
+
+    def toDict(self):
+        """Convert model to dictionary for JSON response"""
+        return {
+            'id': self.id,
+            'contactSubmissionId': self.contactSubmissionId,
+            'status': self.status,
+            'attempts': self.attempts,
+            'nextAttemptAt': self.nextAttemptAt.isoformat() if self.nextAttemptAt else None,
+            'lastError': self.lastError,
+            'createdAt': self.createdAt.isoformat() if self.createdAt else None,
+            'sentAt': self.sentAt.isoformat() if self.sentAt else None
+        }
+
+    def __repr__(self):
+        return f'<EmailOutboxMessage {self.id} ({self.status})>'
@@ -1,5 +1,15 @@
 from app import db
 from datetime import datetime
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# Weighted full-text document: title (A), description and technologies (B),
+# Markdown article (C). Maintained by Postgres as a stored generated column.
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(json_to_tsvector('english', coalesce(technologies, '[]'::json), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
 
 
 class Project(db.Model):
@@ -12,16 +22,35 @@ class Project(db.Model):
     githubUrl = db.Column('github_url', db.String(500), nullable=True)
     liveUrl = db.Column('live_url', db.String(500), nullable=True)
     imageUrl = db.Column('image_url', db.String(500), nullable=True)
+    imageWidth = db.Column('image_width', db.Integer, nullable=True)
+    imageHeight = db.Column('image_height', db.Integer, nullable=True)
+    imagePlaceholder = db.Column('image_placeholder', db.Text, nullable=True)  # Tiny base64 data URI
     content = db.Column('content', db.Text, nullable=True)
     docsSlug = db.Column('docs_slug', db.String(100), nullable=True)
     isVisible = db.Column('is_visible', db.Boolean, nullable=False, default=True)
     displayOrder = db.Column('display_order', db.Integer, nullable=False, default=0)
     createdAt = db.Column('created_at', db.DateTime, nullable=False, default=datetime.utcnow)
     updatedAt = db.Column('updated_at', db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    searchVector = db.deferred(db.Column(
+        'search_vector', TSVECTOR, db.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True
+    ))  # GIN-indexed, used only inside search queries
+
+    # Keys produced by toDict(); summaries leave out the full Markdown article
+    FIELDS = (
+        'id', 'title', 'description', 'technologies', 'github_url', 'live_url', 'image_url',
+        'image_width', 'image_height', 'image_placeholder', 'content', 'docsSlug', 'isVisible', 'displayOrder', 'createdAt', 'updatedAt'
+    )
+    SUMMARY_FIELDS = tuple(f for f in FIELDS if f != 'content')
+
+    def toDict(self, fields=None):
+        """
+        Convert model to dictionary for JSON response
 
-    def toDict(self):
-        """Convert model to dictionary for JSON response"""
-        return {
+        Args:
+            fields (iterable, optional): Only include these keys. 'content' is
+                not touched unless requested, so a deferred column stays unloaded.
+        """
+        data = {
             'id': self.id,
             'title': self.title,
             'description': self.description,
@@ -29,13 +58,20 @@ class Project(db.Model):
             'github_url': self.githubUrl,
             'live_url': self.liveUrl,
             'image_url': self.imageUrl,
-            'content': self.content,
+            'image_width': self.imageWidth,
+            'image_height': self.imageHeight,
+            'image_placeholder': self.imagePlaceholder,
             'docsSlug': self.docsSlug,
             'isVisible': self.isVisible,
             'displayOrder': self.displayOrder,
             'createdAt': self.createdAt.isoformat() if self.createdAt else None,
             'updatedAt': self.updatedAt.isoformat() if self.updatedAt else None
         }
+        if fields is None or 'content' in fields:
+            data['content'] = self.content
+        if fields is not None:
+            data = {key: value for key, value in data.items() if key in fields}
+        return data
 
     def __repr__(self):
         return f'<Project {self.title}>'
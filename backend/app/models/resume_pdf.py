@@ -9,6 +9,11 @@ class ResumePdfVersion(db.Model):
     """Model for resume PDF versions with soft delete and version control"""
     __tablename__ = 'resume_pdf_versions'
 
+    # Preview (thumbnail + metadata) generation, done by the background worker
+    PREVIEW_PENDING = 'pending'
+    PREVIEW_READY = 'ready'
+    PREVIEW_FAILED = 'failed'
+
     id = db.Column(db.Integer, primary_key=True)
     fileName = db.Column('file_name', db.String(255), nullable=False)
     filePath = db.Column('file_path', db.String(500), nullable=False)
@@ -18,16 +23,41 @@ class ResumePdfVersion(db.Model):
     uploadedByUserId = db.Column('uploaded_by_user_id', db.Integer, db.ForeignKey('admin_users.id'), nullable=True)
     createdAt = db.Column('created_at', db.DateTime, nullable=False, default=datetime.utcnow)
     deletedAt = db.Column('deleted_at', db.DateTime, nullable=True)
+    previewStatus = db.Column('preview_status', db.String(20), nullable=False, default=PREVIEW_PENDING)
+    previewAttempts = db.Column('preview_attempts', db.Integer, nullable=False, default=0)
+    previewNextAttemptAt = db.Column('preview_next_attempt_at', db.DateTime, nullable=False, default=datetime.utcnow)
+    pageCount = db.Column('page_count', db.Integer, nullable=True)
+    hasTextLayer = db.Column('has_text_layer', db.Boolean, nullable=True)
+    textExcerpt = db.Column('text_excerpt', db.String(500), nullable=True)
+    thumbnailWidth = db.Column('thumbnail_width', db.Integer, nullable=True)
+    thumbnailHeight = db.Column('thumbnail_height', db.Integer, nullable=True)
 
     # Relationship to User model
     uploadedBy = db.relationship('User', backref='uploadedResumes', lazy=True)
 
+    @property
+    def fileUrl(self):
+        """Immutable URL of this version's bytes (the row's file never changes)"""
+        return f'/api/cv/pdf/versions/{self.id}/file'
+
+    @property
+    def thumbnailUrl(self):
+        """
+        First-page thumbnail URL, once the worker has generated it.
+        None for deleted versions and documents without pages (no thumbnail
+        stored), which the thumbnail route answers with 404.
+        """
+        if self.previewStatus != self.PREVIEW_READY or self.thumbnailWidth is None or self.deletedAt is not None:
+            return None
+        return f'/api/cv/pdf/versions/{self.id}/thumbnail'
+
     def toDict(self):
         """Convert model to dictionary for JSON response"""
         return {
             'id': self.id,
             'fileName': self.fileName,
             'filePath': self.filePath,
+            'fileUrl': self.fileUrl,
             'fileSize': self.fileSize,
             'mimeType': self.mimeType,
             'isActive': self.isActive,
@@ -37,7 +67,14 @@ class ResumePdfVersion(db.Model):
                 'email': self.uploadedBy.email
             } if self.uploadedBy else None,
             'createdAt': self.createdAt.isoformat() if self.createdAt else None,
-            'deletedAt': self.deletedAt.isoformat() if self.deletedAt else None
+            'deletedAt': self.deletedAt.isoformat() if self.deletedAt else None,
+            'previewStatus': self.previewStatus,
+            'thumbnailUrl': self.thumbnailUrl,
+            'thumbnailWidth': self.thumbnailWidth,
+            'thumbnailHeight': self.thumbnailHeight,
+            'pageCount': self.pageCount,
+            'hasTextLayer': self.hasTextLayer,
+            'textExcerpt': self.textExcerpt
         }
 
     def __repr__(self):
@@ -0,0 +1,33 @@
+"""
+Storage Blob Model - Reference counts for content-addressed uploads
+"""
+from app import db
+from datetime import datetime
+
+
+class StorageBlob(db.Model):
+    """One stored object keyed by content hash, shared by every identical upload"""
+    __tablename__ = 'storage_blobs'
+
+    key = db.Column(db.String(500), primary_key=True)  # S3 key or local relative path
+    sha256 = db.Column(db.String(64), nullable=False)
+    size = db.Column(db.BigInteger, nullable=False)
+    refCount = db.Column('ref_count', db.Integer, nullable=False, default=0)  # Rows whose URL points here
+    written = db.Column(db.Boolean, nullable=False, default=False)  # Bytes are stored
+    createdAt = db.Column('created_at', db.DateTime, nullable=False, default=datetime.utcnow)
+    updatedAt = db.Column('updated_at', db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def toDict(self):
+        """Convert model to dictionary for JSON response"""
+        return {
+            'key': self.key,
+            'sha256': self.sha256,
+            'size': self.size,
+            'refCount': self.refCount,
+            'written': self.written,
+            'createdAt': self.createdAt.isoformat() if self.createdAt else None,
+            'updatedAt': self.updatedAt.isoformat() if self.updatedAt else None
+        }
+
+    def __repr__(self):
+        return f'<StorageBlob {self.key} refs={self.refCount}>'
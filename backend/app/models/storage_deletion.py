@@ -0,0 +1,43 @@
+"""
+Storage Deletion Model - Durable queue of stored objects to delete
+"""
+from app import db
+from datetime import datetime
+
+
+class StorageDeletion(db.Model):
+    """An object (and optionally its image variants) waiting to be deleted by the worker"""
+    __tablename__ = 'storage_deletions'
+
+    STATUS_PENDING = 'pending'
+    STATUS_DELETED = 'deleted'
+    STATUS_FAILED = 'failed'
+    # The same content was uploaded again before the worker got to it
+    STATUS_CANCELLED = 'cancelled'
+
+    id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(500), nullable=False)  # S3 key or local relative path
+    includeVariants = db.Column('include_variants', db.Boolean, nullable=False, default=False)
+    status = db.Column(db.String(20), nullable=False, default=STATUS_PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    nextAttemptAt = db.Column('next_attempt_at', db.DateTime, nullable=False, default=datetime.utcnow)
+    lastError = db.Column('last_error', db.Text, nullable=True)
+    createdAt = db.Column('created_at', db.DateTime, nullable=False, default=datetime.utcnow)
+    deletedAt = db.Column('deleted_at', db.DateTime, nullable=True)
+
+    def toDict(self):
+        """Convert model to dictionary for JSON response"""
+        return {
+            'id': self.id,
+            'key': self.key,
+            'includeVariants': self.includeVariants,
+            'status': self.status,
+            'attempts': self.attempts,
+            'nextAttemptAt': self.nextAttemptAt.isoformat() if self.nextAttemptAt else None,
+            'lastError': self.lastError,
+            'createdAt': self.createdAt.isoformat() if self.createdAt else None,
+            'deletedAt': self.deletedAt.isoformat() if self.deletedAt else None
+        }
+
+    def __repr__(self):
+        return f'<StorageDeletion {self.key} ({self.status})>'
@@ -2,15 +2,23 @@
 About routes - public viewing and admin update operations
 """
 import os
-import sys
-from flask import Blueprint, request, jsonify, send_file, Response
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
 from werkzeug.utils import secure_filename
 from app.dao.about_dao import AboutDAO
 from app.services.storage_factory import getStorageService
+from app.services.storage_utils import getContentType, MAX_IMAGE_SIZE, PROFILE_PHOTOS
+from app.services.image_processing import (
+    describeImage, selectVariant, parseRequestedWidth, acceptsWebp, validateImageMetadata
+)
+from app.utils.storage_serving import serveStoredObject, IMMUTABLE_CACHE_CONTROL
+from app.utils.upload_stream import rejectOversizedUpload
+from app.utils.conditional_get import computeEtag, isNotModified, notModifiedResponse, withValidators
 
 about_bp = Blueprint('about', __name__)
 
+PROFILE_PHOTO_METADATA_ATTRIBUTES = ('profilePhotoWidth', 'profilePhotoHeight', 'profilePhotoPlaceholder')
+
 
 @about_bp.route('/about', methods=['GET'])
 def getAbout():
@@ -19,26 +27,34 @@ def getAbout():
 
     Returns:
         200: About data
+        304: Not modified (If-None-Match matched)
         500: Server error
     """
     try:
         about = AboutDAO.getAbout()
 
+        etag = computeEtag('about', about.id, about.updatedAt) if about else computeEtag('about', None)
+        if isNotModified(etag):
+            return notModifiedResponse(etag)
+
         if not about:
-            return jsonify({
+            return withValidators(jsonify({
                 'success': True,
                 'data': {
                     'id': None,
                     'content': '',
                     'profilePhotoUrl': None,
+                    'profilePhotoWidth': None,
+                    'profilePhotoHeight': None,
+                    'profilePhotoPlaceholder': None,
                     'updatedAt': None
                 }
-            }), 200
+            }), etag)
 
-        return jsonify({
+        return withValidators(jsonify({
             'success': True,
             'data': about.toDict()
-        }), 200
+        }), etag)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -57,30 +73,38 @@ def updateAbout():
     Request body:
         {
             "content": "Plain text about content",
-            "profilePhotoUrl": "/api/about/profile-photo/filename.jpg"
+            "profilePhotoUrl": "/api/about/profile-photo/filename.jpg",
+            "profilePhotoWidth": 800,  # optional, from the upload response
+            "profilePhotoHeight": 800,  # optional
+            "profilePhotoPlaceholder": "data:image/webp;base64,..."  # optional
         }
 
     Returns:
         200: About updated successfully
-        400: No data provided
+        400: No data provided, malformed photo metadata, or the uploaded
+             photo is no longer stored (upload it again)
         500: Server error
     """
     data = request.get_json()
     if not data:
         return jsonify({'success': False, 'error': 'No data provided'}), 400
+    error = validateImageMetadata(data, PROFILE_PHOTO_METADATA_ATTRIBUTES)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
 
     try:
-        currentPhotoUrl = AboutDAO.getProfilePhotoUrl()
-        newPhotoUrl = data.get('profilePhotoUrl')
-
-        # If profile photo is being changed/removed, delete the old one
-        if currentPhotoUrl and newPhotoUrl != currentPhotoUrl:
-            _deleteProfilePhotoFromStorage(currentPhotoUrl)
-
-        about = AboutDAO.updateAbout(
-            content=data.get('content'),
-            profilePhotoUrl=newPhotoUrl
-        )
+        # A body without profilePhotoUrl (or with null) keeps the current photo;
+        # a replaced one is queued for deletion in the same commit
+        try:
+            about = AboutDAO.updateAbout(
+                content=data.get('content'),
+                profilePhotoUrl=data.get('profilePhotoUrl'),
+                profilePhotoWidth=data.get('profilePhotoWidth'),
+                profilePhotoHeight=data.get('profilePhotoHeight'),
+                profilePhotoPlaceholder=data.get('profilePhotoPlaceholder')
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
 
         return jsonify({
             'success': True,
@@ -104,21 +128,33 @@ def uploadProfilePhoto():
     Request: multipart/form-data with 'file' field
 
     Returns:
-        200: Photo uploaded successfully
+        200: Photo uploaded (URL plus profilePhotoWidth, profilePhotoHeight and
+            a base64 profilePhotoPlaceholder to send back with PUT /about)
         400: No file provided or validation failed
+        413: File too large
         500: Server error
     """
-    try:
-        if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'No file provided'}), 400
+    # Refuse oversized bodies from Content-Length, before parsing the form
+    tooLarge = rejectOversizedUpload(MAX_IMAGE_SIZE)
+    if tooLarge:
+        return tooLarge
+
+    # Parsed outside the try below: a body without Content-Length that runs past
+    # MAX_CONTENT_LENGTH raises RequestEntityTooLarge here, answered by the 413 handler
+    if 'file' not in request.files:
+        return jsonify({'success': False, 'error': 'No file provided'}), 400
 
-        file = request.files['file']
+    file = request.files['file']
 
+    try:
         StorageService = getStorageService()
         isValid, error = StorageService.validateImage(file)
         if not isValid:
             return jsonify({'success': False, 'error': error}), 400
 
+        # Intrinsic size and blur placeholder, computed once here
+        photoInfo = describeImage(file) or {}
+
         originalFilename, storagePath, fileSize = StorageService.saveProfilePhoto(file)
 
         filename = os.path.basename(storagePath)
@@ -129,7 +165,10 @@ def uploadProfilePhoto():
             'data': {
                 'profilePhotoUrl': profilePhotoUrl,
                 'fileName': originalFilename,
-                'fileSize': fileSize
+                'fileSize': fileSize,
+                'profilePhotoWidth': photoInfo.get('width'),
+                'profilePhotoHeight': photoInfo.get('height'),
+                'profilePhotoPlaceholder': photoInfo.get('placeholder')
             }
         }), 200
     except Exception as e:
@@ -140,66 +179,33 @@ def uploadProfilePhoto():
 def serveProfilePhoto(filename):
     """
     Serve profile photo (public endpoint)
-    Handles both local storage and S3 backend
+    Any storage backend; supports ETag/If-Modified-Since and Range requests
+
+    Query params:
+        w (int): Display width in px - serves the nearest larger variant
+            (WebP if the Accept header lists image/webp)
     """
     try:
         filename = secure_filename(filename)
-        storageBackend = os.getenv('STORAGE_BACKEND', 'local').lower()
-
         StorageService = getStorageService()
-        if storageBackend == 's3':
-            import requests
-
-            s3Key = f"profile/{filename}"
-            presignedUrl = StorageService.getFilePath(s3Key)
-
-            s3Response = requests.get(presignedUrl, stream=True)
 
-            if s3Response.status_code != 200:
-                return jsonify({'success': False, 'error': 'Image not found'}), 404
-
-            ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else 'jpeg'
-            contentTypeMap = {
-                'jpg': 'image/jpeg', 'jpeg': 'image/jpeg',
-                'png': 'image/png', 'webp': 'image/webp', 'gif': 'image/gif'
-            }
-            contentType = contentTypeMap.get(ext, 'image/jpeg')
-
-            return Response(
-                s3Response.iter_content(chunk_size=8192),
-                content_type=contentType,
-                headers={'Cache-Control': 'public, max-age=31536000'}
-            )
-        else:
-            relativePath = f"uploads/profile/{filename}"
-            filePath = StorageService.getFilePath(relativePath)
+        # Pick a responsive variant from ?w= and Accept (falls back to the original)
+        filename = selectVariant(
+            filename,
+            parseRequestedWidth(request.args.get('w')),
+            acceptsWebp(request.headers.get('Accept')),
+            lambda name: StorageService.fileExists(StorageService.objectKey(PROFILE_PHOTOS, name))
+        )
 
-            if not os.path.exists(filePath):
-                return jsonify({'success': False, 'error': 'Image not found'}), 404
+        response = serveStoredObject(
+            StorageService.objectKey(PROFILE_PHOTOS, filename),
+            getContentType(filename),
+            cacheControl=IMMUTABLE_CACHE_CONTROL
+        )
+        if response is None:
+            return jsonify({'success': False, 'error': 'Image not found'}), 404
 
-            return send_file(filePath)
+        response.vary.add('Accept')
+        return response
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-
-
-def _deleteProfilePhotoFromStorage(photoUrl):
-    """
-    Helper to delete profile photo from storage
-    Handles both local and S3 backends
-    """
-    try:
-        if not photoUrl:
-            return
-
-        filename = photoUrl.split('/')[-1]
-        storageBackend = os.getenv('STORAGE_BACKEND', 'local').lower()
-
-        StorageService = getStorageService()
-        if storageBackend == 's3':
-            s3Key = f"profile/{filename}"
-            StorageService.deleteFile(s3Key)
-        else:
-            relativePath = f"uploads/profile/{filename}"
-            StorageService.deleteFile(relativePath)
-    except Exception as e:
-        print(f"Warning: Failed to delete profile photo {photoUrl}: {str(e)}", file=sys.stderr)
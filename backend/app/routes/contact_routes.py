@@ -8,27 +8,10 @@ from app.dao import ContactSubmissionDAO
 from app import limiter
 from app.utils.csrf_protection import generateCsrfToken, attachCsrfCookieToResponse, validateCsrfToken
 import sys
-import threading
 
 contact_bp = Blueprint('contact', __name__)
 
-
-def _sendEmailInBackground(fromEmail, name, email, message):
-    """
-    Send email in background thread to reduce response latency.
-    Email failures are logged but don't affect user response.
-    """
-    try:
-        success, error = EmailService.sendEmail(
-            fromEmail=fromEmail,
-            name=name,
-            email=email,
-            message=message
-        )
-        if not success:
-            print(f"ERROR: Background email failed: {error}", file=sys.stderr)
-    except Exception as e:
-        print(f"ERROR: Background email exception: {str(e)}", file=sys.stderr)
+BULK_MAX_IDS = 1000  # Per-request cap for explicit ID lists; use a filter for more
 
 
 @contact_bp.route('/contact/csrf-token', methods=['GET'])
@@ -69,7 +52,7 @@ def submitContactForm():
     2. CSRF token validation (instant, ~1ms)
     3. reCAPTCHA verification (external API, ~100-300ms)
     4. Input validation (instant, ~1ms)
-    5. Email sending (external API, ~200-500ms)
+    5. Email queued in the outbox (same DB transaction, sent by the worker)
 
     Request body:
         {
@@ -227,26 +210,27 @@ def submitContactForm():
         # Get client IP address
         ipAddress = request.remote_addr
 
-        # Save submission to database
+        # Save submission and queue its notification email in one transaction.
+        # The background worker (scripts/worker.py) delivers it with retries.
         try:
-            submission = ContactSubmissionDAO.createSubmission(
+            ContactSubmissionDAO.createSubmission(
                 name=name,
                 email=email,
                 message=message,
-                ipAddress=ipAddress
+                ipAddress=ipAddress,
+                enqueueEmail=True
             )
         except Exception as e:
-            # Log error but don't fail - email still sends
+            # Database unavailable - send directly so the message is not lost
             print(f"ERROR: Failed to save contact submission to DB: {str(e)}", file=sys.stderr)
-
-        # Send email in background thread to reduce response latency (~200-500ms saved)
-        # User gets immediate response; email failures are logged but don't block
-        emailThread = threading.Thread(
-            target=_sendEmailInBackground,
-            args=(email, name, email, message)
-        )
-        emailThread.daemon = True
-        emailThread.start()
+            success, error = EmailService.sendEmail(
+                fromEmail=email,
+                name=name,
+                email=email,
+                message=message
+            )
+            if not success:
+                print(f"ERROR: Fallback email failed: {error}", file=sys.stderr)
 
         return jsonify({
             'success': True,
@@ -265,28 +249,36 @@ def getSubmissions():
 
     Query params:
         limit (int): Results per page (default 50, max 100)
-        offset (int): Pagination offset (default 0)
+        cursor (str): nextCursor from the previous page (keyset pagination)
+        offset (int): Legacy pagination offset, ignored when cursor is given (default 0)
         read (str): Filter by read status - 'all'|'read'|'unread' (default 'all')
         includeArchived (bool): Include archived submissions (default false)
 
     Returns:
-        200: { success: true, data: { submissions: [...], total: 123, limit: 50, offset: 0 } }
+        200: { success: true, data: { submissions: [...], total: 123, limit: 50, offset: 0, nextCursor: '...' } }
+             total is cached between inbox writes; nextCursor is null on the last page
+        400: Invalid cursor
         500: Server error
     """
     try:
         # Parse query parameters
         limit = min(int(request.args.get('limit', 50)), 100)
         offset = int(request.args.get('offset', 0))
+        cursor = request.args.get('cursor') or None
         readFilter = request.args.get('read', 'all')
         includeArchived = request.args.get('includeArchived', 'false').lower() == 'true'
 
         # Fetch submissions from database
-        submissions, total = ContactSubmissionDAO.getAllSubmissions(
-            limit=limit,
-            offset=offset,
-            readFilter=readFilter,
-            includeArchived=includeArchived
-        )
+        try:
+            submissions, total, nextCursor = ContactSubmissionDAO.getAllSubmissions(
+                limit=limit,
+                offset=offset,
+                readFilter=readFilter,
+                includeArchived=includeArchived,
+                cursor=cursor
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
 
         return jsonify({
             'success': True,
@@ -294,13 +286,85 @@ def getSubmissions():
                 'submissions': [s.toDict() for s in submissions],
                 'total': total,
                 'limit': limit,
-                'offset': offset
+                'offset': 0 if cursor else offset,
+                'nextCursor': nextCursor
             }
         }), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@contact_bp.route('/contact/submissions/bulk', methods=['POST'])
+@jwt_required()
+def bulkUpdateSubmissions():
+    """
+    Apply one inbox action to many submissions in a single UPDATE (admin only)
+
+    Request body (select by IDs):
+        {
+            "action": "markRead" | "markUnread" | "archive" | "unarchive",
+            "ids": [1, 2, 3]
+        }
+
+    Request body (select by filter, same semantics as GET /contact/submissions):
+        {
+            "action": "archive",
+            "filter": { "read": "unread", "includeArchived": false }
+        }
+        includeArchived must be a JSON boolean, and true for "unarchive".
+
+    Returns:
+        200: { success: true, data: { action: 'archive', affected: 42 } }
+        400: Invalid action, IDs or filter
+        500: Server error
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        action = data.get('action')
+        ids = data.get('ids')
+        filterSpec = data.get('filter')
+
+        if action not in ContactSubmissionDAO.BULK_ACTIONS:
+            return jsonify({
+                'success': False,
+                'error': f"action must be one of: {', '.join(ContactSubmissionDAO.BULK_ACTIONS)}"
+            }), 400
+
+        if (ids is None) == (filterSpec is None):
+            return jsonify({'success': False, 'error': 'Provide either ids or filter'}), 400
+
+        if ids is not None:
+            if not isinstance(ids, list) or not ids or not all(type(i) is int for i in ids):
+                return jsonify({'success': False, 'error': 'ids must be a non-empty list of integers'}), 400
+            if len(ids) > BULK_MAX_IDS:
+                return jsonify({'success': False, 'error': f'Too many ids (max {BULK_MAX_IDS})'}), 400
+            affected = ContactSubmissionDAO.bulkUpdate(action, submissionIds=list(set(ids)))
+        else:
+            if not isinstance(filterSpec, dict):
+                return jsonify({'success': False, 'error': 'filter must be an object'}), 400
+            readFilter = filterSpec.get('read', 'all')
+            if readFilter not in ('all', 'read', 'unread'):
+                return jsonify({'success': False, 'error': "filter.read must be 'all', 'read' or 'unread'"}), 400
+            includeArchived = filterSpec.get('includeArchived', False)
+            if not isinstance(includeArchived, bool):
+                return jsonify({'success': False, 'error': 'filter.includeArchived must be a boolean'}), 400
+            if action == 'unarchive' and not includeArchived:
+                # Without archived rows the filter could never match anything to unarchive
+                return jsonify({
+                    'success': False,
+                    'error': 'unarchive by filter requires filter.includeArchived to be true'
+                }), 400
+            affected = ContactSubmissionDAO.bulkUpdate(
+                action,
+                readFilter=readFilter,
+                includeArchived=includeArchived
+            )
+
+        return jsonify({'success': True, 'data': {'action': action, 'affected': affected}}), 200
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @contact_bp.route('/contact/submissions/<int:submissionId>', methods=['GET'])
 @jwt_required()
 def getSubmission(submissionId):
@@ -9,8 +9,8 @@ import shutil
 import sys
 import tarfile
 import threading
-import requests as httpx
 from flask import Blueprint, request, jsonify, send_file, abort
+from app.services.http_client import HttpClient
 
 docs_bp = Blueprint('docs', __name__)
 
@@ -42,7 +42,7 @@ def _downloadAndExtract(slug: str, repo: str, branch: str = 'main'):
         token = os.getenv('GITHUB_TOKEN')
         if token:
             headers['Authorization'] = f'Bearer {token}'
-        resp = httpx.get(url, headers=headers, timeout=30)
+        resp = HttpClient.get('github', url, headers=headers)
         resp.raise_for_status()
         data = resp.content
     except Exception as e:
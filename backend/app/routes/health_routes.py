@@ -36,6 +36,9 @@ def readinessCheck():
     - S3 client (if using S3 storage backend)
     - Storage service factory cache
 
+    Also reports per-host outbound HTTP latency and storage cache counters
+    for this worker process.
+
     Returns:
         200: All resources initialized and ready
         503: One or more resources failed to initialize
@@ -45,6 +48,7 @@ def readinessCheck():
         'storage': False
     }
     errors = []
+    caches = {}
 
     # Warm up database connection pool
     try:
@@ -66,6 +70,9 @@ def readinessCheck():
         if storageBackend == 's3':
             from app.services.s3_storage_service import S3StorageService
             S3StorageService._getS3Client()
+            caches['presignedUrls'] = S3StorageService.getPresignedUrlCacheStats()
+            from app.services.s3_disk_cache import S3DiskCache
+            caches['disk'] = S3DiskCache.getStats()
 
         status['storage'] = True
     except Exception as e:
@@ -74,9 +81,13 @@ def readinessCheck():
 
     allReady = all(status.values())
 
+    from app.services.http_client import HttpClient
+
     response = {
         'status': 'ready' if allReady else 'degraded',
-        'checks': status
+        'checks': status,
+        'outbound': HttpClient.getStats(),
+        'caches': caches
     }
 
     if errors:
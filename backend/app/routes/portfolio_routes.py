@@ -6,14 +6,41 @@ import re
 import traceback
 import sys
 import yaml
-from flask import Blueprint, request, jsonify, send_file, Response
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, verify_jwt_in_request
 from werkzeug.utils import secure_filename
 from app.dao import ProjectDAO
+from app.models import Project
 from app.services.storage_factory import getStorageService
+from app.services.storage_utils import getContentType, MAX_IMAGE_SIZE, PROJECT_IMAGES
+from app.services.image_processing import (
+    describeImage, selectVariant, parseRequestedWidth, acceptsWebp, validateImageMetadata
+)
+from app.utils.response_cache import getCacheVersion, getCachedResponse, setCachedResponse
+from app.utils.storage_serving import serveStoredObject, IMMUTABLE_CACHE_CONTROL
+from app.utils.upload_stream import rejectOversizedUpload
+from app.utils.conditional_get import (
+    computeEtag, isNotModified, notModifiedResponse, withValidators, conditionalJsonResponse
+)
 
 portfolio_bp = Blueprint('portfolio', __name__)
 
+# toDict() keys accepted in request bodies, mapped to model attributes
+PROJECT_PAYLOAD_ALIASES = {
+    'github_url': 'githubUrl',
+    'live_url': 'liveUrl',
+    'image_url': 'imageUrl',
+    'image_width': 'imageWidth',
+    'image_height': 'imageHeight',
+    'image_placeholder': 'imagePlaceholder',
+}
+IMAGE_METADATA_ATTRIBUTES = ('imageWidth', 'imageHeight', 'imagePlaceholder')
+
+
+def _normalizeProjectPayload(data):
+    """Accept both toDict() keys (image_url) and attribute names (imageUrl)"""
+    return {PROJECT_PAYLOAD_ALIASES.get(key, key): value for key, value in data.items()}
+
 
 @portfolio_bp.route('/portfolio', methods=['GET'])
 def getPortfolio():
@@ -22,32 +49,64 @@ def getPortfolio():
 
     Query params:
         includeHidden (bool): If true, returns all projects (requires JWT)
+        view (str): 'summary' (no Markdown content) or 'full'.
+            Defaults to 'summary' for the public list, 'full' for admins.
+        fields (str): Comma-separated toDict() keys to return (overrides view)
+        tech (str, repeatable): Only projects using all given technologies
+            (e.g. ?tech=Python&tech=Flask)
 
     Returns:
         200: List of projects (visible only or all if authenticated)
+        304: Not modified (public list only, If-None-Match matched)
+        400: Unknown view or field name
         500: Server error
     """
     try:
         includeHidden = request.args.get('includeHidden', 'false').lower() == 'true'
+        technologies = _parseTechnologies()
 
         if includeHidden:
             # Try to verify JWT - if valid, return all; if not, return only visible
             try:
                 verify_jwt_in_request()
-                projects = ProjectDAO.getAllProjects(includeHidden=True)
+                fields, error = _parseFieldset(defaultView='full')
+                if error:
+                    return jsonify({'success': False, 'error': error}), 400
+                projects = ProjectDAO.getAllProjects(
+                    includeHidden=True,
+                    includeContent=fields is None or 'content' in fields,
+                    technologies=technologies
+                )
+                return jsonify({
+                    'success': True,
+                    'data': [project.toDict(fields) for project in projects]
+                }), 200
             except:
-                # No valid JWT - return only visible
-                projects = ProjectDAO.getVisibleProjects()
-        else:
-            # Public view - only visible projects
-            projects = ProjectDAO.getVisibleProjects()
+                # No valid JWT - fall through to the public list
+                pass
 
-        portfolioItems = [project.toDict() for project in projects]
+        fields, error = _parseFieldset(defaultView='summary')
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
 
-        return jsonify({
-            'success': True,
-            'data': portfolioItems
-        }), 200
+        # Public view - only visible projects, served from the response cache
+        cacheKey = (fields, technologies)
+        cacheVersion = getCacheVersion(ProjectDAO.CACHE_NAMESPACE)
+        cached = getCachedResponse(ProjectDAO.CACHE_NAMESPACE, cacheKey)
+        if cached is None:
+            projects = ProjectDAO.getVisibleProjects(
+                includeContent=fields is None or 'content' in fields,
+                technologies=technologies
+            )
+            body = jsonify({
+                'success': True,
+                'data': [project.toDict(fields) for project in projects]
+            }).get_data()
+            cached = (computeEtag(body), body)
+            setCachedResponse(ProjectDAO.CACHE_NAMESPACE, cacheKey, cached, cacheVersion)
+
+        etag, body = cached
+        return conditionalJsonResponse(body, etag)
     except Exception as e:
         # Print full traceback to stderr for Render logs
         print("ERROR in /portfolio GET:", file=sys.stderr)
@@ -58,6 +117,96 @@ def getPortfolio():
         }), 500
 
 
+@portfolio_bp.route('/portfolio/facets', methods=['GET'])
+def getPortfolioFacets():
+    """
+    Get project counts per technology for visible projects (public endpoint)
+
+    Query params:
+        tech (str, repeatable): Only count projects already using all given
+            technologies (drill-down)
+
+    Returns:
+        200: { success: true, data: { technologies: [{ name: 'Python', count: 3 }, ...] } }
+        304: Not modified (If-None-Match matched)
+        500: Server error
+    """
+    try:
+        technologies = _parseTechnologies()
+
+        cacheKey = ('facets', technologies)
+        cacheVersion = getCacheVersion(ProjectDAO.CACHE_NAMESPACE)
+        cached = getCachedResponse(ProjectDAO.CACHE_NAMESPACE, cacheKey)
+        if cached is None:
+            facets = ProjectDAO.getTechnologyFacets(technologies=technologies)
+            body = jsonify({
+                'success': True,
+                'data': {
+                    'technologies': [{'name': name, 'count': count} for name, count in facets]
+                }
+            }).get_data()
+            cached = (computeEtag(body), body)
+            setCachedResponse(ProjectDAO.CACHE_NAMESPACE, cacheKey, cached, cacheVersion)
+
+        etag, body = cached
+        return conditionalJsonResponse(body, etag)
+    except Exception as e:
+        print("ERROR in /portfolio/facets:", file=sys.stderr)
+        print(traceback.format_exc(), file=sys.stderr)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@portfolio_bp.route('/portfolio/search', methods=['GET'])
+def searchPortfolio():
+    """
+    Full-text search over visible projects (public endpoint)
+
+    Query params:
+        q (str): Search query, web-search syntax (quotes, OR, -exclude)
+        limit (int): Max results (default 20, max 50)
+
+    Returns:
+        200: Ranked results - project summary plus 'rank' and a 'snippet'
+             with matches wrapped in <mark></mark>
+        304: Not modified (If-None-Match matched)
+        400: Missing or too long query, or non-integer limit
+        500: Server error
+    """
+    try:
+        queryText = request.args.get('q', '').strip()
+        if not queryText:
+            return jsonify({'success': False, 'error': 'Search query is required'}), 400
+        if len(queryText) > 200:
+            return jsonify({'success': False, 'error': 'Search query too long (max 200 characters)'}), 400
+
+        try:
+            limit = min(max(int(request.args.get('limit', 20)), 1), 50)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'limit must be an integer'}), 400
+
+        cacheKey = ('search', queryText, limit)
+        cacheVersion = getCacheVersion(ProjectDAO.CACHE_NAMESPACE)
+        cached = getCachedResponse(ProjectDAO.CACHE_NAMESPACE, cacheKey)
+        if cached is None:
+            results = ProjectDAO.searchProjects(queryText, limit=limit)
+            body = jsonify({
+                'success': True,
+                'data': [
+                    {**project.toDict(Project.SUMMARY_FIELDS), 'rank': float(rank), 'snippet': snippet}
+                    for project, rank, snippet in results
+                ]
+            }).get_data()
+            cached = (computeEtag(body), body)
+            setCachedResponse(ProjectDAO.CACHE_NAMESPACE, cacheKey, cached, cacheVersion)
+
+        etag, body = cached
+        return conditionalJsonResponse(body, etag)
+    except Exception as e:
+        print("ERROR in /portfolio/search:", file=sys.stderr)
+        print(traceback.format_exc(), file=sys.stderr)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @portfolio_bp.route('/portfolio', methods=['POST'])
 @jwt_required()
 def createProject():
@@ -73,18 +222,25 @@ def createProject():
             "technologies": ["Tech1", "Tech2"],
             "githubUrl": "https://github.com/...",  # optional
             "liveUrl": "https://...",  # optional
-            "imageUrl": "https://..."  # optional
+            "imageUrl": "https://...",  # optional
+            "imageWidth": 1600,  # optional, from the upload response
+            "imageHeight": 900,  # optional
+            "imagePlaceholder": "data:image/webp;base64,..."  # optional
         }
 
     Returns:
         201: Project created successfully
-        400: Missing required fields
+        400: Missing required fields, malformed image metadata, or the
+             uploaded image is no longer stored (upload it again)
         500: Server error
     """
-    data = request.get_json()
+    data = _normalizeProjectPayload(request.get_json() or {})
     required = ['title', 'description', 'technologies']
     if not all(f in data for f in required):
         return jsonify({'success': False, 'error': 'Missing required fields'}), 400
+    error = validateImageMetadata(data, IMAGE_METADATA_ATTRIBUTES)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
 
     try:
         project = ProjectDAO.createProject(
@@ -95,9 +251,14 @@ def createProject():
             liveUrl=data.get('liveUrl'),
             imageUrl=data.get('imageUrl'),
             content=data.get('content'),
-            docsSlug=data.get('docsSlug')
+            docsSlug=data.get('docsSlug'),
+            imageWidth=data.get('imageWidth'),
+            imageHeight=data.get('imageHeight'),
+            imagePlaceholder=data.get('imagePlaceholder')
         )
         return jsonify({'success': True, 'data': project.toDict()}), 201
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -110,16 +271,34 @@ def getProjectById(projectId):
     Args:
         projectId (int): ID of the project
 
+    Query params:
+        view (str): 'summary' (no Markdown content) or 'full' (default)
+        fields (str): Comma-separated toDict() keys to return (overrides view)
+
     Returns:
         200: Project data
+        304: Not modified (If-None-Match matched)
+        400: Unknown view or field name
         404: Project not found
         500: Server error
     """
     try:
-        project = ProjectDAO.getProjectById(projectId)
+        fields, error = _parseFieldset(defaultView='full')
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+
+        project = ProjectDAO.getProjectById(
+            projectId,
+            includeContent=fields is None or 'content' in fields
+        )
         if not project:
             return jsonify({'success': False, 'error': 'Project not found'}), 404
-        return jsonify({'success': True, 'data': project.toDict()}), 200
+
+        etag = computeEtag('project', project.id, project.updatedAt, fields)
+        if isNotModified(etag):
+            return notModifiedResponse(etag)
+
+        return withValidators(jsonify({'success': True, 'data': project.toDict(fields)}), etag)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -140,13 +319,18 @@ def updateProject(projectId):
 
     Returns:
         200: Project updated successfully
-        400: No data provided
+        400: No data provided, malformed image metadata, or the uploaded
+             image is no longer stored (upload it again)
         404: Project not found
         500: Server error
     """
     data = request.get_json()
     if not data:
         return jsonify({'success': False, 'error': 'No data provided'}), 400
+    data = _normalizeProjectPayload(data)
+    error = validateImageMetadata(data, IMAGE_METADATA_ATTRIBUTES)
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
 
     try:
         # Get current project to check if image is being replaced
@@ -155,18 +339,22 @@ def updateProject(projectId):
             return jsonify({'success': False, 'error': 'Project not found'}), 404
 
         oldImageUrl = currentProject.imageUrl
-        newImageUrl = data.get('imageUrl')
+        # A partial update that leaves imageUrl out keeps the current image
+        imageReplaced = 'imageUrl' in data and data['imageUrl'] != oldImageUrl
+
+        # A new image without metadata must not keep the old image's size/placeholder
+        if imageReplaced:
+            for attribute in IMAGE_METADATA_ATTRIBUTES:
+                data.setdefault(attribute, None)
 
-        # Update the project
+        # Update the project; a replaced image is queued for deletion in the same commit
         project = ProjectDAO.updateProject(projectId, **data)
         if not project:
             return jsonify({'success': False, 'error': 'Project not found'}), 404
 
-        # Delete old image if it was replaced with a different one
-        if oldImageUrl and newImageUrl != oldImageUrl:
-            _deleteImageFromStorage(oldImageUrl)
-
         return jsonify({'success': True, 'data': project.toDict()}), 200
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -176,7 +364,7 @@ def updateProject(projectId):
 def deleteProject(projectId):
     """
     Delete a portfolio project (admin only)
-    Also deletes the associated image from storage
+    Also queues the associated image for deletion from storage
 
     Requires: Valid JWT access token
 
@@ -189,22 +377,11 @@ def deleteProject(projectId):
         500: Server error
     """
     try:
-        # Get project first to retrieve image URL for deletion
-        project = ProjectDAO.getProjectById(projectId)
-        if not project:
-            return jsonify({'success': False, 'error': 'Project not found'}), 404
-
-        imageUrl = project.imageUrl
-
-        # Delete from database
+        # Delete from database; the image is queued for deletion in the same commit
         success = ProjectDAO.deleteProject(projectId)
         if not success:
             return jsonify({'success': False, 'error': 'Project not found'}), 404
 
-        # Delete image from storage if exists
-        if imageUrl:
-            _deleteImageFromStorage(imageUrl)
-
         return jsonify({'success': True, 'message': 'Project deleted'}), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -253,8 +430,9 @@ def reorderProjects():
         }
 
     Returns:
-        200: Order updated successfully
+        200: Order updated successfully, data holds the new ordering
         400: Missing or invalid data
+        404: One or more projects not found (nothing is changed)
         500: Server error
     """
     try:
@@ -264,8 +442,23 @@ def reorderProjects():
         if not orderUpdates:
             return jsonify({'success': False, 'error': 'No order updates provided'}), 400
 
-        ProjectDAO.updateDisplayOrder(orderUpdates)
-        return jsonify({'success': True, 'message': 'Order updated'}), 200
+        isWellFormed = all(
+            isinstance(u, dict)
+            and type(u.get('id')) is int
+            and type(u.get('displayOrder')) is int
+            for u in orderUpdates
+        )
+        if not isWellFormed:
+            return jsonify({'success': False, 'error': 'Each update needs integer id and displayOrder'}), 400
+
+        if len({u['id'] for u in orderUpdates}) != len(orderUpdates):
+            return jsonify({'success': False, 'error': 'Duplicate project IDs in order updates'}), 400
+
+        ordering = ProjectDAO.updateDisplayOrder(orderUpdates)
+        if ordering is None:
+            return jsonify({'success': False, 'error': 'One or more projects not found'}), 404
+
+        return jsonify({'success': True, 'message': 'Order updated', 'data': ordering}), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -282,22 +475,34 @@ def uploadProjectImage():
     Request: multipart/form-data with 'file' field
 
     Returns:
-        200: Image uploaded successfully
+        200: Image uploaded (URL plus imageWidth, imageHeight and a base64
+            imagePlaceholder to send back when saving the project)
         400: No file provided or validation failed
+        413: File too large
         500: Server error
     """
-    try:
-        if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'No file provided'}), 400
+    # Refuse oversized bodies from Content-Length, before parsing the form
+    tooLarge = rejectOversizedUpload(MAX_IMAGE_SIZE)
+    if tooLarge:
+        return tooLarge
 
-        file = request.files['file']
+    # Parsed outside the try below: a body without Content-Length that runs past
+    # MAX_CONTENT_LENGTH raises RequestEntityTooLarge here, answered by the 413 handler
+    if 'file' not in request.files:
+        return jsonify({'success': False, 'error': 'No file provided'}), 400
 
+    file = request.files['file']
+
+    try:
         # Validate image
         StorageService = getStorageService()
         isValid, error = StorageService.validateImage(file)
         if not isValid:
             return jsonify({'success': False, 'error': error}), 400
 
+        # Intrinsic size and blur placeholder, computed once here
+        imageInfo = describeImage(file) or {}
+
         # Save image using storage factory
         originalFilename, storagePath, fileSize = StorageService.saveProjectImage(file)
 
@@ -310,7 +515,10 @@ def uploadProjectImage():
             'data': {
                 'imageUrl': imageUrl,
                 'fileName': originalFilename,
-                'fileSize': fileSize
+                'fileSize': fileSize,
+                'imageWidth': imageInfo.get('width'),
+                'imageHeight': imageInfo.get('height'),
+                'imagePlaceholder': imageInfo.get('placeholder')
             }
         }), 200
     except Exception as e:
@@ -321,11 +529,15 @@ def uploadProjectImage():
 def serveProjectImage(filename):
     """
     Serve project image file (public endpoint)
-    Handles both local storage and S3 backend
+    Any storage backend; supports ETag/If-Modified-Since and Range requests
 
     Args:
         filename (str): Name of the image file
 
+    Query params:
+        w (int): Display width in px - serves the nearest larger variant
+            (WebP if the Accept header lists image/webp)
+
     Returns:
         200: Image file
         404: Image not found
@@ -333,40 +545,26 @@ def serveProjectImage(filename):
     """
     try:
         filename = secure_filename(filename)
-        storageBackend = os.getenv('STORAGE_BACKEND', 'local').lower()
-
         StorageService = getStorageService()
-        if storageBackend == 's3':
-            import requests
-
-            s3Key = f"projects/{filename}"
-            presignedUrl = StorageService.getFilePath(s3Key)
-
-            s3Response = requests.get(presignedUrl, stream=True)
-
-            if s3Response.status_code != 200:
-                return jsonify({'success': False, 'error': 'Image not found'}), 404
-
-            ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else 'jpeg'
-            contentTypeMap = {
-                'jpg': 'image/jpeg', 'jpeg': 'image/jpeg',
-                'png': 'image/png', 'webp': 'image/webp', 'gif': 'image/gif'
-            }
-            contentType = contentTypeMap.get(ext, 'image/jpeg')
 
-            return Response(
-                s3Response.iter_content(chunk_size=8192),
-                content_type=contentType,
-                headers={'Cache-Control': 'public, max-age=31536000'}
-            )
-        else:
-            relativePath = f"uploads/projects/{filename}"
-            filePath = StorageService.getFilePath(relativePath)
+        # Pick a responsive variant from ?w= and Accept (falls back to the original)
+        filename = selectVariant(
+            filename,
+            parseRequestedWidth(request.args.get('w')),
+            acceptsWebp(request.headers.get('Accept')),
+            lambda name: StorageService.fileExists(StorageService.objectKey(PROJECT_IMAGES, name))
+        )
 
-            if not os.path.exists(filePath):
-                return jsonify({'success': False, 'error': 'Image not found'}), 404
+        response = serveStoredObject(
+            StorageService.objectKey(PROJECT_IMAGES, filename),
+            getContentType(filename),
+            cacheControl=IMMUTABLE_CACHE_CONTROL
+        )
+        if response is None:
+            return jsonify({'success': False, 'error': 'Image not found'}), 404
 
-            return send_file(filePath)
+        response.vary.add('Accept')
+        return response
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -381,11 +579,12 @@ def getProjectDeepDive(projectId):
 
     Returns:
         200: {"success": true, "content": "<markdown>", "toc": [...]}
+        304: Not modified (If-None-Match matched)
         404: Project not found or no docs configured
         500: Server error
     """
     try:
-        project = ProjectDAO.getProjectById(projectId)
+        project = ProjectDAO.getProjectById(projectId, includeContent=False)
         if not project:
             return jsonify({'success': False, 'error': 'Project not found'}), 404
 
@@ -402,6 +601,11 @@ def getProjectDeepDive(projectId):
         if not os.path.isfile(mdPath):
             return jsonify({'success': False, 'error': 'Docs not available'}), 404
 
+        mdStat = os.stat(mdPath)
+        etag = computeEtag('deep-dive', project.docsSlug, mdStat.st_mtime_ns, mdStat.st_size)
+        if isNotModified(etag):
+            return notModifiedResponse(etag)
+
         with open(mdPath, 'r', encoding='utf-8') as f:
             raw = f.read()
 
@@ -410,13 +614,41 @@ def getProjectDeepDive(projectId):
 
         content = content.replace('](assets/', f'](/api/docs/{project.docsSlug}/assets/')
 
-        return jsonify({'success': True, 'content': content, 'toc': toc}), 200
+        return withValidators(jsonify({'success': True, 'content': content, 'toc': toc}), etag)
     except Exception as e:
         print(f"ERROR in /portfolio/{projectId}/deep-dive:", file=sys.stderr)
         print(traceback.format_exc(), file=sys.stderr)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _parseFieldset(defaultView):
+    """
+    Resolve ?fields= / ?view= into the toDict() keys to return.
+
+    Returns (fields, error). fields is None for the full representation,
+    otherwise a sorted tuple usable as a cache key.
+    """
+    fieldsParam = request.args.get('fields')
+    if fieldsParam:
+        fields = tuple(sorted({f.strip() for f in fieldsParam.split(',') if f.strip()}))
+        unknown = [f for f in fields if f not in Project.FIELDS]
+        if unknown:
+            return None, f"Unknown fields: {', '.join(unknown)}"
+        return fields, None
+
+    view = request.args.get('view', defaultView).lower()
+    if view == 'full':
+        return None, None
+    if view == 'summary':
+        return Project.SUMMARY_FIELDS, None
+    return None, "view must be 'summary' or 'full'"
+
+
+def _parseTechnologies():
+    """Read repeatable ?tech= params as a sorted, de-duplicated tuple (cache-key friendly)"""
+    return tuple(sorted({t.strip() for t in request.args.getlist('tech') if t.strip()}))
+
+
 def _parseFrontmatter(raw: str):
     """Parse YAML frontmatter from a markdown string.
 
@@ -431,26 +663,3 @@ def _parseFrontmatter(raw: str):
         meta = {}
     content = match.group(2).strip()
     return meta, content
-
-
-def _deleteImageFromStorage(imageUrl):
-    """
-    Helper to delete an image from storage
-    Handles both local and S3 backends
-    """
-    try:
-        if not imageUrl:
-            return
-
-        filename = imageUrl.split('/')[-1]
-        storageBackend = os.getenv('STORAGE_BACKEND', 'local').lower()
-
-        StorageService = getStorageService()
-        if storageBackend == 's3':
-            s3Key = f"projects/{filename}"
-            StorageService.deleteFile(s3Key)
-        else:
-            relativePath = f"uploads/projects/{filename}"
-            StorageService.deleteFile(relativePath)
-    except Exception as e:
-        print(f"Warning: Failed to delete image {imageUrl}: {str(e)}", file=sys.stderr)
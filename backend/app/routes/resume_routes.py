@@ -1,20 +1,31 @@
 """
 Resume/CV routes - public viewing and admin update operations
 """
-import os
 import sys
 import traceback
+from collections import namedtuple
+from datetime import timezone
 
-import requests
-from flask import Blueprint, request, jsonify, send_file, Response
+from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.dao import ResumeDAO
 from app.dao.resume_pdf_dao import ResumePdfDAO
 from app.services.storage_factory import getStorageService
+from app.services.storage_utils import MAX_FILE_SIZE, pdfThumbnailKey
+from app.utils.upload_stream import rejectOversizedUpload
+from app.utils.response_cache import getCacheVersion, getCachedResponse, setCachedResponse
+from app.utils.storage_serving import serveStoredObject, IMMUTABLE_CACHE_CONTROL
+from app.utils.conditional_get import (
+    PUBLIC_REVALIDATE, computeEtag, isNotModified, notModifiedResponse, withValidators,
+    conditionalJsonResponse
+)
 
 resume_bp = Blueprint('resume', __name__)
 
+# Plain copy of the active version's file fields, safe to share across requests
+ActivePdf = namedtuple('ActivePdf', ['id', 'fileName', 'filePath', 'fileSize', 'createdAt'])
+
 
 @resume_bp.route('/cv', methods=['GET'])
 def getCv():
@@ -23,6 +34,7 @@ def getCv():
 
     Returns:
         200: Resume data
+        304: Not modified (If-None-Match matched)
         404: Resume not found
         500: Server error
     """
@@ -35,12 +47,16 @@ def getCv():
                 'error': 'No resume data found. Please run the seed script.'
             }), 404
 
+        etag = computeEtag('cv', resume.id, resume.updatedAt)
+        if isNotModified(etag):
+            return notModifiedResponse(etag)
+
         cvData = resume.toDict()
 
-        return jsonify({
+        return withValidators(jsonify({
             'success': True,
             'data': cvData
-        }), 200
+        }), etag)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -95,6 +111,33 @@ def updateCv():
 # PDF RESUME ENDPOINTS
 # ========================================
 
+def _resolveActivePdf():
+    """
+    Active version's file fields and serialized /cv/pdf body, from the
+    response cache (invalidated by ResumePdfDAO writes; previews written by
+    the worker show up once the entry expires)
+
+    Returns:
+        tuple: (ActivePdf or None when no version is active, etag, body)
+    """
+    cacheVersion = getCacheVersion(ResumePdfDAO.CACHE_NAMESPACE)
+    cached = getCachedResponse(ResumePdfDAO.CACHE_NAMESPACE, ('active',))
+    if cached is None:
+        activePdf = ResumePdfDAO.getActivePdf()
+        if activePdf:
+            body = jsonify({'success': True, 'data': activePdf.toDict()}).get_data()
+            cached = (
+                ActivePdf(activePdf.id, activePdf.fileName, activePdf.filePath,
+                          activePdf.fileSize, activePdf.createdAt),
+                computeEtag(body),
+                body
+            )
+        else:
+            cached = (None, None, None)
+        setCachedResponse(ResumePdfDAO.CACHE_NAMESPACE, ('active',), cached, cacheVersion)
+    return cached
+
+
 @resume_bp.route('/cv/pdf', methods=['GET'])
 def getActivePdf():
     """
@@ -102,11 +145,12 @@ def getActivePdf():
 
     Returns:
         200: PDF metadata (JSON)
+        304: Not modified (If-None-Match matched)
         404: No active PDF found
         500: Server error
     """
     try:
-        activePdf = ResumePdfDAO.getActivePdf()
+        activePdf, etag, body = _resolveActivePdf()
 
         if not activePdf:
             return jsonify({
@@ -114,10 +158,7 @@ def getActivePdf():
                 'error': 'No resume PDF available'
             }), 404
 
-        return jsonify({
-            'success': True,
-            'data': activePdf.toDict()
-        }), 200
+        return conditionalJsonResponse(body, etag)
     except Exception as e:
         # Print full traceback to stderr for Render logs
         print("ERROR in /cv/pdf:", file=sys.stderr)
@@ -134,67 +175,119 @@ def getPdfFile():
     Serve the active PDF resume file (public endpoint)
     Supports ?download=true query parameter to force download
 
+    Validators come from the active ResumePdfVersion row, so If-None-Match /
+    If-Modified-Since are answered before storage is touched. Byte ranges
+    let PDF.js fetch only the pages it renders. HEAD is served by Flask
+    from the GET handler.
+
     Query params:
         download (bool): If true, serves as attachment (forces download)
+        v (int): Active version id; a matching id makes the response immutable
 
     Returns:
         200: PDF file (inline or download based on query param)
+        206: Requested byte range
+        304: Not modified (If-None-Match / If-Modified-Since matched)
         404: No active PDF or file not found
         500: Server error
     """
     try:
-        activePdf = ResumePdfDAO.getActivePdf()
+        activePdf, _, _ = _resolveActivePdf()
         if not activePdf:
             return jsonify({'success': False, 'error': 'No resume PDF available'}), 404
 
-        StorageService = getStorageService()
-        filePath = StorageService.getFilePath(activePdf.filePath)
-        storageBackend = os.getenv('STORAGE_BACKEND', 'local').lower()
+        # ?v=<id> names one version's bytes, which never change; the bare URL
+        # follows the active version and must be revalidated on every use
+        versioned = request.args.get('v') == str(activePdf.id)
+        return _servePdfVersion(activePdf, immutable=versioned)
+    except Exception as e:
+        print("ERROR in /cv/pdf/file:", file=sys.stderr)
+        print(traceback.format_exc(), file=sys.stderr)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 
-        if storageBackend == 's3':
-            return _serveS3Pdf(filePath, activePdf.fileName)
+@resume_bp.route('/cv/pdf/versions/<int:versionId>/file', methods=['GET'])
+def getPdfVersionFile(versionId):
+    """
+    Serve one PDF version's file (public endpoint)
+    A version's file never changes, so the response is cacheable forever;
+    /api/cv/pdf names the active version's URL (fileUrl).
+
+    Args:
+        versionId (int): Version ID
 
-        return _serveLocalPdf(filePath, activePdf.fileName)
+    Query params:
+        download (bool): If true, serves as attachment (forces download)
+
+    Returns:
+        200: PDF file
+        206: Requested byte range
+        304: Not modified (If-None-Match / If-Modified-Since matched)
+        404: Version not found, deleted, or file missing
+        500: Server error
+    """
+    try:
+        version = ResumePdfDAO.getVersionById(versionId)
+        if not version or version.deletedAt is not None:
+            return jsonify({'success': False, 'error': 'PDF version not found'}), 404
+        return _servePdfVersion(version, immutable=True)
     except Exception as e:
-        print("ERROR in /cv/pdf/file:", file=sys.stderr)
+        print(f"ERROR in /cv/pdf/versions/{versionId}/file:", file=sys.stderr)
         print(traceback.format_exc(), file=sys.stderr)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-def _serveS3Pdf(s3Url, fileName):
-    """Proxy PDF from S3 to avoid CORS issues with react-pdf"""
-    s3Response = requests.get(s3Url, stream=True)
-    if s3Response.status_code != 200:
-        return jsonify({'success': False, 'error': 'Failed to fetch PDF from storage'}), 500
-
-    return Response(
-        s3Response.iter_content(chunk_size=8192),
-        content_type='application/pdf',
-        headers={
-            'Content-Disposition': f'inline; filename="{fileName}"',
-            'Cache-Control': 'no-cache, no-store, must-revalidate',
-            'Pragma': 'no-cache',
-            'Expires': '0'
-        }
-    )
+@resume_bp.route('/cv/pdf/versions/<int:versionId>/thumbnail', methods=['GET'])
+def getPdfVersionThumbnail(versionId):
+    """
+    Serve a PDF version's first-page thumbnail (public endpoint)
+    Generated by the background worker after upload; thumbnailUrl in the
+    version's metadata is null until then.
+
+    Args:
+        versionId (int): Version ID
 
+    Returns:
+        200: WebP thumbnail
+        304: Not modified (If-None-Match / If-Modified-Since matched)
+        404: Version not found or deleted, or no thumbnail yet
+        500: Server error
+    """
+    try:
+        version = ResumePdfDAO.getVersionById(versionId)
+        # thumbnailUrl is None for deleted versions and versions without a thumbnail
+        if not version or version.thumbnailUrl is None:
+            return jsonify({'success': False, 'error': 'Thumbnail not found'}), 404
+
+        response = serveStoredObject(
+            pdfThumbnailKey(version.filePath),
+            'image/webp',
+            cacheControl=IMMUTABLE_CACHE_CONTROL
+        )
+        if response is None:
+            return jsonify({'success': False, 'error': 'Thumbnail not found'}), 404
+        return response
+    except Exception as e:
+        print(f"ERROR in /cv/pdf/versions/{versionId}/thumbnail:", file=sys.stderr)
+        print(traceback.format_exc(), file=sys.stderr)
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-def _serveLocalPdf(filePath, fileName):
-    """Serve PDF from local filesystem"""
-    if not os.path.exists(filePath):
-        return jsonify({'success': False, 'error': 'PDF file not found on server'}), 404
 
+def _servePdfVersion(version, immutable):
+    """Serve a version's stored file with validators taken from its row"""
     download = request.args.get('download', 'false').lower() == 'true'
-    response = send_file(
-        filePath,
-        mimetype='application/pdf',
-        as_attachment=download,
-        download_name=fileName
+    response = serveStoredObject(
+        version.filePath,
+        'application/pdf',
+        cacheControl=IMMUTABLE_CACHE_CONTROL if immutable else PUBLIC_REVALIDATE,
+        redirectCacheControl=None if immutable else 'no-store',
+        downloadName=version.fileName,
+        asAttachment=download,
+        etag=computeEtag('cv-pdf-file', version.filePath, version.fileSize),
+        lastModified=version.createdAt.replace(tzinfo=timezone.utc)
     )
-    # Prevent browser caching - rely on version query param for cache busting
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
+    if response is None:
+        return jsonify({'success': False, 'error': 'PDF file not found on server'}), 404
     return response
 
 
@@ -204,6 +297,8 @@ def uploadPdf():
     """
     Upload new PDF resume (admin only)
     Automatically sets as active version and deactivates others
+    The new version's preview (thumbnail, page count, text layer) is
+    generated by the background worker; previewStatus is 'pending' until then
 
     Requires: Valid JWT access token
 
@@ -218,6 +313,11 @@ def uploadPdf():
     # Debug: Log that we got past JWT verification
     print(f"DEBUG: uploadPdf - JWT verification passed, user ID: {get_jwt_identity()}", file=sys.stderr)
 
+    # Refuse oversized bodies from Content-Length, before parsing the form
+    tooLarge = rejectOversizedUpload(MAX_FILE_SIZE)
+    if tooLarge:
+        return tooLarge
+
     # Check if file in request
     if 'file' not in request.files:
         return jsonify({'success': False, 'error': 'No file provided'}), 400
@@ -261,24 +361,45 @@ def uploadPdf():
 @jwt_required()
 def getPdfHistory():
     """
-    Get all PDF version history (admin only)
+    Get PDF version history, one page at a time (admin only)
 
     Requires: Valid JWT access token
 
     Query params:
         includeDeleted (bool): Include soft-deleted versions (default: false)
+        limit (int): Versions per page (default 20, max 100)
+        cursor (str): nextCursor from the previous page (keyset pagination)
 
     Returns:
-        200: List of all PDF versions (newest first)
+        200: { success: true, data: { versions: [...], limit: 20, nextCursor: '...' } }
+             versions are newest first; nextCursor is null on the last page
+        400: Invalid cursor or non-integer limit
         500: Server error
     """
     try:
         includeDeleted = request.args.get('includeDeleted', 'false').lower() == 'true'
-        versions = ResumePdfDAO.getAllVersions(includeDeleted=includeDeleted)
+        try:
+            limit = max(min(int(request.args.get('limit', 20)), 100), 1)
+        except ValueError:
+            return jsonify({'success': False, 'error': 'limit must be an integer'}), 400
+        cursor = request.args.get('cursor') or None
+
+        try:
+            versions, nextCursor = ResumePdfDAO.getAllVersions(
+                includeDeleted=includeDeleted,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
 
         return jsonify({
             'success': True,
-            'data': [v.toDict() for v in versions]
+            'data': {
+                'versions': [v.toDict() for v in versions],
+                'limit': limit,
+                'nextCursor': nextCursor
+            }
         }), 200
     except Exception as e:
         return jsonify({
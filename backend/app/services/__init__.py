@@ -2,5 +2,9 @@ from app.services.email_service import EmailService
 from app.services.auth_service import AuthService
 from app.services.google_oauth_service import GoogleOAuthService
 from app.services.recaptcha_verification_service import RecaptchaVerificationService
+from app.services.email_outbox_service import EmailOutboxService
+from app.services.http_client import HttpClient
+from app.services.storage_deletion_service import StorageDeletionService
+from app.services.pdf_preview_service import PdfPreviewService
 
-__all__ = ['EmailService', 'AuthService', 'GoogleOAuthService', 'RecaptchaVerificationService']
+__all__ = ['EmailService', 'AuthService', 'GoogleOAuthService', 'RecaptchaVerificationService', 'EmailOutboxService', 'HttpClient', 'StorageDeletionService', 'PdfPreviewService']
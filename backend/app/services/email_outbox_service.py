@@ -0,0 +1,62 @@
+"""
+Email outbox service - delivers queued contact notification emails.
+Runs in the background worker process (scripts/worker.py), never in a request.
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from app.dao.email_outbox_dao import EmailOutboxDAO
+from app.services.email_service import EmailService
+
+
+class EmailOutboxService:
+    """Service class for draining the email outbox"""
+
+    BATCH_SIZE = 20
+    # Parallel SendGrid calls per batch (matches the sendgrid pool in HttpClient)
+    SEND_CONCURRENCY = 4
+
+    @staticmethod
+    def _send(claimed):
+        """
+        Send one claimed message
+
+        Returns:
+            tuple: (message id, error str or None)
+        """
+        try:
+            success, error = EmailService.sendEmail(
+                fromEmail=claimed['email'],
+                name=claimed['name'],
+                email=claimed['email'],
+                message=claimed['message']
+            )
+        except Exception as e:
+            success, error = False, str(e)
+
+        if success:
+            return (claimed['id'], None)
+        print(f"ERROR: Outbox email {claimed['id']} failed (attempt {claimed['attempt']}): {error}", file=sys.stderr)
+        return (claimed['id'], error or 'Unknown error')
+
+    @staticmethod
+    def processBatch(batchSize=None):
+        """
+        Claim one batch of due messages, send them and record the outcome.
+        Sends run SEND_CONCURRENCY at a time between two short commits, so
+        no row lock is held across the SendGrid calls.
+
+        Args:
+            batchSize (int, optional): Max messages to send (default BATCH_SIZE)
+
+        Returns:
+            int: Number of messages attempted (0 when the outbox is idle)
+        """
+        claimed = EmailOutboxDAO.claimDueMessages(limit=batchSize or EmailOutboxService.BATCH_SIZE)
+        if not claimed:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=EmailOutboxService.SEND_CONCURRENCY) as executor:
+            results = list(executor.map(EmailOutboxService._send, claimed))
+
+        EmailOutboxDAO.recordResults(results)
+        return len(results)
@@ -1,14 +1,16 @@
 """
 Email service for sending emails via SendGrid
 """
-from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
+from app.services.http_client import HttpClient
 import os
 
 
 class EmailService:
     """Service class for handling email operations"""
 
+    SENDGRID_SEND_URL = 'https://api.sendgrid.com/v3/mail/send'
+
     @staticmethod
     def _getContent(name: str, email: str, message: str):
 
@@ -66,8 +68,16 @@ class EmailService:
             # Set reply-to to the sender's email
             mailMessage.reply_to = fromEmail
 
-            sg = SendGridAPIClient(sendgridApiKey)
-            sg.send(mailMessage)
+            # Post the v3 payload over the shared keep-alive session
+            # (SendGridAPIClient opens a new connection per send)
+            response = HttpClient.post(
+                'sendgrid',
+                EmailService.SENDGRID_SEND_URL,
+                json=mailMessage.get(),
+                headers={'Authorization': f'Bearer {sendgridApiKey}'}
+            )
+            if response.status_code >= 400:
+                return (False, f'SendGrid error {response.status_code}: {response.text[:200]}')
 
             return (True, None)
 
@@ -2,10 +2,18 @@
 File Storage Service - Local disk file storage operations
 """
 import os
+import shutil
+import tempfile
 import uuid
+from datetime import datetime, timezone
 from werkzeug.utils import secure_filename
 from werkzeug.datastructures import FileStorage
-from app.services.storage_utils import validateFile as _validateFile, validateImage as _validateImage
+from app.services.storage_utils import (
+    validateFile as _validateFile, validateImage as _validateImage,
+    CONTENT_ADDRESSED_STORAGE, HASH_CHUNK_SIZE, contentAddressedFilename, hashFile,
+    getContentType, StoredObject
+)
+from app.services.image_processing import generateVariants
 
 
 class FileStorageService:
@@ -35,8 +43,12 @@ class FileStorageService:
             errorMsg: Error message prefix
 
         Returns:
-            tuple: (original_filename, relative_path, file_size)
+            tuple: (original_filename, relative_path, file_size, written)
+            where written is False if identical content was already stored
         """
+        if CONTENT_ADDRESSED_STORAGE:
+            return cls._saveContentAddressed(file, subdir, errorMsg)
+
         try:
             originalFilename = secure_filename(file.filename)
             uniqueId = uuid.uuid4().hex[:12]
@@ -49,10 +61,60 @@ class FileStorageService:
             fileSize = os.path.getsize(absolutePath)
             relativePath = os.path.join(cls.UPLOAD_DIR, subdir, filename)
 
-            return originalFilename, relativePath, fileSize
+            return originalFilename, relativePath, fileSize, True
         except Exception as e:
             raise Exception(f"{errorMsg}: {str(e)}")
 
+    @classmethod
+    def _saveContentAddressed(cls, file, subdir, errorMsg):
+        """
+        Keep the upload under '<sha256>.<ext>', or skip writing it if that
+        content is already stored. The hash comes from the upload stream, so
+        new content is read once - into a temp file renamed into place. The
+        blob is marked written only after the rename, so an identical upload
+        racing this one (or following a failed write) writes the file again.
+        """
+        from app.dao.storage_blob_dao import StorageBlobDAO
+
+        tmpPath = None
+        try:
+            originalFilename = secure_filename(file.filename)
+            uploadDir = cls._getUploadDir(subdir)
+
+            sha256, fileSize = hashFile(file)
+            filename = contentAddressedFilename(sha256, originalFilename)
+            relativePath = os.path.join(cls.UPLOAD_DIR, subdir, filename)
+
+            if StorageBlobDAO.register(relativePath, sha256, fileSize):
+                return originalFilename, relativePath, fileSize, False
+
+            fd, tmpPath = tempfile.mkstemp(dir=uploadDir, prefix='.upload-')
+            with os.fdopen(fd, 'wb') as tmpFile:
+                file.seek(0)
+                shutil.copyfileobj(file.stream, tmpFile, HASH_CHUNK_SIZE)
+            file.seek(0)
+            os.replace(tmpPath, os.path.join(uploadDir, filename))
+            tmpPath = None
+            StorageBlobDAO.markWritten(relativePath)
+
+            return originalFilename, relativePath, fileSize, True
+        except Exception as e:
+            raise Exception(f"{errorMsg}: {str(e)}")
+        finally:
+            if tmpPath and os.path.exists(tmpPath):
+                os.remove(tmpPath)
+
+    @classmethod
+    def _saveImageToDir(cls, file, subdir, errorMsg):
+        """Save an image and its responsive variants next to it"""
+        originalFilename, relativePath, fileSize, written = cls._saveToDir(file, subdir, errorMsg)
+        if written:
+            uploadDir = cls._getUploadDir(subdir)
+            for variantName, data in generateVariants(file, os.path.basename(relativePath)):
+                with open(os.path.join(uploadDir, variantName), 'wb') as variantFile:
+                    variantFile.write(data)
+        return originalFilename, relativePath, fileSize
+
     @classmethod
     def validateFile(cls, file: FileStorage):
         """Validate uploaded file"""
@@ -66,17 +128,68 @@ class FileStorageService:
     @classmethod
     def saveFile(cls, file: FileStorage):
         """Save uploaded file (PDF) to local storage"""
-        return cls._saveToDir(file, cls.RESUMES_SUBDIR, "Failed to save file")
+        return cls._saveToDir(file, cls.RESUMES_SUBDIR, "Failed to save file")[:3]
 
     @classmethod
     def saveProjectImage(cls, file: FileStorage):
         """Save uploaded project image to local storage"""
-        return cls._saveToDir(file, cls.PROJECTS_SUBDIR, "Failed to save image")
+        return cls._saveImageToDir(file, cls.PROJECTS_SUBDIR, "Failed to save image")
 
     @classmethod
     def saveProfilePhoto(cls, file: FileStorage):
         """Save uploaded profile photo to local storage"""
-        return cls._saveToDir(file, cls.PROFILE_SUBDIR, "Failed to save profile photo")
+        return cls._saveImageToDir(file, cls.PROFILE_SUBDIR, "Failed to save profile photo")
+
+    @classmethod
+    def putObject(cls, relativePath, data, contentType=None):
+        """
+        Write generated bytes (e.g. a PDF thumbnail) under a storage key,
+        through a temp file renamed into place
+
+        Args:
+            relativePath: Storage key
+            data: File contents
+            contentType: Ignored - local files are typed by extension when served
+        """
+        absolutePath = cls.getFilePath(relativePath)
+        directory = os.path.dirname(absolutePath)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmpPath = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as tmpFile:
+                tmpFile.write(data)
+            os.replace(tmpPath, absolutePath)
+        except Exception:
+            os.remove(tmpPath)
+            raise
+
+    @classmethod
+    def objectKey(cls, category, filename):
+        """Storage key of a file in a category (PROJECT_IMAGES, PROFILE_PHOTOS, RESUMES)"""
+        return f"{cls.UPLOAD_DIR}/{category}/{filename}"
+
+    @classmethod
+    def open(cls, relativePath, byteRange=None):
+        """
+        Open a stored file for serving.
+
+        Args:
+            relativePath: Storage key
+            byteRange: Ignored - the file handle is seekable, so the serving
+                helper applies ranges itself
+
+        Returns:
+            StoredObject (file handle) or None if the file does not exist
+        """
+        try:
+            return StoredObject.fromPath(cls.getFilePath(relativePath), getContentType(relativePath))
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
+    @classmethod
+    def getRedirect(cls, relativePath):
+        """Local files are always served by the app (no redirect target)"""
+        return None
 
     @classmethod
     def getFilePath(cls, relativePath):
@@ -97,6 +210,47 @@ class FileStorageService:
             print(f"Warning: Failed to delete file {relativePath}: {str(e)}")
             return False
 
+    @classmethod
+    def listObjects(cls):
+        """
+        Walk every file in the upload subdirectories.
+
+        Yields:
+            tuple: (relative_path, size_bytes, last_modified aware UTC datetime)
+        """
+        for subdir in (cls.RESUMES_SUBDIR, cls.PROJECTS_SUBDIR, cls.PROFILE_SUBDIR):
+            directory = cls.getFilePath(os.path.join(cls.UPLOAD_DIR, subdir))
+            if not os.path.isdir(directory):
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    relativePath = os.path.join(cls.UPLOAD_DIR, subdir, entry.name)
+                    yield relativePath, stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+
+    @classmethod
+    def deleteObjects(cls, relativePaths):
+        """
+        Delete many files. Missing files count as deleted.
+
+        Args:
+            relativePaths: Paths relative to the app directory
+
+        Returns:
+            dict: path -> error message for every file that could not be deleted
+        """
+        failures = {}
+        for relativePath in relativePaths:
+            try:
+                os.remove(cls.getFilePath(relativePath))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                failures[relativePath] = str(e)
+        return failures
+
     @classmethod
     def fileExists(cls, relativePath):
         """Check if file exists in storage"""
@@ -0,0 +1,144 @@
+"""
+Outbound HTTP client - pooled, timeout-bounded sessions per destination.
+
+Every call to a third party (reCAPTCHA, SendGrid, GitHub, S3 presigned URLs)
+goes through HttpClient so connections and TLS sessions are kept alive and
+reused instead of being re-established per request. Each destination has its
+own connection pool and (connect, read) timeouts, and latency is tracked per
+host for the readiness endpoint.
+
+Sessions are created lazily, so each gunicorn worker builds its own pools
+after fork.
+"""
+from __future__ import annotations
+import threading
+import time
+from typing import Iterator
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+    """Shared outbound HTTP subsystem (one pooled session per destination)"""
+
+    # name -> (connect timeout, read timeout, pool size, connect retries)
+    DESTINATIONS = {
+        'recaptcha': (3.05, 5, 4, 1),
+        'sendgrid': (3.05, 10, 4, 1),
+        'github': (5, 30, 2, 1),
+        's3': (3.05, 30, 10, 1),
+    }
+    DEFAULT_DESTINATION = (3.05, 15, 4, 0)
+
+    _sessions: dict[str, requests.Session] = {}
+    _stats: dict[str, dict] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def getSession(cls, destination: str) -> requests.Session:
+        """Get the keep-alive session for a destination (created on first use)"""
+        session = cls._sessions.get(destination)
+        if session is not None:
+            return session
+
+        with cls._lock:
+            if destination not in cls._sessions:
+                _, _, poolSize, connectRetries = cls.DESTINATIONS.get(destination, cls.DEFAULT_DESTINATION)
+                adapter = HTTPAdapter(
+                    pool_connections=poolSize,
+                    pool_maxsize=poolSize,
+                    # Only retry failed connects - never replay a request the server may have seen
+                    max_retries=Retry(total=connectRetries, connect=connectRetries, read=0, status=0, redirect=0),
+                )
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                cls._sessions[destination] = session
+            return cls._sessions[destination]
+
+    @classmethod
+    def request(cls, destination: str, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through a destination's pooled session.
+
+        Args:
+            destination: Key in DESTINATIONS (selects pool and timeouts)
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed to requests (timeout defaults to the destination's)
+
+        Returns:
+            requests.Response (with stream=True, call closeAfter() to release the connection)
+
+        Raises:
+            requests.exceptions.RequestException: On connection errors or timeouts
+        """
+        connectTimeout, readTimeout, _, _ = cls.DESTINATIONS.get(destination, cls.DEFAULT_DESTINATION)
+        kwargs.setdefault('timeout', (connectTimeout, readTimeout))
+
+        host = urlsplit(url).hostname or 'unknown'
+        start = time.perf_counter()
+        try:
+            response = cls.getSession(destination).request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            cls._record(host, (time.perf_counter() - start) * 1000, failed=True)
+            raise
+
+        # Time to response headers (body may still be streaming)
+        cls._record(host, (time.perf_counter() - start) * 1000, failed=response.status_code >= 500)
+        return response
+
+    @classmethod
+    def get(cls, destination: str, url: str, **kwargs) -> requests.Response:
+        """GET through a destination's pooled session"""
+        return cls.request(destination, 'GET', url, **kwargs)
+
+    @classmethod
+    def post(cls, destination: str, url: str, **kwargs) -> requests.Response:
+        """POST through a destination's pooled session"""
+        return cls.request(destination, 'POST', url, **kwargs)
+
+    @staticmethod
+    def closeAfter(response: requests.Response, chunkSize: int = 65536) -> Iterator[bytes]:
+        """
+        Stream a response body and return its connection to the pool when done,
+        even if the client disconnects mid-transfer.
+        """
+        try:
+            yield from response.iter_content(chunk_size=chunkSize)
+        finally:
+            response.close()
+
+    @classmethod
+    def _record(cls, host: str, elapsedMs: float, failed: bool = False) -> None:
+        """Accumulate per-host latency stats"""
+        with cls._lock:
+            stats = cls._stats.setdefault(host, {'count': 0, 'errors': 0, 'totalMs': 0.0, 'maxMs': 0.0, 'lastMs': 0.0})
+            stats['count'] += 1
+            stats['errors'] += int(failed)
+            stats['totalMs'] += elapsedMs
+            stats['maxMs'] = max(stats['maxMs'], elapsedMs)
+            stats['lastMs'] = elapsedMs
+
+    @classmethod
+    def getStats(cls) -> dict[str, dict]:
+        """
+        Per-host latency summary for this worker process.
+
+        Returns:
+            dict: host -> {count, errors, avgMs, maxMs, lastMs}
+        """
+        with cls._lock:
+            return {
+                host: {
+                    'count': stats['count'],
+                    'errors': stats['errors'],
+                    'avgMs': round(stats['totalMs'] / stats['count'], 1),
+                    'maxMs': round(stats['maxMs'], 1),
+                    'lastMs': round(stats['lastMs'], 1),
+                }
+                for host, stats in cls._stats.items()
+            }
@@ -0,0 +1,250 @@
+"""
+Image processing - responsive width variants generated at upload time.
+
+For every uploaded project image / profile photo, a fixed ladder of widths
+is rendered in WebP and in the original format and stored next to the
+original:
+
+    <stem>.<ext>            original
+    <stem>.webp             full width, WebP (only if smaller than the original)
+    <stem>.w640.webp        640px wide, WebP
+    <stem>.w640.<ext>       640px wide, original format
+
+Only widths smaller than the original are generated (never upscaled).
+Serving routes pick a variant from ?w= and the Accept header and fall
+back to the original when a variant does not exist (e.g. older uploads).
+
+describeImage() computes the intrinsic size and a tiny base64 WebP
+placeholder once at upload, so pages can reserve layout space and paint a
+blurred preview before the real image arrives.
+"""
+from __future__ import annotations
+import base64
+import io
+import sys
+
+from PIL import Image, ImageOps
+
+VARIANT_WIDTHS = (320, 640, 1024, 1600)
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_QUALITY = 40
+# Placeholders are a few hundred bytes; a client-sent one far larger is not ours
+PLACEHOLDER_MAX_LENGTH = 2048
+
+# Pillow encoder names for the original formats we re-encode
+_PIL_FORMATS = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG', 'webp': 'WEBP'}
+
+
+def splitFilename(filename: str) -> tuple[str, str]:
+    """Split 'abc_photo.jpg' into ('abc_photo', 'jpg')"""
+    if '.' not in filename:
+        return filename, ''
+    stem, ext = filename.rsplit('.', 1)
+    return stem, ext.lower()
+
+
+def variantFilename(filename: str, width: int, ext: str | None = None) -> str:
+    """
+    Name of a width variant of a stored image.
+
+    Args:
+        filename: Stored original filename
+        width: Ladder width
+        ext: Variant format extension (default: original's)
+    """
+    stem, originalExt = splitFilename(filename)
+    return f"{stem}.w{width}.{ext or originalExt}"
+
+
+def fullWebpFilename(filename: str) -> str | None:
+    """Name of the full-width WebP transcode (None if the original is WebP)"""
+    stem, ext = splitFilename(filename)
+    return None if ext == 'webp' else f"{stem}.webp"
+
+
+def allVariantFilenames(filename: str) -> list[str]:
+    """Every variant name that may exist for an original (used on delete)"""
+    _, ext = splitFilename(filename)
+    names = [fullWebpFilename(filename)] if ext != 'webp' else []
+    for width in VARIANT_WIDTHS:
+        names.append(variantFilename(filename, width, 'webp'))
+        if ext != 'webp':
+            names.append(variantFilename(filename, width))
+    return names
+
+
+def _encode(image: Image.Image, pilFormat: str) -> bytes:
+    """Encode an image with the settings used for variants"""
+    output = io.BytesIO()
+    if pilFormat == 'JPEG':
+        image.convert('RGB').save(output, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    elif pilFormat == 'WEBP':
+        image.save(output, 'WEBP', quality=WEBP_QUALITY, method=4)
+    else:
+        image.save(output, pilFormat, optimize=True)
+    return output.getvalue()
+
+
+def generateVariants(file, filename: str) -> list[tuple[str, bytes]]:
+    """
+    Render the width ladder for an uploaded image.
+
+    Args:
+        file: Uploaded file (FileStorage or file-like); rewound afterwards
+        filename: Stored original filename (variant names derive from it)
+
+    Returns:
+        list: (variantFilename, bytes) pairs, empty for formats we do not
+        re-encode (GIF - may be animated) or if the image cannot be decoded
+    """
+    _, ext = splitFilename(filename)
+    pilFormat = _PIL_FORMATS.get(ext)
+    if pilFormat is None:
+        return []
+
+    try:
+        file.seek(0, io.SEEK_END)
+        originalSize = file.tell()
+        file.seek(0)
+        with Image.open(file) as source:
+            # Apply camera rotation so variants match what browsers show
+            image = ImageOps.exif_transpose(source)
+            image.load()
+    except Exception as e:
+        print(f"Warning: Skipping variants for {filename}: {str(e)}", file=sys.stderr)
+        return []
+    finally:
+        file.seek(0)
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+
+    variants = []
+    if pilFormat != 'WEBP':
+        fullWebp = _encode(image, 'WEBP')
+        if len(fullWebp) < originalSize:
+            variants.append((fullWebpFilename(filename), fullWebp))
+
+    for width in VARIANT_WIDTHS:
+        if width >= image.width:
+            break
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS)
+        variants.append((variantFilename(filename, width, 'webp'), _encode(resized, 'WEBP')))
+        if pilFormat != 'WEBP':
+            variants.append((variantFilename(filename, width), _encode(resized, pilFormat)))
+    return variants
+
+
+def describeImage(file) -> dict | None:
+    """
+    Intrinsic dimensions and a low-quality placeholder for an uploaded image.
+
+    Args:
+        file: Uploaded file (FileStorage or file-like); rewound afterwards
+
+    Returns:
+        dict: {'width', 'height', 'placeholder'} where placeholder is a
+        data:image/webp;base64 URI (a few hundred bytes), or None if the
+        image cannot be decoded
+    """
+    try:
+        file.seek(0)
+        with Image.open(file) as source:
+            image = ImageOps.exif_transpose(source)
+            width, height = image.size
+            image.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH * 4))
+            thumbnail = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+    except Exception as e:
+        print(f"Warning: Could not describe image: {str(e)}", file=sys.stderr)
+        return None
+    finally:
+        file.seek(0)
+
+    output = io.BytesIO()
+    thumbnail.save(output, 'WEBP', quality=PLACEHOLDER_QUALITY)
+    return {
+        'width': width,
+        'height': height,
+        'placeholder': 'data:image/webp;base64,' + base64.b64encode(output.getvalue()).decode('ascii')
+    }
+
+
+def validateImageMetadata(data: dict, attributes: tuple[str, str, str]) -> str | None:
+    """
+    Check describeImage() output sent back by a client before it is stored.
+
+    Args:
+        data: Request body
+        attributes: Body keys of (width, height, placeholder); absent or null is fine
+
+    Returns:
+        str: Error message if a value is malformed, else None
+    """
+    widthKey, heightKey, placeholderKey = attributes
+    for key in (widthKey, heightKey):
+        value = data.get(key)
+        if value is not None and (type(value) is not int or value <= 0):
+            return f'{key} must be a positive integer'
+    placeholder = data.get(placeholderKey)
+    if placeholder is not None and (not isinstance(placeholder, str) or len(placeholder) > PLACEHOLDER_MAX_LENGTH):
+        return f'{placeholderKey} must be a string of at most {PLACEHOLDER_MAX_LENGTH} characters'
+    return None
+
+
+def parseRequestedWidth(value: str | None) -> int | None:
+    """Parse ?w= (positive int) or return None if absent/invalid"""
+    if not value or not value.isdigit():
+        return None
+    width = int(value)
+    return width if width > 0 else None
+
+
+def acceptsWebp(acceptHeader: str | None) -> bool:
+    """Whether the client explicitly lists image/webp (wildcards don't count)"""
+    return 'image/webp' in (acceptHeader or '')
+
+
+def selectVariant(filename: str, requestedWidth: int | None, acceptsWebp: bool, exists) -> str:
+    """
+    Choose which stored file to serve for a request.
+
+    Picks the smallest ladder width >= requestedWidth (or the full-width
+    image when no width is requested), preferring WebP when the client
+    accepts it, and falls back to the original when no matching variant
+    was generated.
+
+    Args:
+        filename: Stored original filename
+        requestedWidth: Desired display width in px (None: original)
+        acceptsWebp: Whether the Accept header allows image/webp
+        exists: Callable(filename) -> bool for the current storage backend
+
+    Returns:
+        str: Filename to serve (original or a variant)
+    """
+    _, ext = splitFilename(filename)
+    if ext not in _PIL_FORMATS:
+        return filename
+
+    candidates = []
+    width = None
+    if requestedWidth is not None:
+        width = next((w for w in VARIANT_WIDTHS if w >= requestedWidth), None)
+    if width is not None:
+        if acceptsWebp:
+            candidates.append(variantFilename(filename, width, 'webp'))
+        if ext != 'webp':
+            candidates.append(variantFilename(filename, width))
+
+    # Full width (no ladder match, or the original is narrower than it)
+    fullWebp = fullWebpFilename(filename)
+    if acceptsWebp and fullWebp:
+        candidates.append(fullWebp)
+
+    for candidate in candidates:
+        if exists(candidate):
+            return candidate
+    return filename
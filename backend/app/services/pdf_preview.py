@@ -0,0 +1,88 @@
+"""
+PDF preview - first-page thumbnail and document metadata for resume PDFs.
+
+Generated once per stored PDF by the background worker (PdfPreviewService)
+and stored next to the PDF:
+
+    <stem>.pdf              original
+    <stem>.thumb.webp       first page, THUMBNAIL_WIDTH px wide, WebP
+                            (named by storage_utils.thumbnailFilename)
+
+Along with the thumbnail, describePdf() reports the page count and whether
+the document has a text layer (selectable text, which ATS parsers need) plus
+a short excerpt of the first page's text for link previews.
+"""
+from __future__ import annotations
+import io
+
+import pypdfium2 as pdfium
+
+from app.services.image_processing import WEBP_QUALITY
+
+THUMBNAIL_WIDTH = 480
+TEXT_EXCERPT_LENGTH = 280
+# Pages inspected for a text layer (scanned resumes have none on any page)
+TEXT_SCAN_PAGES = 5
+
+
+def describePdf(data: bytes) -> dict:
+    """
+    Render the first page and read the document's metadata.
+
+    Args:
+        data: PDF bytes
+
+    Returns:
+        dict: pageCount, hasTextLayer, textExcerpt (None without text),
+        thumbnail (WebP bytes, None for a document without pages),
+        thumbnailWidth and thumbnailHeight
+
+    Raises:
+        pypdfium2.PdfiumError: If the PDF cannot be parsed (corrupt or encrypted)
+    """
+    pdf = pdfium.PdfDocument(data)
+    try:
+        description = {
+            'pageCount': len(pdf),
+            'hasTextLayer': False,
+            'textExcerpt': None,
+            'thumbnail': None,
+            'thumbnailWidth': None,
+            'thumbnailHeight': None,
+        }
+
+        for index in range(min(len(pdf), TEXT_SCAN_PAGES)):
+            page = pdf[index]
+            textPage = page.get_textpage()
+            try:
+                if textPage.count_chars() > 0:
+                    description['hasTextLayer'] = True
+                if index == 0:
+                    text = ' '.join(textPage.get_text_range().split())
+                    description['textExcerpt'] = text[:TEXT_EXCERPT_LENGTH] or None
+                    description.update(_renderThumbnail(page))
+            finally:
+                textPage.close()
+                page.close()
+
+        return description
+    finally:
+        pdf.close()
+
+
+def _renderThumbnail(page) -> dict:
+    """Render a page THUMBNAIL_WIDTH px wide and encode it as WebP"""
+    width, _ = page.get_size()
+    bitmap = page.render(scale=THUMBNAIL_WIDTH / width)
+    try:
+        image = bitmap.to_pil().convert('RGB')
+    finally:
+        bitmap.close()
+
+    output = io.BytesIO()
+    image.save(output, 'WEBP', quality=WEBP_QUALITY, method=4)
+    return {
+        'thumbnail': output.getvalue(),
+        'thumbnailWidth': image.width,
+        'thumbnailHeight': image.height,
+    }
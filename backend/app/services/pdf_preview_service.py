@@ -0,0 +1,83 @@
+"""
+PDF preview service - renders thumbnails and metadata for uploaded resume PDFs.
+Runs in the background worker process (scripts/worker.py), never in a request.
+"""
+import sys
+from app.dao.resume_pdf_dao import ResumePdfDAO
+from app.services.storage_factory import getStorageService
+from app.services.storage_utils import pdfThumbnailKey
+
+
+class PdfPreviewService:
+    """Service class for draining the PDF preview queue"""
+
+    # Small batches: a claim leases its rows until the whole batch is recorded
+    BATCH_SIZE = 10
+
+    @staticmethod
+    def _readObject(StorageService, key):
+        """Whole stored object as bytes, or None if it does not exist"""
+        stored = StorageService.open(key)
+        if stored is None:
+            return None
+        try:
+            return stored.file.read() if stored.file is not None else b''.join(stored.body)
+        finally:
+            stored.close()
+
+    @staticmethod
+    def generatePreview(StorageService, filePath):
+        """
+        Render one version's PDF and store its thumbnail next to it
+
+        Returns:
+            dict: Metadata fields for ResumePdfDAO.recordPreviews()
+
+        Raises:
+            Exception: If the PDF is missing, cannot be parsed or the
+                thumbnail cannot be stored
+        """
+        # Imported here so web processes, which only import this class, never load pdfium
+        from app.services.pdf_preview import describePdf
+
+        data = PdfPreviewService._readObject(StorageService, filePath)
+        if data is None:
+            raise Exception(f"PDF not found in storage: {filePath}")
+
+        description = describePdf(data)
+        thumbnail = description.pop('thumbnail')
+        if thumbnail is not None:
+            StorageService.putObject(pdfThumbnailKey(filePath), thumbnail, 'image/webp')
+        return description
+
+    @staticmethod
+    def processBatch(batchSize=None):
+        """
+        Claim one batch of versions waiting for a preview, render them and
+        record the outcome. Rendering happens between two short commits,
+        so no row lock is held while PDFs are read and rendered.
+
+        Args:
+            batchSize (int, optional): Max versions to claim (default BATCH_SIZE)
+
+        Returns:
+            int: Number of versions attempted (0 when the queue is idle)
+        """
+        claimed = ResumePdfDAO.claimPendingPreviews(limit=batchSize or PdfPreviewService.BATCH_SIZE)
+        if not claimed:
+            return 0
+
+        StorageService = getStorageService()
+        rendered = {}  # filePath -> metadata; reactivated versions share a file
+        results = []
+        for versionId, filePath, attempt in claimed:
+            try:
+                if filePath not in rendered:
+                    rendered[filePath] = PdfPreviewService.generatePreview(StorageService, filePath)
+                results.append((versionId, dict(rendered[filePath]), None))
+            except Exception as e:
+                print(f"ERROR: PDF preview for version {versionId} failed (attempt {attempt}): {str(e)}", file=sys.stderr)
+                results.append((versionId, None, str(e)))
+
+        ResumePdfDAO.recordPreviews(results)
+        return len(results)
@@ -7,6 +7,7 @@ from __future__ import annotations
 import os
 import requests
 from typing import Optional
+from app.services.http_client import HttpClient
 
 
 class RecaptchaVerificationService:
@@ -14,7 +15,6 @@ class RecaptchaVerificationService:
 
     GOOGLE_RECAPTCHA_VERIFY_URL = 'https://www.google.com/recaptcha/api/siteverify'
     DEFAULT_MINIMUM_SCORE = 0.5
-    REQUEST_TIMEOUT_SECONDS = 5
 
     @staticmethod
     def verifyRecaptchaToken(
@@ -64,11 +64,11 @@ class RecaptchaVerificationService:
             if userIpAddress:
                 verificationPayload['remoteip'] = userIpAddress
 
-            # Send verification request to Google
-            googleResponse = requests.post(
+            # Send verification request to Google (pooled keep-alive connection)
+            googleResponse = HttpClient.post(
+                'recaptcha',
                 RecaptchaVerificationService.GOOGLE_RECAPTCHA_VERIFY_URL,
-                data=verificationPayload,
-                timeout=RecaptchaVerificationService.REQUEST_TIMEOUT_SECONDS
+                data=verificationPayload
             )
 
             googleResponse.raise_for_status()
@@ -0,0 +1,159 @@
+"""
+S3 Disk Cache - read-through local disk tier in front of S3.
+
+Uploaded objects get sha256 (or uuid-prefixed) keys and are never rewritten, so a copy
+on local disk stays valid until the object is deleted. All gunicorn workers
+on a node share one cache directory:
+- files are written to a temp file and renamed into place (atomic, so a
+  reader never sees a partial file)
+- hits refresh the file's mtime, and eviction removes the oldest mtimes
+  first (LRU) once the directory exceeds S3_DISK_CACHE_MAX_BYTES
+- an evicted file that another worker is still sending stays readable
+  through its open descriptor
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from botocore.exceptions import ClientError
+from app.services.s3_storage_service import S3StorageService
+
+
+class S3DiskCache:
+    """Node-local, size-bounded LRU cache of immutable S3 objects"""
+
+    CACHE_DIR = os.getenv('S3_DISK_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'portfolio-s3-cache'))
+    MAX_BYTES = int(os.getenv('S3_DISK_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+    # Objects larger than this share of the cap are streamed, not cached
+    MAX_OBJECT_FRACTION = 8
+    CHUNK_SIZE = 65536
+    # Temp files older than this were left by a crashed download
+    STALE_TMP_SECONDS = 3600
+
+    _stats = {'hits': 0, 'misses': 0, 'bypassed': 0, 'evictions': 0}
+    _statsLock = threading.Lock()
+
+    @classmethod
+    def isEnabled(cls):
+        """Caching is disabled by setting S3_DISK_CACHE_MAX_BYTES=0"""
+        return cls.MAX_BYTES > 0
+
+    @classmethod
+    def _pathFor(cls, s3Key):
+        """Cache file path for a key (hashed, so keys never escape CACHE_DIR)"""
+        return os.path.join(cls.CACHE_DIR, hashlib.sha256(s3Key.encode('utf-8')).hexdigest())
+
+    @classmethod
+    def _count(cls, stat, amount=1):
+        with cls._statsLock:
+            cls._stats[stat] += amount
+
+    @classmethod
+    def getOrFetch(cls, s3Key):
+        """
+        Return a local path holding the object, downloading it on a miss.
+
+        Args:
+            s3Key: Object key
+
+        Returns:
+            str: Path to the cached file, or None if the object is missing,
+            too large to cache, or the download failed (callers fall back
+            to streaming from S3)
+        """
+        path = cls._pathFor(s3Key)
+        try:
+            os.utime(path)
+            cls._count('hits')
+            return path
+        except FileNotFoundError:
+            pass
+
+        cls._count('misses')
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            s3Object = S3StorageService._getS3Client().get_object(Bucket=S3StorageService.AWS_S3_BUCKET, Key=s3Key)
+        except ClientError:
+            return None
+        except Exception as e:
+            print(f"Warning: Disk cache fetch failed for {s3Key}: {str(e)}", file=sys.stderr)
+            return None
+
+        body = s3Object['Body']
+        if s3Object.get('ContentLength', 0) > cls.MAX_BYTES // cls.MAX_OBJECT_FRACTION:
+            body.close()
+            cls._count('bypassed')
+            return None
+
+        # Write beside the final path, then rename atomically
+        fd, tmpPath = tempfile.mkstemp(dir=cls.CACHE_DIR, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as tmpFile:
+                for chunk in body.iter_chunks(cls.CHUNK_SIZE):
+                    tmpFile.write(chunk)
+            os.replace(tmpPath, path)
+        except Exception as e:
+            print(f"Warning: Disk cache write failed for {s3Key}: {str(e)}", file=sys.stderr)
+            try:
+                os.unlink(tmpPath)
+            except OSError:
+                pass
+            return None
+        finally:
+            body.close()
+
+        cls._evict()
+        return path
+
+    @classmethod
+    def _evict(cls):
+        """Delete least recently used files until the cache fits MAX_BYTES"""
+        entries = []
+        totalBytes = 0
+        try:
+            with os.scandir(cls.CACHE_DIR) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    if entry.name.startswith('.tmp-'):
+                        if time.time() - stat.st_mtime > cls.STALE_TMP_SECONDS:
+                            try:
+                                os.unlink(entry.path)
+                            except FileNotFoundError:
+                                pass
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    totalBytes += stat.st_size
+        except FileNotFoundError:
+            return
+
+        if totalBytes <= cls.MAX_BYTES:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.unlink(path)
+                cls._count('evictions')
+            except FileNotFoundError:
+                pass  # Another worker evicted it first
+            totalBytes -= size
+            if totalBytes <= cls.MAX_BYTES:
+                break
+
+    @classmethod
+    def invalidate(cls, s3Key):
+        """Remove a key's cached copy (after the object is deleted from S3)"""
+        try:
+            os.unlink(cls._pathFor(s3Key))
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def getStats(cls):
+        """Hit/miss counters for this worker process"""
+        with cls._statsLock:
+            return dict(cls._stats)
@@ -1,13 +1,31 @@
 """
 S3 Cloud Storage Service - AWS S3 file storage implementation
+
+S3_SERVE_MODE selects how public objects (project images, profile photos,
+resume PDFs) reach the browser:
+- 'redirect': getRedirect() returns S3_PUBLIC_BASE_URL/<key> (CDN) or a
+  presigned URL, and the app answers 302. The gunicorn worker is free again
+  as soon as the headers are written.
+- 'proxy' (default): open() serves the bytes from this node - from the
+  shared disk cache (S3DiskCache) when possible, otherwise streamed from S3.
+  It needs no bucket CORS or public access.
 """
 import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from werkzeug.utils import secure_filename
 from werkzeug.datastructures import FileStorage
-from app.services.storage_utils import validateFile as _validateFile, validateImage as _validateImage, getContentType
+from app.services.storage_utils import (
+    validateFile as _validateFile, validateImage as _validateImage, getContentType,
+    CONTENT_ADDRESSED_STORAGE, contentAddressedFilename, hashFile, uploadSize, StoredObject
+)
+from app.services.image_processing import generateVariants
 
 
 class S3StorageService:
@@ -22,9 +40,46 @@ class S3StorageService:
     PROJECTS_PREFIX = 'projects/'
     PROFILE_PREFIX = 'profile/'
 
+    SERVE_MODE_PROXY = 'proxy'
+    SERVE_MODE_REDIRECT = 'redirect'
+    SERVE_MODE = os.getenv('S3_SERVE_MODE', SERVE_MODE_PROXY).lower()
+    PUBLIC_BASE_URL = os.getenv('S3_PUBLIC_BASE_URL', '').rstrip('/')
+    # Presigned URLs live 1 hour; browsers may reuse the redirect for a fraction of that
+    PRESIGNED_REDIRECT_CACHE_CONTROL = 'private, max-age=600'
+    CDN_REDIRECT_CACHE_CONTROL = 'public, max-age=86400'
+    STREAM_CHUNK_SIZE = 65536
+
+    # Uploads above the threshold go up as concurrent multipart parts
+    # (S3's minimum part size is 5MB) instead of one sequential PUT
+    UPLOAD_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=5 * 1024 * 1024,
+        max_concurrency=4,
+        use_threads=True
+    )
+
+    # DeleteObjects accepts at most 1000 keys per request
+    DELETE_BATCH_SIZE = 1000
+
     # Singleton S3 client - avoids ~50-200ms overhead of creating new client per operation
     _s3Client = None
 
+    # Presigned URL cache - skips SigV4 signing on hot reads.
+    # URLs are reissued once less than REFRESH_AHEAD seconds of validity remain,
+    # so every URL handed out stays valid for at least that long (redirects
+    # may be cached by browsers for up to 600s).
+    PRESIGNED_URL_EXPIRY = 3600
+    PRESIGNED_URL_REFRESH_AHEAD = 900
+    PRESIGNED_URL_CACHE_SIZE = int(os.getenv('PRESIGNED_URL_CACHE_SIZE', '1024'))
+    _presignedUrls = OrderedDict()  # s3Key -> (url, expiresAt monotonic)
+    _presignedUrlLock = threading.Lock()
+    _presignedUrlStats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0}
+
+    # Memoized HEAD results for image variants. Keys are immutable and variants
+    # are written before the upload returns, so results never go stale.
+    EXISTS_CACHE_SIZE = 4096
+    _existsCache = OrderedDict()
+
     @classmethod
     def _getS3Client(cls):
         """Get configured S3 client (singleton pattern for performance)"""
@@ -52,19 +107,26 @@ class S3StorageService:
             errorMsg: Error message prefix
 
         Returns:
-            tuple: (original_filename, s3_key, file_size)
+            tuple: (original_filename, s3_key, file_size, written)
+            where written is False if identical content was already stored
+            (its blob is marked written only after put succeeds)
         """
+        from app.dao.storage_blob_dao import StorageBlobDAO
+
         try:
             s3 = cls._getS3Client()
 
             originalFilename = secure_filename(file.filename)
-            uniqueId = uuid.uuid4().hex[:12]
-            filename = f"{uniqueId}_{originalFilename}"
-            s3Key = prefix + filename
-
-            file.seek(0, os.SEEK_END)
-            fileSize = file.tell()
-            file.seek(0)
+            if CONTENT_ADDRESSED_STORAGE:
+                sha256, fileSize = hashFile(file)
+                s3Key = prefix + contentAddressedFilename(sha256, originalFilename)
+                if StorageBlobDAO.register(s3Key, sha256, fileSize):
+                    # Same bytes already stored - skip the upload entirely
+                    return originalFilename, s3Key, fileSize, False
+            else:
+                uniqueId = uuid.uuid4().hex[:12]
+                s3Key = prefix + f"{uniqueId}_{originalFilename}"
+                fileSize = uploadSize(file)
 
             extraArgs = {'ContentType': contentType or getContentType(originalFilename)}
             if cacheControl:
@@ -74,13 +136,38 @@ class S3StorageService:
             if contentType == 'application/pdf':
                 extraArgs['ContentDisposition'] = f'inline; filename="{originalFilename}"'
 
-            s3.upload_fileobj(file, cls.AWS_S3_BUCKET, s3Key, ExtraArgs=extraArgs)
+            file.seek(0)
+            s3.upload_fileobj(file.stream, cls.AWS_S3_BUCKET, s3Key, ExtraArgs=extraArgs, Config=cls.UPLOAD_TRANSFER_CONFIG)
+            file.seek(0)
+            if CONTENT_ADDRESSED_STORAGE:
+                StorageBlobDAO.markWritten(s3Key)
+
+            return originalFilename, s3Key, fileSize, True
+        except Exception as e:
+            raise Exception(f"{errorMsg}: {str(e)}")
 
+    @classmethod
+    def _uploadImageToS3(cls, file, prefix, errorMsg):
+        """Upload an image and its responsive variants under the same prefix"""
+        originalFilename, s3Key, fileSize, written = cls._uploadToS3(
+            file, prefix, cacheControl='max-age=31536000, immutable', errorMsg=errorMsg
+        )
+        if not written:
             return originalFilename, s3Key, fileSize
-        except ClientError as e:
-            raise Exception(f"{errorMsg}: {str(e)}")
+        try:
+            s3 = cls._getS3Client()
+            for variantName, data in generateVariants(file, s3Key[len(prefix):]):
+                s3.put_object(
+                    Bucket=cls.AWS_S3_BUCKET,
+                    Key=prefix + variantName,
+                    Body=data,
+                    ContentType=getContentType(variantName),
+                    CacheControl='max-age=31536000, immutable'
+                )
         except Exception as e:
-            raise Exception(f"{errorMsg}: {str(e)}")
+            # The original is stored - serving falls back to it for missing variants
+            print(f"Warning: Failed to upload variants for {s3Key}: {str(e)}")
+        return originalFilename, s3Key, fileSize
 
     @classmethod
     def validateFile(cls, file: FileStorage):
@@ -95,56 +182,258 @@ class S3StorageService:
     @classmethod
     def saveFile(cls, file: FileStorage):
         """Upload file (PDF) to S3"""
-        return cls._uploadToS3(file, cls.RESUMES_PREFIX, contentType='application/pdf', errorMsg="Failed to upload to S3")
+        return cls._uploadToS3(file, cls.RESUMES_PREFIX, contentType='application/pdf', errorMsg="Failed to upload to S3")[:3]
 
     @classmethod
     def saveProjectImage(cls, file: FileStorage):
-        """Upload project image to S3"""
-        return cls._uploadToS3(
-            file, cls.PROJECTS_PREFIX,
-            cacheControl='max-age=31536000',
-            errorMsg="Failed to upload image to S3"
-        )
+        """Upload project image (and its width variants) to S3"""
+        return cls._uploadImageToS3(file, cls.PROJECTS_PREFIX, "Failed to upload image to S3")
 
     @classmethod
     def saveProfilePhoto(cls, file: FileStorage):
-        """Upload profile photo to S3"""
-        return cls._uploadToS3(
-            file, cls.PROFILE_PREFIX,
-            cacheControl='max-age=31536000',
-            errorMsg="Failed to upload profile photo to S3"
-        )
+        """Upload profile photo (and its width variants) to S3"""
+        return cls._uploadImageToS3(file, cls.PROFILE_PREFIX, "Failed to upload profile photo to S3")
 
     @classmethod
     def getFilePath(cls, s3Key):
-        """Get pre-signed URL for S3 object (expires in 1 hour)"""
+        """
+        Get pre-signed URL for S3 object (expires in 1 hour).
+        Served from an LRU cache while at least PRESIGNED_URL_REFRESH_AHEAD
+        seconds of validity remain.
+        """
+        now = time.monotonic()
+        with cls._presignedUrlLock:
+            entry = cls._presignedUrls.get(s3Key)
+            if entry is not None:
+                url, expiresAt = entry
+                if expiresAt - now > cls.PRESIGNED_URL_REFRESH_AHEAD:
+                    cls._presignedUrls.move_to_end(s3Key)
+                    cls._presignedUrlStats['hits'] += 1
+                    return url
+                cls._presignedUrlStats['refreshes'] += 1
+            else:
+                cls._presignedUrlStats['misses'] += 1
+
+        # Sign outside the lock; concurrent misses for one key just sign twice
         try:
             s3 = cls._getS3Client()
-            return s3.generate_presigned_url(
+            url = s3.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': cls.AWS_S3_BUCKET, 'Key': s3Key},
-                ExpiresIn=3600
+                ExpiresIn=cls.PRESIGNED_URL_EXPIRY
             )
         except Exception as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
 
+        with cls._presignedUrlLock:
+            cls._presignedUrls[s3Key] = (url, now + cls.PRESIGNED_URL_EXPIRY)
+            cls._presignedUrls.move_to_end(s3Key)
+            while len(cls._presignedUrls) > cls.PRESIGNED_URL_CACHE_SIZE:
+                cls._presignedUrls.popitem(last=False)
+                cls._presignedUrlStats['evictions'] += 1
+        return url
+
+    @classmethod
+    def getPublicUrl(cls, s3Key):
+        """Public CDN URL for a key if S3_PUBLIC_BASE_URL is set, else a presigned URL"""
+        if cls.PUBLIC_BASE_URL:
+            return f"{cls.PUBLIC_BASE_URL}/{s3Key}"
+        return cls.getFilePath(s3Key)
+
+    @classmethod
+    def getRedirect(cls, s3Key):
+        """
+        Where to send the browser instead of serving the bytes.
+
+        Returns:
+            tuple: (url, cacheControl for the redirect) in redirect mode,
+            None in proxy mode
+        """
+        if cls.SERVE_MODE != cls.SERVE_MODE_REDIRECT:
+            return None
+        cacheControl = cls.CDN_REDIRECT_CACHE_CONTROL if cls.PUBLIC_BASE_URL else cls.PRESIGNED_REDIRECT_CACHE_CONTROL
+        return cls.getPublicUrl(s3Key), cacheControl
+
+    @classmethod
+    def objectKey(cls, category, filename):
+        """Storage key of a file in a category (PROJECT_IMAGES, PROFILE_PHOTOS, RESUMES)"""
+        return f"{category}/{filename}"
+
+    @classmethod
+    def open(cls, s3Key, byteRange=None):
+        """
+        Open an object for serving: a file handle from the node's disk cache
+        when it can be cached, otherwise a stream from S3.
+
+        Args:
+            s3Key: Object key
+            byteRange: Range header value ('bytes=0-1023'); only applied when
+                streaming from S3 - cached files are seekable, so the
+                serving helper applies ranges itself
+
+        Returns:
+            StoredObject or None if the object does not exist
+        """
+        from app.services.s3_disk_cache import S3DiskCache
+        from app.services.http_client import HttpClient
+
+        contentType = getContentType(s3Key)
+        if S3DiskCache.isEnabled():
+            cachedPath = S3DiskCache.getOrFetch(s3Key)
+            if cachedPath is not None:
+                try:
+                    # Keys are immutable, so the key identifies the content;
+                    # the cache file's mtime changes on every hit
+                    return StoredObject.fromPath(
+                        cachedPath, contentType, etag=os.path.basename(cachedPath)[:32], lastModified=None
+                    )
+                except FileNotFoundError:
+                    pass  # Evicted by another worker just now - stream instead
+
+        s3Response = HttpClient.get(
+            's3', cls.getFilePath(s3Key), stream=True,
+            headers={'Range': byteRange} if byteRange else None
+        )
+        if s3Response.status_code == 416 and byteRange:
+            s3Response.close()
+            return cls.open(s3Key)
+        if s3Response.status_code not in (200, 206):
+            s3Response.close()
+            return None
+
+        headers = s3Response.headers
+        length = None
+        if 'Content-Length' in headers and 'Content-Encoding' not in headers:
+            length = int(headers['Content-Length'])
+        contentRange = headers.get('Content-Range') if s3Response.status_code == 206 else None
+        size = int(contentRange.rsplit('/', 1)[1]) if contentRange and not contentRange.endswith('/*') else length
+        return StoredObject(
+            size=size,
+            contentType=contentType,
+            etag=headers.get('ETag', '').strip('"') or None,
+            lastModified=parsedate_to_datetime(headers['Last-Modified']) if 'Last-Modified' in headers else None,
+            body=HttpClient.closeAfter(s3Response, cls.STREAM_CHUNK_SIZE),
+            length=length,
+            contentRange=contentRange,
+            onClose=s3Response.close
+        )
+
+    @classmethod
+    def getPresignedUrlCacheStats(cls):
+        """Hit/miss counters and size of this worker's presigned URL cache"""
+        with cls._presignedUrlLock:
+            return {**cls._presignedUrlStats, 'size': len(cls._presignedUrls)}
+
+    @classmethod
+    def putObject(cls, s3Key, data, contentType=None):
+        """
+        Upload generated bytes (e.g. a PDF thumbnail) under a key
+
+        Args:
+            s3Key: Object key
+            data: Object contents
+            contentType: MIME type (default: from the key's extension)
+        """
+        cls._getS3Client().put_object(
+            Bucket=cls.AWS_S3_BUCKET,
+            Key=s3Key,
+            Body=data,
+            ContentType=contentType or getContentType(s3Key),
+            CacheControl='max-age=31536000, immutable'
+        )
+        # Forget a memoized miss for the key
+        cls._forgetKeys([s3Key])
+
     @classmethod
     def deleteFile(cls, s3Key):
         """Delete file from S3. Returns True if deleted, False on error."""
         try:
             s3 = cls._getS3Client()
             s3.delete_object(Bucket=cls.AWS_S3_BUCKET, Key=s3Key)
+            cls._forgetKeys([s3Key])
             return True
         except Exception as e:
             print(f"Warning: Failed to delete file {s3Key}: {str(e)}")
             return False
 
+    @classmethod
+    def listObjects(cls):
+        """
+        Stream every object under the upload prefixes, one ListObjectsV2
+        page (up to 1000 keys) at a time.
+
+        Yields:
+            tuple: (s3_key, size_bytes, last_modified aware UTC datetime)
+        """
+        paginator = cls._getS3Client().get_paginator('list_objects_v2')
+        for prefix in (cls.RESUMES_PREFIX, cls.PROJECTS_PREFIX, cls.PROFILE_PREFIX):
+            for page in paginator.paginate(Bucket=cls.AWS_S3_BUCKET, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    yield obj['Key'], obj['Size'], obj['LastModified']
+
+    @classmethod
+    def deleteObjects(cls, s3Keys):
+        """
+        Delete many objects with DeleteObjects, DELETE_BATCH_SIZE keys per call.
+        Missing keys count as deleted.
+
+        Args:
+            s3Keys: Keys to delete
+
+        Returns:
+            dict: key -> error message for every key that could not be deleted
+        """
+        failures = {}
+        for start in range(0, len(s3Keys), cls.DELETE_BATCH_SIZE):
+            batch = s3Keys[start:start + cls.DELETE_BATCH_SIZE]
+            try:
+                response = cls._getS3Client().delete_objects(
+                    Bucket=cls.AWS_S3_BUCKET,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                for error in response.get('Errors', []):
+                    if error.get('Code') != 'NoSuchKey':
+                        failures[error['Key']] = f"{error.get('Code')}: {error.get('Message')}"
+            except Exception as e:
+                for key in batch:
+                    failures[key] = str(e)
+        cls._forgetKeys([key for key in s3Keys if key not in failures])
+        return failures
+
+    @classmethod
+    def _forgetKeys(cls, s3Keys):
+        """Drop deleted keys from the presigned URL, existence and disk caches"""
+        from app.services.s3_disk_cache import S3DiskCache
+        with cls._presignedUrlLock:
+            for s3Key in s3Keys:
+                cls._presignedUrls.pop(s3Key, None)
+                cls._existsCache.pop(s3Key, None)
+        for s3Key in s3Keys:
+            S3DiskCache.invalidate(s3Key)
+
     @classmethod
     def fileExists(cls, s3Key):
-        """Check if file exists in S3"""
+        """
+        Check if an object exists (HEAD, memoized per worker).
+        Without s3:ListBucket a missing key answers 403, so any client error
+        counts as missing; transport errors are not memoized.
+        """
+        with cls._presignedUrlLock:
+            if s3Key in cls._existsCache:
+                cls._existsCache.move_to_end(s3Key)
+                return cls._existsCache[s3Key]
+
         try:
-            s3 = cls._getS3Client()
-            s3.head_object(Bucket=cls.AWS_S3_BUCKET, Key=s3Key)
-            return True
+            cls._getS3Client().head_object(Bucket=cls.AWS_S3_BUCKET, Key=s3Key)
+            exists = True
         except ClientError:
+            exists = False
+        except Exception as e:
+            print(f"Warning: Failed to check {s3Key}: {str(e)}")
             return False
+
+        with cls._presignedUrlLock:
+            cls._existsCache[s3Key] = exists
+            while len(cls._existsCache) > cls.EXISTS_CACHE_SIZE:
+                cls._existsCache.popitem(last=False)
+        return exists
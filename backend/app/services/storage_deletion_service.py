@@ -0,0 +1,48 @@
+"""
+Storage deletion service - deletes queued objects from storage.
+Runs in the background worker process (scripts/worker.py), never in a request.
+"""
+import sys
+from app.dao.storage_deletion_dao import StorageDeletionDAO
+from app.services.storage_factory import getStorageService
+from app.services.storage_utils import storageKeysFor
+
+
+class StorageDeletionService:
+    """Service class for draining the storage deletion queue"""
+
+    BATCH_SIZE = 100
+
+    @staticmethod
+    def processBatch(batchSize=None):
+        """
+        Claim one batch of due deletions, delete their objects (and image
+        variants) in bulk and record the outcome
+
+        Args:
+            batchSize (int, optional): Max deletions to claim (default BATCH_SIZE)
+
+        Returns:
+            int: Number of deletions attempted (0 when the queue is idle)
+        """
+        deletions = StorageDeletionDAO.getDueDeletions(limit=batchSize or StorageDeletionService.BATCH_SIZE)
+        if not deletions:
+            return 0
+
+        keysByDeletion = [(deletion, storageKeysFor(deletion.key, deletion.includeVariants)) for deletion in deletions]
+        allKeys = list(dict.fromkeys(key for _, keys in keysByDeletion for key in keys))
+
+        try:
+            failures = getStorageService().deleteObjects(allKeys)
+        except Exception as e:
+            failures = {key: str(e) for key in allKeys}
+
+        results = []
+        for deletion, keys in keysByDeletion:
+            errors = [f"{key}: {failures[key]}" for key in keys if key in failures]
+            if errors:
+                print(f"ERROR: Storage deletion {deletion.id} failed (attempt {deletion.attempts + 1}): {errors[0]}", file=sys.stderr)
+            results.append((deletion, '; '.join(errors) if errors else None))
+
+        StorageDeletionDAO.recordResults(results)
+        return len(results)
@@ -4,11 +4,18 @@ Storage Factory - Automatically select storage backend based on environment
 import os
 from app.services.file_storage_service import FileStorageService
 from app.services.s3_storage_service import S3StorageService
+from app.services.storage_utils import PROJECT_IMAGES, PROFILE_PHOTOS
 
 # Cache storage backend at module load to avoid repeated env lookups
 _cachedStorageBackend = os.getenv('STORAGE_BACKEND', 'local').lower()
 _cachedStorageService = None
 
+# Public URL path -> storage category of the images served under it
+IMAGE_URL_PATHS = {
+    '/api/portfolio/images/': PROJECT_IMAGES,
+    '/api/about/profile-photo/': PROFILE_PHOTOS,
+}
+
 
 def getStorageService():
     """
@@ -44,3 +51,12 @@ def getStorageService():
         _cachedStorageService = FileStorageService
 
     return _cachedStorageService
+
+
+def storageKeyForUrl(url):
+    """Storage key behind one of our image URLs, or None for external URLs"""
+    for path, category in IMAGE_URL_PATHS.items():
+        if url.startswith(path):
+            filename = url[len(path):].split('?', 1)[0]
+            return getStorageService().objectKey(category, filename)
+    return None
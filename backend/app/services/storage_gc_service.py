@@ -0,0 +1,159 @@
+"""
+Storage GC service - deletes stored objects nothing in the database references.
+
+Orphans appear when an image is uploaded but never attached to a project,
+when a deletion was lost, or when a file was written but its row was not.
+A run:
+1. collects the storage keys referenced by Project.imageUrl,
+   About.profilePhotoUrl and ResumePdfVersion.filePath (plus the variants of
+   referenced images, thumbnails of referenced PDFs and anything already in
+   the deletion queue)
+2. reconciles storage_blobs reference counts against those references
+3. streams the bucket listing (or walks uploads/) and batch-deletes every
+   unreferenced object older than the grace period
+
+Runs from scripts/storage_gc.py or on a schedule in scripts/worker.py.
+"""
+import os
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import text
+from app.dao import ProjectDAO, AboutDAO, ResumePdfDAO, StorageBlobDAO, StorageDeletionDAO
+from app.services.storage_factory import getStorageService, storageKeyForUrl
+from app.services.storage_utils import storageKeysFor
+
+
+class StorageGcService:
+    """Service class for reconciling storage against the database"""
+
+    GRACE_PERIOD_HOURS = float(os.getenv('STORAGE_GC_GRACE_HOURS', '24'))
+    DELETE_BATCH_SIZE = 1000
+    REPORT_SAMPLE_SIZE = 20
+    # pg advisory lock id, so only one worker runs the scheduled job at a time
+    ADVISORY_LOCK_ID = 7301001
+
+    @staticmethod
+    def collectReferences():
+        """
+        Storage keys the database refers to
+
+        Returns:
+            tuple: (referenceCounts: Counter of original keys, protectedKeys:
+            set of every key that must be kept, variants included)
+        """
+        referenceCounts = Counter()
+        for url in ProjectDAO.getImageUrls() + AboutDAO.getProfilePhotoUrls():
+            key = storageKeyForUrl(url)
+            if key:
+                referenceCounts[key] += 1
+        for filePath in ResumePdfDAO.getAllFilePaths():
+            referenceCounts[filePath] += 1
+
+        protectedKeys = set(referenceCounts)
+        # Image variants and PDF thumbnails live next to their originals
+        for key in referenceCounts:
+            protectedKeys.update(storageKeysFor(key, includeVariants=True))
+        # Queued deletions are the worker's job, not ours
+        for key, includeVariants in StorageDeletionDAO.getPendingKeys():
+            protectedKeys.update(storageKeysFor(key, includeVariants))
+        return referenceCounts, protectedKeys
+
+    @staticmethod
+    def run(dryRun=False, graceHours=None):
+        """
+        Reconcile storage against the database
+
+        Args:
+            dryRun (bool): Report what would be deleted without deleting
+            graceHours (float, optional): Keep unreferenced objects younger
+                than this (default GRACE_PERIOD_HOURS)
+
+        Returns:
+            dict: Report with scanned/orphaned/deleted counts and reclaimable
+            bytes (total and per prefix), blob reconciliation and a sample
+            of orphaned keys
+        """
+        graceHours = StorageGcService.GRACE_PERIOD_HOURS if graceHours is None else graceHours
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=graceHours)
+        StorageService = getStorageService()
+
+        referenceCounts, protectedKeys = StorageGcService.collectReferences()
+        report = {
+            'dryRun': dryRun,
+            'graceHours': graceHours,
+            'referencedKeys': len(referenceCounts),
+            'scannedObjects': 0,
+            'scannedBytes': 0,
+            'recentUnreferenced': 0,
+            'orphanedObjects': 0,
+            'reclaimableBytes': 0,
+            'deletedObjects': 0,
+            'failedObjects': 0,
+            'byPrefix': {},
+            'blobs': StorageBlobDAO.reconcileRefCounts(
+                referenceCounts, cutoff.replace(tzinfo=None), dryRun=dryRun
+            ),
+            'sample': []
+        }
+
+        batch = []
+        for key, size, lastModified in StorageService.listObjects():
+            report['scannedObjects'] += 1
+            report['scannedBytes'] += size
+            if key in protectedKeys:
+                continue
+            if lastModified > cutoff:
+                report['recentUnreferenced'] += 1
+                continue
+
+            report['orphanedObjects'] += 1
+            report['reclaimableBytes'] += size
+            prefix = key.rsplit('/', 1)[0] if '/' in key else ''
+            prefixStats = report['byPrefix'].setdefault(prefix, {'objects': 0, 'bytes': 0})
+            prefixStats['objects'] += 1
+            prefixStats['bytes'] += size
+            if len(report['sample']) < StorageGcService.REPORT_SAMPLE_SIZE:
+                report['sample'].append(key)
+
+            if not dryRun:
+                batch.append(key)
+                if len(batch) >= StorageGcService.DELETE_BATCH_SIZE:
+                    StorageGcService._deleteBatch(StorageService, batch, report)
+                    batch = []
+
+        if batch:
+            StorageGcService._deleteBatch(StorageService, batch, report)
+        return report
+
+    @staticmethod
+    def _deleteBatch(StorageService, keys, report):
+        """Delete orphans, skipping any key an upload has re-registered since the listing"""
+        reacquired = StorageBlobDAO.getTrackedKeys(keys)
+        keys = [key for key in keys if key not in reacquired]
+        failures = StorageService.deleteObjects(keys)
+        for key, error in failures.items():
+            print(f"ERROR: GC failed to delete {key}: {error}", file=sys.stderr)
+        report['deletedObjects'] += len(keys) - len(failures)
+        report['failedObjects'] += len(failures)
+
+    @staticmethod
+    def runExclusive(dryRun=False, graceHours=None):
+        """
+        run() under a Postgres advisory lock, for the scheduled job and the CLI
+
+        Returns:
+            dict: Report, or None if another process is already collecting
+        """
+        from app import db
+        with db.engine.connect() as connection:
+            locked = connection.execute(
+                text('SELECT pg_try_advisory_lock(:id)'), {'id': StorageGcService.ADVISORY_LOCK_ID}
+            ).scalar()
+            if not locked:
+                return None
+            try:
+                return StorageGcService.run(dryRun=dryRun, graceHours=graceHours)
+            finally:
+                connection.execute(text('SELECT pg_advisory_unlock(:id)'), {'id': StorageGcService.ADVISORY_LOCK_ID})
+                connection.commit()
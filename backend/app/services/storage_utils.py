@@ -2,13 +2,69 @@
 Shared storage validation utilities
 Used by both FileStorageService and S3StorageService
 """
+import hashlib
 import os
+from datetime import datetime, timezone
+from app.services.image_processing import allVariantFilenames, splitFilename
+
+# Object categories - each backend maps them to a key prefix (objectKey())
+PROJECT_IMAGES = 'projects'
+PROFILE_PHOTOS = 'profile'
+RESUMES = 'resumes'
 
 MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE_MB', '10')) * 1024 * 1024
 ALLOWED_EXTENSIONS = os.getenv('ALLOWED_EXTENSIONS', 'pdf').split(',')
 IMAGE_EXTENSIONS = ['jpg', 'jpeg', 'png', 'webp', 'gif']
 MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB
 
+# Name uploads by SHA-256 of their content so identical uploads share one
+# stored object (reference-counted in storage_blobs). Off: uuid-prefixed names.
+CONTENT_ADDRESSED_STORAGE = os.getenv('STORAGE_CONTENT_ADDRESSED', 'true').lower() == 'true'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Leading bytes each accepted format must start with (checked on upload so a
+# renamed file cannot be stored and served under the wrong Content-Type)
+FILE_SIGNATURES = {
+    'jpg': (b'\xff\xd8\xff',),
+    'jpeg': (b'\xff\xd8\xff',),
+    'png': (b'\x89PNG\r\n\x1a\n',),
+    'gif': (b'GIF87a', b'GIF89a'),
+}
+SNIFF_SIZE = 1024
+
+
+def uploadSize(file):
+    """Size of an upload - known without seeking when it was hashed while received"""
+    size = getattr(getattr(file, 'stream', None), 'size', None)
+    if size is not None:
+        return size
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+    return size
+
+
+def readHead(file):
+    """First SNIFF_SIZE bytes of an upload (file position is left at 0)"""
+    head = getattr(getattr(file, 'stream', None), 'head', None)
+    if head is not None:
+        return head
+    file.seek(0)
+    head = file.read(SNIFF_SIZE)
+    file.seek(0)
+    return head
+
+
+def matchesSignature(ext, head):
+    """Whether an upload's first bytes match the format its extension claims"""
+    if ext == 'pdf':
+        # Readers accept a few junk bytes before the header
+        return b'%PDF-' in head[:SNIFF_SIZE]
+    if ext == 'webp':
+        return head[:4] == b'RIFF' and head[8:12] == b'WEBP'
+    signatures = FILE_SIGNATURES.get(ext)
+    return signatures is None or head.startswith(signatures)
+
 
 def validateFile(file, allowedExtensions=None, maxSize=None):
     """
@@ -37,9 +93,7 @@ def validateFile(file, allowedExtensions=None, maxSize=None):
     if ext not in allowedExtensions:
         return False, f'Only {", ".join(allowedExtensions).upper()} files allowed'
 
-    file.seek(0, os.SEEK_END)
-    size = file.tell()
-    file.seek(0)
+    size = uploadSize(file)
 
     if size > maxSize:
         maxMb = maxSize / (1024 * 1024)
@@ -48,6 +102,9 @@ def validateFile(file, allowedExtensions=None, maxSize=None):
     if size == 0:
         return False, 'File is empty'
 
+    if not matchesSignature(ext, readHead(file)):
+        return False, f'File content is not a valid {ext.upper()}'
+
     return True, None
 
 
@@ -84,3 +141,135 @@ def getContentType(filename):
         'pdf': 'application/pdf'
     }
     return contentTypeMap.get(ext, 'application/octet-stream')
+
+
+def contentAddressedFilename(sha256, originalFilename):
+    """
+    Storage filename for content-addressed mode: '<sha256>.<ext>'
+
+    Args:
+        sha256: Hex digest of the content
+        originalFilename: Uploaded filename (only the extension is kept)
+
+    Returns:
+        str: Filename shared by every upload of the same bytes
+    """
+    ext = originalFilename.rsplit('.', 1)[-1].lower() if '.' in originalFilename else 'bin'
+    return f"{sha256}.{ext}"
+
+
+def hashFile(file):
+    """
+    SHA-256 and size of an uploaded file. Taken from the upload stream when
+    it was hashed while received (UploadRequest), otherwise read in chunks
+    and rewound.
+
+    Args:
+        file: Werkzeug FileStorage object (or file-like)
+
+    Returns:
+        tuple: (hex_digest: str, size: int)
+    """
+    stream = getattr(file, 'stream', None)
+    if hasattr(stream, 'hexdigest'):
+        return stream.hexdigest(), stream.size
+
+    digest = hashlib.sha256()
+    size = 0
+    file.seek(0)
+    while True:
+        chunk = file.read(HASH_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(0)
+    return digest.hexdigest(), size
+
+
+def thumbnailFilename(filename):
+    """Name of the first-page thumbnail stored next to a PDF"""
+    stem, _ = splitFilename(filename)
+    return f"{stem}.thumb.webp"
+
+
+def storageKeysFor(key, includeVariants=False):
+    """
+    Every stored key belonging to an object: the key itself and, for images,
+    the responsive variants stored next to it (for PDFs, the thumbnail).
+
+    Args:
+        key: S3 key or local relative path ('/'-separated)
+        includeVariants: Include image variant / PDF thumbnail keys
+
+    Returns:
+        list: Keys (variants may not all exist)
+    """
+    if not includeVariants:
+        return [key]
+    prefix, filename = key.rsplit('/', 1) if '/' in key else ('', key)
+    if filename.lower().endswith('.pdf'):
+        variants = [thumbnailFilename(filename)]
+    else:
+        variants = allVariantFilenames(filename)
+    return [key] + [f"{prefix}/{name}" if prefix else name for name in variants]
+
+
+def pdfThumbnailKey(key):
+    """Storage key of the first-page thumbnail stored next to a PDF"""
+    return storageKeysFor(key, includeVariants=True)[1]
+
+
+class StoredObject:
+    """
+    An opened stored object, as returned by StorageService.open().
+
+    Exactly one of file (a seekable binary file handle) or body (an iterator
+    of bytes) is set. When the backend already applied a byte range,
+    contentRange holds the Content-Range value and body covers only that
+    range; otherwise body/file is the whole object.
+    """
+
+    def __init__(self, size, contentType, etag=None, lastModified=None, file=None,
+                 body=None, length=None, contentRange=None, onClose=None):
+        self.size = size
+        self.contentType = contentType
+        self.etag = etag
+        self.lastModified = lastModified
+        self.file = file
+        self.body = body
+        self.length = size if length is None else length
+        self.contentRange = contentRange
+        self._onClose = onClose
+
+    @classmethod
+    def fromPath(cls, path, contentType, etag=None, lastModified=None):
+        """
+        Open a file on disk. The handle keeps the data readable even if the
+        file is unlinked afterwards.
+
+        Args:
+            path: Absolute path
+            contentType: MIME type
+            etag: ETag (default: derived from mtime and size)
+            lastModified: Aware datetime (default: the file's mtime)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        file = open(path, 'rb')
+        stat = os.fstat(file.fileno())
+        return cls(
+            size=stat.st_size,
+            contentType=contentType,
+            etag=etag or f"{stat.st_mtime_ns:x}-{stat.st_size:x}",
+            lastModified=lastModified or datetime.fromtimestamp(int(stat.st_mtime), timezone.utc),
+            file=file
+        )
+
+    def close(self):
+        """Release the file handle or connection"""
+        if self.file is not None:
+            self.file.close()
+        if self._onClose is not None:
+            self._onClose()
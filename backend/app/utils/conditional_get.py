@@ -0,0 +1,63 @@
+"""
+Conditional GET helpers - strong ETags and If-None-Match / 304 handling.
+Routes compute an ETag from a cheap watermark (version, updatedAt, mtime)
+or from the response body, and check it before serializing anything.
+"""
+from __future__ import annotations
+import hashlib
+from flask import Response, request
+
+# Public JSON may be stored by browsers/CDNs but must be revalidated on every use
+PUBLIC_REVALIDATE = 'public, no-cache'
+
+
+def computeEtag(*parts) -> str:
+    """
+    Build a strong ETag value from watermark parts or raw bytes.
+
+    Args:
+        *parts: Values identifying the representation (ids, timestamps, bytes)
+
+    Returns:
+        str: Unquoted ETag value
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()[:32]
+
+
+def isNotModified(etag: str) -> bool:
+    """Check whether the request's If-None-Match already matches this ETag."""
+    return request.if_none_match.contains_weak(etag)
+
+
+def notModifiedResponse(etag: str, cacheControl: str = PUBLIC_REVALIDATE) -> Response:
+    """Build an empty 304 response carrying the validators."""
+    response = Response(status=304)
+    return withValidators(response, etag, cacheControl)
+
+
+def withValidators(response: Response, etag: str, cacheControl: str = PUBLIC_REVALIDATE) -> Response:
+    """Attach ETag and Cache-Control headers to a response."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cacheControl
+    return response
+
+
+def conditionalJsonResponse(body: bytes, etag: str, cacheControl: str = PUBLIC_REVALIDATE) -> Response:
+    """
+    Return pre-serialized JSON, or a 304 if the client already has it.
+
+    Args:
+        body: Serialized JSON bytes
+        etag: Unquoted ETag for the body
+
+    Returns:
+        Response: 200 with body or 304 without
+    """
+    if isNotModified(etag):
+        return notModifiedResponse(etag, cacheControl)
+    response = Response(body, status=200, mimetype='application/json')
+    return withValidators(response, etag, cacheControl)
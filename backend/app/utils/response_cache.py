@@ -0,0 +1,85 @@
+"""
+In-process response cache keyed by content version.
+Holds ready-to-send response bodies (and their ETags) so hot public GETs
+skip the database.
+
+Each cache namespace (e.g. 'projects') has a version counter. DAO write
+methods call bumpCacheVersion() after committing, which makes every entry
+stored under the previous version unreachable. Entries also expire after
+RESPONSE_CACHE_TTL seconds so that other gunicorn workers (which keep their
+own counters) converge after an admin edit.
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+from collections import OrderedDict
+
+RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', '60'))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '256'))
+
+_lock = threading.Lock()
+_versions: dict[str, int] = {}
+_entries: OrderedDict[tuple, tuple[int, float, object]] = OrderedDict()
+
+
+def getCacheVersion(namespace: str) -> int:
+    """Return the current content version for a namespace."""
+    return _versions.get(namespace, 0)
+
+
+def bumpCacheVersion(namespace: str) -> int:
+    """
+    Invalidate every cached entry in a namespace by advancing its version.
+    Call after a successful commit of any write that changes the cached data.
+
+    Returns:
+        int: The new version
+    """
+    with _lock:
+        _versions[namespace] = _versions.get(namespace, 0) + 1
+        return _versions[namespace]
+
+
+def getCachedResponse(namespace: str, key: tuple = ()) -> object | None:
+    """
+    Look up a cached entry for the current version of a namespace.
+
+    Args:
+        namespace: Cache namespace (one per data set)
+        key: Variant key within the namespace (e.g. query params)
+
+    Returns:
+        The stored value (e.g. an (etag, body) tuple) or None if missing,
+        stale or expired
+    """
+    cacheKey = (namespace, key)
+    with _lock:
+        entry = _entries.get(cacheKey)
+        if entry is None:
+            return None
+
+        version, storedAt, value = entry
+        if version != _versions.get(namespace, 0) or time.monotonic() - storedAt > RESPONSE_CACHE_TTL:
+            del _entries[cacheKey]
+            return None
+
+        _entries.move_to_end(cacheKey)
+        return value
+
+
+def setCachedResponse(namespace: str, key: tuple, value: object, version: int) -> None:
+    """
+    Store a value under the version it was built from.
+    Pass the version read *before* querying so a write that lands while the
+    body is being built is never cached under the newer version.
+    """
+    with _lock:
+        if version != _versions.get(namespace, 0):
+            return
+
+        cacheKey = (namespace, key)
+        _entries[cacheKey] = (version, time.monotonic(), value)
+        _entries.move_to_end(cacheKey)
+        while len(_entries) > RESPONSE_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
@@ -0,0 +1,115 @@
+"""
+Stored file serving - one code path for local and S3 storage.
+
+Routes hand serveStoredObject() a storage key. The active storage service
+either names a redirect target (S3 in redirect mode) or opens the object
+(StorageService.open), and the response is built the same way for every
+backend:
+- ETag / Last-Modified validators, with If-None-Match and If-Modified-Since
+  answered by 304
+- single byte ranges answered by 206 (Accept-Ranges: bytes), applied by
+  seeking for file handles or by the backend itself for streams
+- file handles go out through wsgi.file_wrapper (sendfile where available)
+"""
+from __future__ import annotations
+from flask import Response, redirect, request
+from werkzeug.http import is_resource_modified
+from werkzeug.wsgi import wrap_file
+from app.services.storage_factory import getStorageService
+
+# Stored image names never change content (uuid- or sha256-named uploads)
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def _forwardableRange() -> str | None:
+    """
+    The request's Range header if a streaming backend may apply it directly:
+    a single range and no If-Range (If-Range needs the validators first).
+    """
+    if 'If-Range' in request.headers or request.range is None or len(request.range.ranges) != 1:
+        return None
+    return request.headers.get('Range')
+
+
+def _notModified(etag: str | None, lastModified, cacheControl: str | None) -> Response:
+    """Empty 304 carrying the validators"""
+    response = Response(status=304)
+    if etag:
+        response.set_etag(etag)
+    if lastModified:
+        response.last_modified = lastModified
+    if cacheControl:
+        response.headers['Cache-Control'] = cacheControl
+    return response
+
+
+def serveStoredObject(key: str, contentType: str | None = None, cacheControl: str | None = None,
+                      headers: dict | None = None, redirectCacheControl: str | None = None,
+                      downloadName: str | None = None, asAttachment: bool = False,
+                      etag: str | None = None, lastModified=None) -> Response | None:
+    """
+    Serve a stored object with conditional and range request support.
+
+    Args:
+        key: Storage key (StorageService.objectKey() or a stored file path)
+        contentType: Content-Type (default: from the key's extension)
+        cacheControl: Cache-Control for the served bytes
+        headers: Extra response headers
+        redirectCacheControl: Cache-Control for a redirect (default depends
+            on whether the target is a stable CDN URL or an expiring presigned URL)
+        downloadName: Filename for Content-Disposition
+        asAttachment: Content-Disposition attachment instead of inline
+        etag: Validator known from the database (replaces the backend's).
+            With etag/lastModified, a matching If-None-Match or
+            If-Modified-Since is answered without touching storage.
+        lastModified: Aware datetime validator known from the database
+
+    Returns:
+        Response (200, 206, 304 or 302), or None if the object does not exist
+    """
+    StorageService = getStorageService()
+
+    redirectTarget = StorageService.getRedirect(key)
+    if redirectTarget is not None:
+        url, defaultCacheControl = redirectTarget
+        response = redirect(url, code=302)
+        response.headers['Cache-Control'] = redirectCacheControl or defaultCacheControl
+        return response
+
+    if (etag or lastModified) and not is_resource_modified(request.environ, etag=etag, last_modified=lastModified):
+        return _notModified(etag, lastModified, cacheControl)
+
+    stored = StorageService.open(key, byteRange=_forwardableRange())
+    if stored is None:
+        return None
+    if etag or lastModified:
+        stored.etag, stored.lastModified = etag, lastModified
+
+    body = wrap_file(request.environ, stored.file) if stored.file is not None else stored.body
+    response = Response(body, mimetype=contentType or stored.contentType, direct_passthrough=True)
+    response.call_on_close(stored.close)
+    if stored.etag:
+        response.set_etag(stored.etag)
+    if stored.lastModified:
+        response.last_modified = stored.lastModified
+    if downloadName:
+        response.headers.set('Content-Disposition', 'attachment' if asAttachment else 'inline', filename=downloadName)
+    response.headers.update(headers or {})
+    if cacheControl:
+        response.headers['Cache-Control'] = cacheControl
+
+    if stored.contentRange:
+        # The backend already applied the range; only validators are left to check
+        if not is_resource_modified(request.environ, etag=stored.etag, last_modified=stored.lastModified):
+            stored.close()
+            return _notModified(stored.etag, stored.lastModified, cacheControl)
+        response.status_code = 206
+        response.headers['Content-Range'] = stored.contentRange
+        response.accept_ranges = 'bytes'
+        if stored.length is not None:
+            response.content_length = stored.length
+        return response
+
+    if stored.length is not None:
+        response.content_length = stored.length
+    return response.make_conditional(request, accept_ranges=True, complete_length=stored.size)
@@ -0,0 +1,75 @@
+"""
+Upload streaming - hash and sniff multipart files while they are received.
+
+Werkzeug's form parser writes each uploaded file into a stream returned by
+Request._get_file_stream. UploadRequest hands it a HashingSpooledFile, so
+the SHA-256, size and first bytes of an upload are known once the body has
+been read - validation and content-addressed storage never re-read the file
+to compute them, and the bytes are read only once more when they are
+stored.
+
+rejectOversizedUpload() checks Content-Length before the body is touched,
+so an oversized upload is refused without reading (or spooling) any of it.
+"""
+from __future__ import annotations
+import hashlib
+from tempfile import SpooledTemporaryFile
+from flask import Request, Response, jsonify, request
+
+# Same in-memory threshold as Werkzeug's default stream factory
+SPOOL_MAX_SIZE = 500 * 1024
+
+# Room for multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class HashingSpooledFile(SpooledTemporaryFile):
+    """SpooledTemporaryFile that hashes, counts and keeps the head of what is written"""
+
+    HEAD_SIZE = 1024
+
+    def __init__(self, maxSize: int = SPOOL_MAX_SIZE):
+        super().__init__(max_size=maxSize, mode='w+b')
+        self._digest = hashlib.sha256()
+        self.size = 0
+        self.head = b''
+
+    def write(self, data) -> int:
+        self._digest.update(data)
+        self.size += len(data)
+        if len(self.head) < self.HEAD_SIZE:
+            self.head += bytes(data[:self.HEAD_SIZE - len(self.head)])
+        return super().write(data)
+
+    def hexdigest(self) -> str:
+        """SHA-256 of everything written so far"""
+        return self._digest.hexdigest()
+
+
+class UploadRequest(Request):
+    """Request whose uploaded files are hashed as they are parsed"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return HashingSpooledFile()
+
+
+def uploadRequestLimit(maxFileSize: int) -> int:
+    """Largest request body accepted for a single file of maxFileSize bytes"""
+    return maxFileSize + MULTIPART_OVERHEAD
+
+
+def rejectOversizedUpload(maxFileSize: int) -> tuple[Response, int] | None:
+    """
+    Refuse an upload from its Content-Length alone, before reading the body.
+
+    Args:
+        maxFileSize: Largest file the endpoint accepts, in bytes
+
+    Returns:
+        (response, 413) if the declared body is too large, else None.
+        Bodies without Content-Length are still capped by MAX_CONTENT_LENGTH.
+    """
+    if request.content_length is not None and request.content_length > uploadRequestLimit(maxFileSize):
+        maxMb = maxFileSize / (1024 * 1024)
+        return jsonify({'success': False, 'error': f'File too large. Maximum size: {maxMb:.0f}MB'}), 413
+    return None
@@ -0,0 +1,43 @@
+"""add search_vector to projects
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(json_to_tsvector('english', coalesce(technologies, '[]'::json), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+
+def upgrade():
+    op.add_column('projects', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True
+    ))
+    op.create_index(
+        'ix_projects_search_vector', 'projects', ['search_vector'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_projects_search_vector', table_name='projects', postgresql_using='gin')
+    op.drop_column('projects', 'search_vector')
@@ -0,0 +1,28 @@
+"""add technologies gin index to projects
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Expression index matching CAST(technologies AS JSONB) @> '[...]' filters
+    op.execute(
+        'CREATE INDEX ix_projects_technologies ON projects '
+        'USING gin ((technologies::jsonb) jsonb_path_ops)'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_projects_technologies', table_name='projects')
@@ -0,0 +1,41 @@
+"""add inbox pagination indexes to contact_submissions
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keyset pagination walks (submitted_at, id) backwards
+    op.create_index(
+        'ix_contact_submissions_submitted_at_id', 'contact_submissions',
+        ['submitted_at', 'id'], unique=False
+    )
+    # Default inbox view: non-archived, optionally filtered by read status
+    op.create_index(
+        'ix_contact_submissions_active', 'contact_submissions',
+        ['submitted_at', 'id'], unique=False,
+        postgresql_where=sa.text('archived_at IS NULL')
+    )
+    op.create_index(
+        'ix_contact_submissions_active_read', 'contact_submissions',
+        ['read', 'submitted_at', 'id'], unique=False,
+        postgresql_where=sa.text('archived_at IS NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_contact_submissions_active_read', table_name='contact_submissions')
+    op.drop_index('ix_contact_submissions_active', table_name='contact_submissions')
+    op.drop_index('ix_contact_submissions_submitted_at_id', table_name='contact_submissions')
@@ -0,0 +1,40 @@
+"""add image dimensions and placeholders to projects and about_me
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('image_width', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('image_height', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('image_placeholder', sa.Text(), nullable=True))
+
+    with op.batch_alter_table('about_me', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('profile_photo_width', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('profile_photo_height', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('profile_photo_placeholder', sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('about_me', schema=None) as batch_op:
+        batch_op.drop_column('profile_photo_placeholder')
+        batch_op.drop_column('profile_photo_height')
+        batch_op.drop_column('profile_photo_width')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_column('image_placeholder')
+        batch_op.drop_column('image_height')
+        batch_op.drop_column('image_width')
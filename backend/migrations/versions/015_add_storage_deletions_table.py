@@ -0,0 +1,47 @@
+"""add storage_deletions table
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('storage_deletions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=500), nullable=False),
+    sa.Column('include_variants', sa.Boolean(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Worker poll: pending rows ordered by due time
+    op.create_index(
+        'ix_storage_deletions_pending', 'storage_deletions', ['next_attempt_at'], unique=False,
+        postgresql_where=sa.text("status = 'pending'")
+    )
+    # Re-uploads cancel pending deletions of the same key
+    op.create_index(
+        'ix_storage_deletions_pending_key', 'storage_deletions', ['key'], unique=False,
+        postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def downgrade():
+    op.drop_index('ix_storage_deletions_pending_key', table_name='storage_deletions')
+    op.drop_index('ix_storage_deletions_pending', table_name='storage_deletions')
+    op.drop_table('storage_deletions')
@@ -0,0 +1,36 @@
+"""add unique active index to resume_pdf_versions
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the newest active version before enforcing a single one
+    op.execute(
+        'UPDATE resume_pdf_versions SET is_active = false '
+        'WHERE is_active AND id <> ('
+        'SELECT id FROM resume_pdf_versions WHERE is_active '
+        'ORDER BY created_at DESC, id DESC LIMIT 1)'
+    )
+    # At most one active version; the active lookup is a single index probe
+    op.create_index(
+        'ix_resume_pdf_versions_active', 'resume_pdf_versions',
+        ['is_active'], unique=True,
+        postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_resume_pdf_versions_active', table_name='resume_pdf_versions')
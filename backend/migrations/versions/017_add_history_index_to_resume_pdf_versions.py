@@ -0,0 +1,28 @@
+"""add history pagination index to resume_pdf_versions
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keyset pagination walks (created_at, id) backwards
+    op.create_index(
+        'ix_resume_pdf_versions_created_at_id', 'resume_pdf_versions',
+        ['created_at', 'id'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_resume_pdf_versions_created_at_id', table_name='resume_pdf_versions')
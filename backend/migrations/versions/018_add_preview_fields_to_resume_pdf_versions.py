@@ -0,0 +1,47 @@
+"""add preview fields to resume_pdf_versions
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing versions start as pending, so the worker backfills their previews
+    with op.batch_alter_table('resume_pdf_versions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('preview_status', sa.String(length=20), nullable=False, server_default='pending'))
+        batch_op.add_column(sa.Column('preview_attempts', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('page_count', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('has_text_layer', sa.Boolean(), nullable=True))
+        batch_op.add_column(sa.Column('text_excerpt', sa.String(length=500), nullable=True))
+        batch_op.add_column(sa.Column('thumbnail_width', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('thumbnail_height', sa.Integer(), nullable=True))
+
+    # Worker poll: versions still waiting for a preview
+    op.create_index(
+        'ix_resume_pdf_versions_preview_pending', 'resume_pdf_versions', ['id'], unique=False,
+        postgresql_where=sa.text("preview_status = 'pending'")
+    )
+
+
+def downgrade():
+    op.drop_index('ix_resume_pdf_versions_preview_pending', table_name='resume_pdf_versions')
+
+    with op.batch_alter_table('resume_pdf_versions', schema=None) as batch_op:
+        batch_op.drop_column('thumbnail_height')
+        batch_op.drop_column('thumbnail_width')
+        batch_op.drop_column('text_excerpt')
+        batch_op.drop_column('has_text_layer')
+        batch_op.drop_column('page_count')
+        batch_op.drop_column('preview_attempts')
+        batch_op.drop_column('preview_status')
@@ -0,0 +1,45 @@
+"""add preview retry backoff to resume_pdf_versions
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('resume_pdf_versions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('preview_next_attempt_at', sa.DateTime(), nullable=True))
+
+    # Existing versions are due straight away (created_at is UTC, like utcnow())
+    op.execute('UPDATE resume_pdf_versions SET preview_next_attempt_at = created_at')
+
+    with op.batch_alter_table('resume_pdf_versions', schema=None) as batch_op:
+        batch_op.alter_column('preview_next_attempt_at', existing_type=sa.DateTime(), nullable=False)
+
+    # Worker poll: pending previews that are due, like the outbox and deletion queues
+    op.drop_index('ix_resume_pdf_versions_preview_pending', table_name='resume_pdf_versions')
+    op.create_index(
+        'ix_resume_pdf_versions_preview_pending', 'resume_pdf_versions', ['preview_next_attempt_at'], unique=False,
+        postgresql_where=sa.text("preview_status = 'pending'")
+    )
+
+
+def downgrade():
+    op.drop_index('ix_resume_pdf_versions_preview_pending', table_name='resume_pdf_versions')
+    op.create_index(
+        'ix_resume_pdf_versions_preview_pending', 'resume_pdf_versions', ['id'], unique=False,
+        postgresql_where=sa.text("preview_status = 'pending'")
+    )
+
+    with op.batch_alter_table('resume_pdf_versions', schema=None) as batch_op:
+        batch_op.drop_column('preview_next_attempt_at')
@@ -0,0 +1,28 @@
+"""add written flag to storage_blobs
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows were only kept once their upload succeeded. Their ref_count
+    # was counted per upload; storage GC recounts it from the attached rows.
+    with op.batch_alter_table('storage_blobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('written', sa.Boolean(), nullable=False, server_default=sa.true()))
+
+
+def downgrade():
+    with op.batch_alter_table('storage_blobs', schema=None) as batch_op:
+        batch_op.drop_column('written')
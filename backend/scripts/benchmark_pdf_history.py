@@ -0,0 +1,121 @@
+"""
+Benchmark database round trips for the resume PDF version history.
+
+Compares the old history listing (every version, with toDict() lazy-loading
+each row's uploader - one extra SELECT per distinct uploader) with
+ResumePdfDAO.getAllVersions, which joins uploaders into a single keyset
+paginated query per page.
+
+Runs against a throwaway SQLite file by default. Pass --database-url to
+measure against a scratch Postgres database (tables are created and
+dropped, so never point it at real data).
+
+Usage: python scripts/benchmark_pdf_history.py [--database-url URL] [--sizes 10,100,500] [--page-size 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def legacyHistory(ResumePdfVersion):
+    """The previous implementation: unbounded query, uploaders lazy-loaded by toDict()"""
+    versions = ResumePdfVersion.query.filter_by(deletedAt=None)\
+                                     .order_by(ResumePdfVersion.createdAt.desc()).all()
+    return [version.toDict() for version in versions]
+
+
+def pagedHistory(ResumePdfDAO, pageSize, pages=None):
+    """Walk the history page by page (all pages when pages is None)"""
+    cursor = None
+    walked = 0
+    while True:
+        versions, cursor = ResumePdfDAO.getAllVersions(limit=pageSize, cursor=cursor)
+        [version.toDict() for version in versions]
+        walked += 1
+        if cursor is None or (pages is not None and walked >= pages):
+            return walked
+
+
+def measure(db, fn):
+    """Run fn and return (statement_count, elapsed_ms)"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def countStatement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', countStatement)
+    try:
+        db.session.expunge_all()
+        start = time.perf_counter()
+        fn()
+        elapsedMs = (time.perf_counter() - start) * 1000
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', countStatement)
+    return len(statements), elapsedMs
+
+
+def run(databaseUrl, sizes, pageSize):
+    os.environ['DATABASE_URL'] = databaseUrl
+
+    from app import create_app, db
+    from app.dao import ResumePdfDAO
+    from app.models import ResumePdfVersion, User
+
+    app = create_app()
+    with app.app_context():
+        tables = [User.__table__, ResumePdfVersion.__table__]
+        db.metadata.drop_all(db.engine, tables=tables, checkfirst=True)
+        db.metadata.create_all(db.engine, tables=tables)
+
+        print(f"{'versions':>8} | {'legacy stmts':>12} | {'legacy ms':>9} | "
+              f"{'page stmts':>10} | {'page ms':>7} | {'all pages':>9} | {'all stmts':>9}")
+        print('-' * 85)
+        for size in sizes:
+            db.session.execute(ResumePdfVersion.__table__.delete())
+            db.session.execute(User.__table__.delete())
+            # One uploader per version - the worst case for lazy loading
+            users = [User(username=f'admin{i}', email=f'admin{i}@example.com') for i in range(size)]
+            db.session.add_all(users)
+            db.session.flush()
+            start = datetime.utcnow() - timedelta(days=size)
+            db.session.add_all([
+                ResumePdfVersion(
+                    fileName=f'cv-{i}.pdf', filePath=f'resumes/cv-{i}.pdf', fileSize=100000,
+                    isActive=i == size - 1, uploadedByUserId=users[i].id,
+                    createdAt=start + timedelta(days=i)
+                )
+                for i in range(size)
+            ])
+            db.session.commit()
+
+            legacyCount, legacyMs = measure(db, lambda: legacyHistory(ResumePdfVersion))
+            pageCount, pageMs = measure(db, lambda: pagedHistory(ResumePdfDAO, pageSize, pages=1))
+            pagesWalked = [0]
+            allCount, _ = measure(db, lambda: pagesWalked.__setitem__(0, pagedHistory(ResumePdfDAO, pageSize)))
+            print(f"{size:>8} | {legacyCount:>12} | {legacyMs:>9.1f} | "
+                  f"{pageCount:>10} | {pageMs:>7.1f} | {pagesWalked[0]:>9} | {allCount:>9}")
+
+        db.session.remove()
+        db.metadata.drop_all(db.engine, tables=tables)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database-url', help='Scratch database URL (default: temporary SQLite file)')
+    parser.add_argument('--sizes', default='10,100,500', help='Comma-separated version counts')
+    parser.add_argument('--page-size', type=int, default=20, help='Versions per history page')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    if args.database_url:
+        run(args.database_url, sizes, args.page_size)
+    else:
+        with tempfile.TemporaryDirectory() as tmpDir:
+            run(f"sqlite:///{os.path.join(tmpDir, 'benchmark.db')}", sizes, args.page_size)
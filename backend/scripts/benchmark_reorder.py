@@ -0,0 +1,112 @@
+"""
+Benchmark database round trips for reordering projects.
+
+Compares the old per-row reorder (one SELECT per project, one UPDATE per
+project at flush) with ProjectDAO.updateDisplayOrder, which applies the
+whole ordering in a single UPDATE ... CASE ... RETURNING statement.
+
+Runs against a throwaway SQLite file by default. Pass --database-url to
+measure against a scratch Postgres database (tables are created and
+dropped, so never point it at real data). SQLite cannot render the
+Postgres-only search_vector column, so there the table is created
+without it; reorders never touch that column.
+
+Usage: python scripts/benchmark_reorder.py [--database-url URL] [--sizes 10,100,1000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def legacyReorder(db, Project, orderUpdates):
+    """The previous implementation: Project.query.get() and UPDATE per row"""
+    for update in orderUpdates:
+        project = Project.query.get(update['id'])
+        if project:
+            project.displayOrder = update['displayOrder']
+    db.session.commit()
+
+
+def createTable(db, Project):
+    """Create a fresh projects table, leaving out search_vector outside Postgres"""
+    from sqlalchemy import MetaData, Table
+
+    table = Project.__table__
+    if db.engine.dialect.name != 'postgresql':
+        table = Table(table.name, MetaData(), *[
+            column._copy() for column in table.columns if column.name != 'search_vector'
+        ])
+    table.drop(db.engine, checkfirst=True)
+    table.create(db.engine)
+    return table
+
+
+def measure(db, fn):
+    """Run fn and return (statement_count, elapsed_ms)"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def countStatement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', countStatement)
+    try:
+        db.session.expunge_all()
+        start = time.perf_counter()
+        fn()
+        elapsedMs = (time.perf_counter() - start) * 1000
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', countStatement)
+    return len(statements), elapsedMs
+
+
+def run(databaseUrl, sizes):
+    os.environ['DATABASE_URL'] = databaseUrl
+
+    from app import create_app, db
+    from app.dao import ProjectDAO
+    from app.models import Project
+
+    app = create_app()
+    with app.app_context():
+        table = createTable(db, Project)
+
+        print(f"{'projects':>8} | {'legacy stmts':>12} | {'legacy ms':>9} | {'bulk stmts':>10} | {'bulk ms':>7}")
+        print('-' * 60)
+        for size in sizes:
+            db.session.execute(table.delete())
+            db.session.execute(table.insert(), [
+                {'title': f'Project {i}', 'description': 'benchmark', 'technologies': [], 'display_order': i}
+                for i in range(size)
+            ])
+            db.session.commit()
+
+            ids = [row[0] for row in db.session.query(Project.id).order_by(Project.id).all()]
+            reversedOrder = [{'id': pid, 'displayOrder': size - i} for i, pid in enumerate(ids)]
+            forwardOrder = [{'id': pid, 'displayOrder': i} for i, pid in enumerate(ids)]
+
+            legacyCount, legacyMs = measure(db, lambda: legacyReorder(db, Project, reversedOrder))
+            bulkCount, bulkMs = measure(db, lambda: ProjectDAO.updateDisplayOrder(forwardOrder))
+            print(f"{size:>8} | {legacyCount:>12} | {legacyMs:>9.1f} | {bulkCount:>10} | {bulkMs:>7.1f}")
+
+        db.session.remove()
+        table.drop(db.engine)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--database-url', help='Scratch database URL (default: temporary SQLite file)')
+    parser.add_argument('--sizes', default='10,100,1000', help='Comma-separated project counts')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    if args.database_url:
+        run(args.database_url, sizes)
+    else:
+        with tempfile.TemporaryDirectory() as tmpDir:
+            run(f"sqlite:///{os.path.join(tmpDir, 'benchmark.db')}", sizes)
@@ -0,0 +1,96 @@
+"""
+Benchmark gunicorn worker occupancy for S3 image serving: proxy vs redirect.
+
+Starts a local bandwidth-throttled HTTP server standing in for S3, points
+presigned URLs at it, and requests /api/portfolio/images/<file> through the
+Flask app in each S3_SERVE_MODE. Worker occupancy is the time the request
+handler holds the worker: in proxy mode that is the whole transfer; in
+redirect mode it ends once the 302 is written.
+
+Usage: python scripts/benchmark_s3_serving.py [--size-kb 500] [--bandwidth-mbps 20] [--requests 20]
+"""
+import argparse
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def startOrigin(sizeBytes, bandwidthMbps):
+    """Serve a fixed-size body at roughly bandwidthMbps (simulated S3 origin)"""
+    body = os.urandom(sizeBytes)
+    chunkSize = 16384
+    chunkDelay = chunkSize * 8 / (bandwidthMbps * 1_000_000)
+
+    class OriginHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/jpeg')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            for offset in range(0, len(body), chunkSize):
+                self.wfile.write(body[offset:offset + chunkSize])
+                time.sleep(chunkDelay)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), OriginHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(sizeKb, bandwidthMbps, requestCount):
+    origin = startOrigin(sizeKb * 1024, bandwidthMbps)
+    originUrl = f'http://127.0.0.1:{origin.server_port}'
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmpDir, 'benchmark.db')}"
+        os.environ['STORAGE_BACKEND'] = 's3'
+        for name in ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_S3_BUCKET'):
+            os.environ.setdefault(name, 'benchmark')
+
+        from app import create_app
+        from app.services.s3_storage_service import S3StorageService
+        from app.services.s3_disk_cache import S3DiskCache
+
+        # Presign against the local origin instead of AWS; measure the
+        # streaming path rather than disk cache hits
+        S3StorageService.getFilePath = classmethod(lambda cls, key: f'{originUrl}/{key}')
+        S3DiskCache.MAX_BYTES = 0
+
+        app = create_app()
+        client = app.test_client()
+
+        print(f"object {sizeKb} KB at {bandwidthMbps} Mbit/s, {requestCount} requests per mode")
+        print(f"{'mode':>8} | {'status':>6} | {'avg ms/req':>10} | {'worker-s':>8} | {'req/s (2 workers)':>17}")
+        print('-' * 62)
+        for mode in (S3StorageService.SERVE_MODE_PROXY, S3StorageService.SERVE_MODE_REDIRECT):
+            S3StorageService.SERVE_MODE = mode
+            status = None
+            start = time.perf_counter()
+            for _ in range(requestCount):
+                # Reading the full body mirrors a sync worker streaming it to the client
+                response = client.get('/api/portfolio/images/benchmark.jpg')
+                response.get_data()
+                status = response.status_code
+            busySeconds = time.perf_counter() - start
+            avgMs = busySeconds / requestCount * 1000
+            print(f"{mode:>8} | {status:>6} | {avgMs:>10.1f} | {busySeconds:>8.2f} | {2000 / avgMs:>17.1f}")
+
+    origin.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-kb', type=int, default=500, help='Object size in KB (default 500)')
+    parser.add_argument('--bandwidth-mbps', type=float, default=20, help='Simulated S3 bandwidth (default 20)')
+    parser.add_argument('--requests', type=int, default=20, help='Requests per mode (default 20)')
+    args = parser.parse_args()
+    run(args.size_kb, args.bandwidth_mbps, args.requests)
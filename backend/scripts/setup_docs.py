@@ -31,7 +31,8 @@ def downloadAndExtract(slug, repo, branch):
         token = os.getenv('GITHUB_TOKEN')
         if token:
             headers['Authorization'] = f'Bearer {token}'
-        resp = requests.get(url, headers=headers, timeout=30)
+        # (connect, read) - a one-shot script, so a plain request without the app's pools
+        resp = requests.get(url, headers=headers, timeout=(5, 30))
         resp.raise_for_status()
         data = resp.content
     except Exception as e:
@@ -0,0 +1,75 @@
+"""
+Storage garbage collector - delete uploads nothing in the database references.
+
+Compares the bucket (or uploads/) against project images, the profile photo
+and resume PDF versions, and deletes unreferenced objects older than the
+grace period. Also corrects storage_blobs reference counts. The worker runs
+the same job on a schedule (STORAGE_GC_INTERVAL_HOURS); both take the same
+advisory lock, so a manual run never overlaps a scheduled one.
+
+Usage: python scripts/storage_gc.py [--dry-run] [--grace-hours HOURS] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app
+from app.services.storage_gc_service import StorageGcService
+
+
+def formatBytes(size):
+    if size < 1024:
+        return f"{size} B"
+    for unit in ('KB', 'MB', 'GB'):
+        size /= 1024
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f} {unit}"
+
+
+def printReport(report):
+    action = 'Would delete' if report['dryRun'] else 'Deleted'
+    print(f"Scanned {report['scannedObjects']} object(s), {formatBytes(report['scannedBytes'])}")
+    print(f"Referenced keys: {report['referencedKeys']}")
+    print(f"Unreferenced but within {report['graceHours']:g}h grace period: {report['recentUnreferenced']}")
+    print(f"Orphaned: {report['orphanedObjects']} object(s), {formatBytes(report['reclaimableBytes'])} reclaimable")
+    for prefix, stats in sorted(report['byPrefix'].items()):
+        print(f"  {prefix or '(root)'}: {stats['objects']} object(s), {formatBytes(stats['bytes'])}")
+    for key in report['sample']:
+        print(f"  - {key}")
+    if not report['dryRun']:
+        print(f"{action} {report['deletedObjects']} object(s), {report['failedObjects']} failed")
+    blobs = report['blobs']
+    verb = 'would be' if report['dryRun'] else 'were'
+    print(f"Blob reference counts: {blobs['updated']} {verb} corrected, {blobs['dropped']} unreferenced {verb} dropped")
+    print(f"  Kept within {report['graceHours']:g}h grace period (not lowered): {blobs['skipped']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dry-run', action='store_true', help='Report reclaimable objects without deleting')
+    parser.add_argument(
+        '--grace-hours', type=float, default=None,
+        help=f'Keep unreferenced objects younger than this (default {StorageGcService.GRACE_PERIOD_HOURS:g})'
+    )
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        report = StorageGcService.runExclusive(dryRun=args.dry_run, graceHours=args.grace_hours)
+
+    if report is None:
+        print('Another GC is running (advisory lock held); try again later', file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        printReport(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Background worker - drains the durable email outbox, storage deletion and PDF preview queues.
+
+Contact submissions enqueue their notification email in the same database
+transaction as the submission itself; this process delivers them with
+retries and exponential backoff (see EmailOutboxDAO). Replaced or deleted
+project images and profile photos are queued the same way and removed from
+storage in bulk (see StorageDeletionDAO). Uploaded resume PDFs start with a
+pending preview; the worker renders their first-page thumbnail and reads
+page count and text-layer metadata (see PdfPreviewService). Several workers
+can run side by side: rows are claimed with FOR UPDATE SKIP LOCKED.
+
+Every STORAGE_GC_INTERVAL_HOURS (default 24, 0 disables) the worker also
+runs the storage garbage collector (see scripts/storage_gc.py); a Postgres
+advisory lock keeps it to one worker at a time.
+
+Usage: python scripts/worker.py [--once] [--poll-interval SECONDS]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app, db
+from app.services.email_outbox_service import EmailOutboxService
+from app.services.storage_deletion_service import StorageDeletionService
+from app.services.pdf_preview_service import PdfPreviewService
+from app.services.storage_gc_service import StorageGcService
+
+# Queue services drained on every pass (each has processBatch() and BATCH_SIZE)
+QUEUES = (EmailOutboxService, StorageDeletionService, PdfPreviewService)
+
+
+def drain(queueService):
+    """Process batches until the queue has no more due rows"""
+    total = 0
+    while True:
+        attempted = queueService.processBatch()
+        total += attempted
+        if attempted < queueService.BATCH_SIZE:
+            return total
+
+
+def runScheduledGc():
+    """Run the storage GC unless another worker holds the lock"""
+    report = StorageGcService.runExclusive()
+    if report is None:
+        print("Storage GC skipped: another worker is running it")
+        return
+    print(
+        f"Storage GC: deleted {report['deletedObjects']} orphaned object(s) "
+        f"({report['reclaimableBytes']} bytes), {report['failedObjects']} failed"
+    )
+
+
+def runOnce():
+    """Drain every queue, returning {queue service name: rows attempted}"""
+    return {queueService.__name__: drain(queueService) for queueService in QUEUES}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+    parser.add_argument(
+        '--poll-interval', type=float,
+        default=float(os.getenv('WORKER_POLL_INTERVAL', '5')),
+        help='Seconds to sleep when the queue is idle (default 5)'
+    )
+    args = parser.parse_args()
+    gcIntervalSeconds = float(os.getenv('STORAGE_GC_INTERVAL_HOURS', '24')) * 3600
+    # First collection one interval after start, not on every deploy
+    nextGcAt = time.monotonic() + gcIntervalSeconds
+
+    app = create_app()
+    with app.app_context():
+        if args.once:
+            for name, attempted in runOnce().items():
+                print(f"{name}: processed {attempted}")
+            return
+
+        print(f"Worker started (poll interval {args.poll_interval}s)")
+        while True:
+            try:
+                runOnce()
+                if gcIntervalSeconds > 0 and time.monotonic() >= nextGcAt:
+                    nextGcAt = time.monotonic() + gcIntervalSeconds
+                    runScheduledGc()
+            except Exception as e:
+                db.session.rollback()
+                print(f"ERROR: Worker iteration failed: {str(e)}", file=sys.stderr)
+            finally:
+                db.session.remove()
+            time.sleep(args.poll_interval)
+
+
+if __name__ == '__main__':
+    main()
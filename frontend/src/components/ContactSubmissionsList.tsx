@@ -29,8 +29,10 @@ const ContactSubmissionsList: React.FC<ContactSubmissionsListProps> = ({ onSubmi
   const [readFilter, setReadFilter] = useState<'all' | 'read' | 'unread'>('all');
   const [includeArchived, setIncludeArchived] = useState(false);
 
-  // Pagination
+  // Pagination (keyset: pageCursors[n] is the cursor that loads page n)
   const [page, setPage] = useState(0);
+  const [pageCursors, setPageCursors] = useState<(string | null)[]>([null]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const limit = 20;
 
   const loadSubmissions = async () => {
@@ -39,13 +41,14 @@ const ContactSubmissionsList: React.FC<ContactSubmissionsListProps> = ({ onSubmi
     try {
       const response = await contactRepository.getSubmissions(
         limit,
-        page * limit,
+        pageCursors[page] ?? null,
         readFilter,
         includeArchived
       );
       if (response.success) {
         setSubmissions(response.data.submissions || []);
         setTotal(response.data.total || 0);
+        setNextCursor(response.data.nextCursor ?? null);
       } else {
         setError(response.error || 'Failed to load submissions');
       }
@@ -119,7 +122,20 @@ const ContactSubmissionsList: React.FC<ContactSubmissionsListProps> = ({ onSubmi
     });
   };
 
-  const totalPages = Math.ceil(total / limit);
+  const resetPagination = () => {
+    setPage(0);
+    setPageCursors([null]);
+  };
+
+  const goToNextPage = () => {
+    if (!nextCursor) return;
+    setPageCursors(prev => {
+      const cursors = prev.slice(0, page + 1);
+      cursors[page + 1] = nextCursor;
+      return cursors;
+    });
+    setPage(page + 1);
+  };
 
   if (loading) {
     return (
@@ -150,7 +166,7 @@ const ContactSubmissionsList: React.FC<ContactSubmissionsListProps> = ({ onSubmi
             value={readFilter}
             onChange={(e) => {
               setReadFilter(e.target.value as 'all' | 'read' | 'unread');
-              setPage(0);
+              resetPagination();
             }}
             className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-orange-500 focus:border-orange-500"
           >
@@ -168,7 +184,7 @@ const ContactSubmissionsList: React.FC<ContactSubmissionsListProps> = ({ onSubmi
             checked={includeArchived}
             onChange={(e) => {
               setIncludeArchived(e.target.checked);
-              setPage(0);
+              resetPagination();
             }}
             className="w-4 h-4 text-orange-500 border-gray-300 rounded focus:ring-orange-500"
           />
@@ -308,7 +324,7 @@ const ContactSubmissionsList: React.FC<ContactSubmissionsListProps> = ({ onSubmi
       )}
 
       {/* Pagination Controls */}
-      {totalPages > 1 && (
+      {(page > 0 || nextCursor) && (
         <div className="mt-6 flex items-center justify-between">
           <div className="text-sm text-gray-600">
             Showing {page * limit + 1}-{Math.min((page + 1) * limit, total)} of {total}
@@ -323,8 +339,8 @@ const ContactSubmissionsList: React.FC<ContactSubmissionsListProps> = ({ onSubmi
               Previous
             </button>
             <button
-              onClick={() => setPage(page + 1)}
-              disabled={page >= totalPages - 1}
+              onClick={goToNextPage}
+              disabled={!nextCursor}
               className="px-4 py-2 border border-gray-300 rounded-lg text-sm font-medium text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
             >
               Next
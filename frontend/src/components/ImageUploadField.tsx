@@ -1,9 +1,10 @@
 import { useState, useRef } from 'react';
 import * as portfolioRepository from '../repositories/portfolioRepository.ts';
+import type { UploadedImageInfo } from '../types/index.ts';
 
 interface ImageUploadFieldProps {
   currentImageUrl?: string;
-  onImageUploaded: (imageUrl: string) => void;
+  onImageUploaded: (imageUrl: string, info?: UploadedImageInfo) => void;
   onUploadError?: (error: string) => void;
 }
 
@@ -77,7 +78,11 @@ const ImageUploadField: React.FC<ImageUploadFieldProps> = ({
     try {
       const response = await portfolioRepository.uploadProjectImage(selectedFile);
       if (response.success && response.data?.imageUrl) {
-        onImageUploaded(response.data.imageUrl);
+        onImageUploaded(response.data.imageUrl, {
+          width: response.data.imageWidth ?? null,
+          height: response.data.imageHeight ?? null,
+          placeholder: response.data.imagePlaceholder ?? null,
+        });
         setSelectedFile(null);
       } else {
         onUploadError?.(response.error || 'Upload failed');
@@ -12,6 +12,8 @@ const PdfHistoryList: React.FC<PdfHistoryListProps> = ({ onVersionChange }) => {
   const [error, setError] = useState<string | null>(null);
   const [actionLoading, setActionLoading] = useState<number | null>(null);
   const [openMenuId, setOpenMenuId] = useState<number | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const loadHistory = async () => {
     setLoading(true);
@@ -19,7 +21,8 @@ const PdfHistoryList: React.FC<PdfHistoryListProps> = ({ onVersionChange }) => {
     try {
       const response = await resumeRepository.getPdfHistory(true); // Include deleted versions
       if (response.success) {
-        setVersions(response.data || []);
+        setVersions(response.data?.versions || []);
+        setNextCursor(response.data?.nextCursor ?? null);
       } else {
         setError(response.error || 'Failed to load history');
       }
@@ -30,6 +33,24 @@ const PdfHistoryList: React.FC<PdfHistoryListProps> = ({ onVersionChange }) => {
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const response = await resumeRepository.getPdfHistory(true, 20, nextCursor);
+      if (response.success) {
+        setVersions((prev) => [...prev, ...(response.data?.versions || [])]);
+        setNextCursor(response.data?.nextCursor ?? null);
+      } else {
+        alert(response.error || 'Failed to load more versions');
+      }
+    } catch (err: any) {
+      alert(err.response?.data?.error || 'Failed to load more versions');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     loadHistory();
   }, []);
@@ -120,6 +141,7 @@ const PdfHistoryList: React.FC<PdfHistoryListProps> = ({ onVersionChange }) => {
   return (
     <div className="space-y-3">
       {versions.map((version) => {
+        const thumbnailUrl = resumeRepository.getPdfThumbnailUrl(version);
         return (
           <div
             key={version.id}
@@ -130,6 +152,18 @@ const PdfHistoryList: React.FC<PdfHistoryListProps> = ({ onVersionChange }) => {
             }`}
           >
             <div className="flex items-start justify-between">
+              {/* First-page thumbnail (generated in the background after upload) */}
+              {thumbnailUrl && (
+                <img
+                  src={thumbnailUrl}
+                  alt={`First page of ${version.fileName}`}
+                  width={version.thumbnailWidth ?? undefined}
+                  height={version.thumbnailHeight ?? undefined}
+                  loading="lazy"
+                  className="w-16 h-auto mr-4 border border-gray-200 rounded shadow-sm"
+                />
+              )}
+
               {/* Version Info */}
               <div className="flex-1">
                 <div className="flex items-center gap-2">
@@ -150,7 +184,15 @@ const PdfHistoryList: React.FC<PdfHistoryListProps> = ({ onVersionChange }) => {
                   <p>
                     <span className="font-medium">Size:</span>{' '}
                     {formatFileSize(version.fileSize)}
+                    {version.pageCount !== null && (
+                      <> · {version.pageCount} {version.pageCount === 1 ? 'page' : 'pages'}</>
+                    )}
                   </p>
+                  {version.hasTextLayer === false && (
+                    <p className="text-amber-600">
+                      No selectable text - scanned PDFs may not be readable by applicant tracking systems
+                    </p>
+                  )}
                   {version.uploadedBy && (
                     <p>
                       <span className="font-medium">By:</span>{' '}
@@ -210,6 +252,18 @@ const PdfHistoryList: React.FC<PdfHistoryListProps> = ({ onVersionChange }) => {
           </div>
         );
       })}
+
+      {nextCursor && (
+        <div className="flex justify-center pt-2">
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="px-4 py-2 border border-gray-300 rounded-lg text-sm font-medium text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
     </div>
   );
 };
@@ -1,9 +1,10 @@
 import { useState, useRef } from 'react';
 import * as aboutRepository from '../repositories/aboutRepository.ts';
+import type { UploadedImageInfo } from '../types/index.ts';
 
 interface ProfilePhotoUploadFieldProps {
   currentPhotoUrl?: string | null;
-  onPhotoUploaded: (photoUrl: string) => void;
+  onPhotoUploaded: (photoUrl: string, info?: UploadedImageInfo) => void;
   onUploadError?: (error: string) => void;
 }
 
@@ -74,7 +75,11 @@ const ProfilePhotoUploadField: React.FC<ProfilePhotoUploadFieldProps> = ({
     try {
       const response = await aboutRepository.uploadProfilePhoto(selectedFile);
       if (response.success && response.data?.profilePhotoUrl) {
-        onPhotoUploaded(response.data.profilePhotoUrl);
+        onPhotoUploaded(response.data.profilePhotoUrl, {
+          width: response.data.profilePhotoWidth ?? null,
+          height: response.data.profilePhotoHeight ?? null,
+          placeholder: response.data.profilePhotoPlaceholder ?? null,
+        });
         setSelectedFile(null);
       } else {
         onUploadError?.(response.error || 'Upload failed');
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import * as portfolioRepository from '../repositories/portfolioRepository.ts';
 import ImageUploadField from './ImageUploadField.tsx';
-import type { PortfolioItem, ProjectFormData } from '../types/index.ts';
+import type { PortfolioItem, ProjectFormData, UploadedImageInfo } from '../types/index.ts';
 
 interface ProjectFormModalProps {
   isOpen: boolean;
@@ -29,6 +29,7 @@ const ProjectFormModal: React.FC<ProjectFormModalProps> = ({
     docs_slug: '',
   });
 
+  const [imageInfo, setImageInfo] = useState<UploadedImageInfo | null>(null);
   const [errors, setErrors] = useState<Record<string, string>>({});
   const [submitting, setSubmitting] = useState(false);
   const [uploadError, setUploadError] = useState<string>('');
@@ -47,6 +48,11 @@ const ProjectFormModal: React.FC<ProjectFormModalProps> = ({
           content: project.content || '',
           docs_slug: project.docsSlug || '',
         });
+        setImageInfo(project.image_url ? {
+          width: project.image_width ?? null,
+          height: project.image_height ?? null,
+          placeholder: project.image_placeholder ?? null,
+        } : null);
       } else {
         // Reset form for add mode
         setFormData({
@@ -59,6 +65,7 @@ const ProjectFormModal: React.FC<ProjectFormModalProps> = ({
           content: '',
           docs_slug: '',
         });
+        setImageInfo(null);
       }
       setErrors({});
       setUploadError('');
@@ -146,6 +153,9 @@ const ProjectFormModal: React.FC<ProjectFormModalProps> = ({
         github_url: formData.github_url.trim() || undefined,
         live_url: formData.live_url.trim() || undefined,
         image_url: formData.image_url.trim() || undefined,
+        image_width: imageInfo?.width ?? null,
+        image_height: imageInfo?.height ?? null,
+        image_placeholder: imageInfo?.placeholder ?? null,
         content: formData.content.trim() || undefined,
         docsSlug: formData.docs_slug.trim() || undefined,
       };
@@ -185,8 +195,9 @@ const ProjectFormModal: React.FC<ProjectFormModalProps> = ({
     }
   };
 
-  const handleImageUploaded = (imageUrl: string) => {
+  const handleImageUploaded = (imageUrl: string, info?: UploadedImageInfo) => {
     setFormData(prev => ({ ...prev, image_url: imageUrl }));
+    setImageInfo(imageUrl ? info ?? null : null);
     setUploadError('');
   };
 
@@ -56,7 +56,9 @@ function CV() {
   };
 
   const handleDownload = () => {
-    const downloadUrl = resumeRepository.getPdfDownloadUrl();
+    const downloadUrl = activePdf
+      ? resumeRepository.getPdfVersionUrl(activePdf, true)
+      : resumeRepository.getPdfDownloadUrl();
     window.location.href = downloadUrl;
   };
 
@@ -219,7 +221,7 @@ function CV() {
                   </button>
                 </div>
                 <PdfViewer
-                  pdfUrl={`${resumeRepository.getPdfFileUrl()}?v=${activePdf.id}`}
+                  pdfUrl={resumeRepository.getPdfVersionUrl(activePdf)}
                   fileName={activePdf.fileName}
                 />
               </div>
@@ -239,6 +239,15 @@ function Portfolio() {
   );
 }
 
+// Width variants generated by the backend at upload time (served via ?w=)
+const CARD_IMAGE_WIDTHS = [320, 640, 1024];
+const CARD_IMAGE_SIZES = '(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw';
+
+function cardImageSrcSet(imageUrl: string): string | undefined {
+  if (!imageUrl.startsWith('/api/')) return undefined;
+  return CARD_IMAGE_WIDTHS.map((width) => `${imageUrl}?w=${width} ${width}w`).join(', ');
+}
+
 // ProjectCard Component
 interface ProjectCardProps {
   project: PortfolioItem;
@@ -356,10 +365,20 @@ const ProjectCard: React.FC<ProjectCardProps> = ({
 
       {/* Project Image — links to detail page */}
       {project.image_url && (
-        <Link to={`/portfolio/${project.id}`} className="block relative h-48 overflow-hidden bg-gray-100 dark:bg-gray-800">
+        <Link
+          to={`/portfolio/${project.id}`}
+          className="block relative h-48 overflow-hidden bg-gray-100 dark:bg-gray-800 bg-cover bg-center"
+          style={project.image_placeholder ? { backgroundImage: `url(${project.image_placeholder})` } : undefined}
+        >
           <img
             src={project.image_url}
+            srcSet={cardImageSrcSet(project.image_url)}
+            sizes={CARD_IMAGE_SIZES}
+            width={project.image_width ?? undefined}
+            height={project.image_height ?? undefined}
             alt={project.title}
+            loading="lazy"
+            decoding="async"
             className="w-full h-full object-cover group-hover:scale-105 transition-transform duration-300"
           />
         </Link>
@@ -201,9 +201,14 @@ function ProjectDetail() {
 
       <div className="bg-white dark:bg-[#252525] rounded-lg shadow-md border border-transparent dark:border-gray-700 overflow-hidden">
         {project.image_url && (
-          <div className="w-full bg-gray-100 dark:bg-gray-800">
+          <div
+            className="w-full bg-gray-100 dark:bg-gray-800 bg-cover bg-center"
+            style={project.image_placeholder ? { backgroundImage: `url(${project.image_placeholder})` } : undefined}
+          >
             <img
               src={project.image_url}
+              width={project.image_width ?? undefined}
+              height={project.image_height ?? undefined}
               alt={project.title}
               className="w-full object-cover max-h-72"
             />
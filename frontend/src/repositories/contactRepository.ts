@@ -21,18 +21,19 @@ export async function submitContact(data: ContactFormData, csrfToken: string) {
 
 /**
  * Get all contact submissions (admin - requires auth)
+ * @param cursor - nextCursor from the previous page, or null for the first page
  */
 export async function getSubmissions(
   limit: number = 50,
-  offset: number = 0,
+  cursor: string | null = null,
   read: 'all' | 'read' | 'unread' = 'all',
   includeArchived: boolean = false
 ) {
   const params = {
     limit,
-    offset,
     read,
-    includeArchived: includeArchived.toString()
+    includeArchived: includeArchived.toString(),
+    ...(cursor ? { cursor } : {})
   };
   const response = await apiClient.get('/contact/submissions', { params });
   return response.data;
@@ -61,3 +62,15 @@ export async function archiveSubmission(id: number) {
   const response = await apiClient.delete(`/contact/submissions/${id}`);
   return response.data;
 }
+
+/**
+ * Apply one inbox action to many submissions at once (admin - requires auth)
+ * @param selection - Either explicit IDs or the same filters as getSubmissions
+ */
+export async function bulkUpdateSubmissions(
+  action: 'markRead' | 'markUnread' | 'archive' | 'unarchive',
+  selection: { ids: number[] } | { filter: { read?: 'all' | 'read' | 'unread'; includeArchived?: boolean } }
+) {
+  const response = await apiClient.post('/contact/submissions/bulk', { action, ...selection });
+  return response.data;
+}
@@ -3,7 +3,7 @@
  * Handles all resume/CV-related API calls (public and admin)
  */
 import { apiClient, fileUploadClient } from './apiClient.ts';
-import type { CVData, PdfUploadResponse } from '../types/index.ts';
+import type { CVData, PdfHistoryResponse, PdfUploadResponse, ResumePdfVersion } from '../types/index.ts';
 
 /**
  * Get CV/Resume data (public)
@@ -50,6 +50,26 @@ export function getPdfDownloadUrl(): string {
   return `${baseUrl}/cv/pdf/file?download=true`;
 }
 
+/**
+ * Get the immutable file URL of a specific PDF version (public)
+ * Versioned URLs are cached forever by browsers and CDNs
+ */
+export function getPdfVersionUrl(version: ResumePdfVersion, download = false): string {
+  const baseUrl = import.meta.env.VITE_API_URL || 'http://localhost:5000/api';
+  const url = `${baseUrl}/cv/pdf/versions/${version.id}/file`;
+  return download ? `${url}?download=true` : url;
+}
+
+/**
+ * Get the first-page thumbnail URL of a PDF version, or null until the
+ * background worker has generated it (public)
+ */
+export function getPdfThumbnailUrl(version: ResumePdfVersion): string | null {
+  if (!version.thumbnailUrl) return null;
+  const baseUrl = import.meta.env.VITE_API_URL || 'http://localhost:5000/api';
+  return `${baseUrl}/cv/pdf/versions/${version.id}/thumbnail`;
+}
+
 /**
  * Upload new PDF resume (admin - requires auth)
  */
@@ -61,12 +81,20 @@ export async function uploadPdf(file: File): Promise<PdfUploadResponse> {
 }
 
 /**
- * Get PDF version history (admin - requires auth)
+ * Get one page of PDF version history, newest first (admin - requires auth)
+ * @param cursor - nextCursor from the previous page, or null for the first page
  */
-export async function getPdfHistory(includeDeleted = false) {
-  const response = await apiClient.get('/cv/pdf/history', {
-    params: { includeDeleted }
-  });
+export async function getPdfHistory(
+  includeDeleted = false,
+  limit: number = 20,
+  cursor: string | null = null
+): Promise<{ success: boolean; data?: PdfHistoryResponse; error?: string }> {
+  const params = {
+    includeDeleted,
+    limit,
+    ...(cursor ? { cursor } : {})
+  };
+  const response = await apiClient.get('/cv/pdf/history', { params });
   return response.data;
 }
 
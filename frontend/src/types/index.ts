@@ -6,6 +6,9 @@ export interface PortfolioItem {
   github_url?: string;
   live_url?: string;
   image_url?: string;
+  image_width?: number | null;
+  image_height?: number | null;
+  image_placeholder?: string | null;
   content?: string;
   docsSlug?: string;
   isVisible: boolean;
@@ -21,10 +24,20 @@ export interface ProjectFormData {
   github_url?: string;
   live_url?: string;
   image_url?: string;
+  image_width?: number | null;
+  image_height?: number | null;
+  image_placeholder?: string | null;
   content?: string;
   docsSlug?: string;
 }
 
+// Intrinsic size and blur placeholder returned by the image upload endpoint
+export interface UploadedImageInfo {
+  width: number | null;
+  height: number | null;
+  placeholder: string | null;
+}
+
 export interface ProjectOrderUpdate {
   id: number;
   displayOrder: number;
@@ -86,6 +99,7 @@ export interface ContactSubmissionsResponse {
   total: number;
   limit: number;
   offset: number;
+  nextCursor: string | null;
 }
 
 // Authentication Types
@@ -118,6 +132,7 @@ export interface ResumePdfVersion {
   id: number;
   fileName: string;
   filePath: string;
+  fileUrl: string;
   fileSize: number;
   mimeType: string;
   isActive: boolean;
@@ -128,6 +143,19 @@ export interface ResumePdfVersion {
   } | null;
   createdAt: string;
   deletedAt: string | null;
+  previewStatus: 'pending' | 'ready' | 'failed';
+  thumbnailUrl: string | null;
+  thumbnailWidth: number | null;
+  thumbnailHeight: number | null;
+  pageCount: number | null;
+  hasTextLayer: boolean | null;
+  textExcerpt: string | null;
+}
+
+export interface PdfHistoryResponse {
+  versions: ResumePdfVersion[];
+  limit: number;
+  nextCursor: string | null;
 }
 
 export interface PdfUploadResponse {
@@ -146,4 +174,9 @@ export interface AboutData {
 
 export interface AboutFormData {
   content: string;
+  // Send the upload response's metadata back with a new photo
+  profilePhotoUrl?: string;
+  profilePhotoWidth?: number | null;
+  profilePhotoHeight?: number | null;
+  profilePhotoPlaceholder?: string | null;
 }